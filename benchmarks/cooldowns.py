@@ -0,0 +1,40 @@
+"""Cost and memory of cooldown buckets over many distinct keys.
+
+Run with `python benchmarks/cooldowns.py [keys]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Sequence
+
+from aurum.commands.cooldowns import Cooldown
+
+
+def measure(cooldown: Cooldown, keys: int) -> float:
+    started: float = time.perf_counter()
+    for key in range(keys):
+        cooldown.hit(key)
+    return (time.perf_counter() - started) / keys
+
+
+def main(arguments: Sequence[str]) -> None:
+    keys: int = int(arguments[0]) if arguments else 1_000_000
+    print(f"hit, unbounded:          {measure(Cooldown(1, 60, max_keys=keys), keys) * 1e6:.2f} us per call")
+    print(f"hit, evicting live keys: {measure(Cooldown(1, 60, max_keys=keys // 10), keys) * 1e6:.2f} us per call")
+    expiring = Cooldown(1, 0.001, max_keys=keys // 10)
+    print(f"hit, dropping expired:   {measure(expiring, keys) * 1e6:.2f} us per call")
+
+    tracemalloc.start()
+    cooldown = Cooldown(1, 60, max_keys=keys)
+    before: int = tracemalloc.get_traced_memory()[0]
+    measure(cooldown, keys)
+    used: int = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"memory:                  {used / keys:.0f} bytes per key")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,53 @@
+"""Resolving a custom ID among many registered patterns: compiled trie against a linear scan.
+
+The scan is the usual prefix matching of one handler after another, stopping at the first match.
+
+Run with `python benchmarks/custom_id.py [iterations]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+
+from aurum.components import ComponentRouter
+
+CUSTOM_ID: str = "vote:123:yes"
+
+
+async def callback(context: object) -> None: ...
+
+
+def scan(prefixes: Sequence[str], custom_id: str) -> int:
+    for index, prefix in enumerate(prefixes):
+        if custom_id.startswith(prefix):
+            return index
+    raise LookupError(custom_id)
+
+
+def compare(patterns: int, iterations: int) -> None:
+    router = ComponentRouter()
+    prefixes: list[str] = []
+    for index in range(patterns - 1):
+        router.add_component(f"action{index}:{{value:int}}:{{choice}}", callback)
+        prefixes.append(f"action{index}:")
+    router.add_component("vote:{poll_id:int}:{choice}", callback)
+    prefixes.append("vote:")
+    routes: dict[str, Callable[[], object]] = {
+        "trie": lambda: router.resolve(CUSTOM_ID),
+        "linear scan": lambda: scan(prefixes, CUSTOM_ID),
+    }
+    for name, route in routes.items():
+        best: float = min(timeit.repeat(route, number=iterations, repeat=5))
+        print(f"{patterns:6} patterns, {name:11} {best / iterations * 1e6:9.2f} us per custom ID")
+
+
+def main(arguments: Sequence[str]) -> None:
+    iterations: int = int(arguments[0]) if arguments else 10_000
+    for patterns in (1, 100, 10_000):
+        compare(patterns, iterations)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,109 @@
+"""Routing of a nested sub-command: option tree walk against the compiled dispatch table.
+
+The walk is the routing the command handler did before the dispatch table: it searches the
+sub-commands of the group, binds the callback to the group and resolves every option.
+
+Run with `python benchmarks/dispatch_table.py [iterations]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+from types import SimpleNamespace
+from typing import Any
+
+from hikari.commands import OptionType
+from hikari.interactions import CommandInteractionOption
+
+from aurum.commands import SlashCommandGroup
+from aurum.commands.decorators import sub_command
+from aurum.commands.impl.dispatch_table import DispatchTable
+from aurum.commands.options import Option
+from aurum.commands.utils.resolve_interaction_option import resolve_interaction_option
+
+COMMAND_ID: int = 1
+
+
+class Settings(SlashCommandGroup):
+    def __init__(self) -> None:
+        super().__init__("settings")
+
+    @sub_command("notifications", description="Notification settings.")
+    async def notifications(self, context: object) -> None: ...
+
+    @notifications.sub_command(
+        "set",
+        description="Set the notification level.",
+        options=[
+            Option(type=OptionType.STRING, name="level", description="The level."),
+            Option(type=OptionType.INTEGER, name="volume", description="The volume."),
+        ],
+    )
+    async def set(self, context: object, level: str, volume: int) -> None: ...
+
+    @sub_command("reset", description="Reset the settings.")
+    async def reset(self, context: object) -> None: ...
+
+
+def walk(command: Settings, interaction: SimpleNamespace) -> tuple[Callable[..., Any], dict[str, Any]]:
+    callback: Callable[..., Any] | None = None
+    arguments: dict[str, Any] = {}
+    group = None
+    sub_commands = command.get_sub_commands()
+    options: list[CommandInteractionOption] = list(interaction.options)
+    while options:
+        option = options.pop()
+        if option.type == OptionType.SUB_COMMAND_GROUP:
+            group = command.sub_commands[option.name]
+            options = list(option.options or [])
+            sub_commands = group.command.sub_commands or {}
+        elif option.type == OptionType.SUB_COMMAND:
+            callback = sub_commands[option.name].method(command)
+            options = list(option.options or [])
+        else:
+            arguments[option.name] = resolve_interaction_option(interaction, option)  # type: ignore
+    assert callback is not None
+    return callback, arguments
+
+
+def lookup(table: DispatchTable, interaction: SimpleNamespace) -> tuple[Callable[..., Any], dict[str, Any]]:
+    entry, options = table.resolve(interaction)  # type: ignore
+    assert entry.callback is not None and entry.binder is not None
+    return entry.callback, entry.binder.bind(interaction, options)
+
+
+def main(arguments: Sequence[str]) -> None:
+    iterations: int = int(arguments[0]) if arguments else 200_000
+    command = Settings()
+    table = DispatchTable()
+    table.compile({COMMAND_ID: command})
+    leaf: Sequence[CommandInteractionOption] = [
+        CommandInteractionOption(name="level", type=OptionType.STRING, value="all", options=None),
+        CommandInteractionOption(name="volume", type=OptionType.INTEGER, value=3, options=None),
+    ]
+    interaction = SimpleNamespace(
+        command_id=COMMAND_ID,
+        resolved=None,
+        options=[
+            CommandInteractionOption(
+                name="notifications",
+                type=OptionType.SUB_COMMAND_GROUP,
+                value=None,
+                options=[CommandInteractionOption(name="set", type=OptionType.SUB_COMMAND, value=None, options=leaf)],
+            )
+        ],
+    )
+    assert walk(command, interaction)[1] == lookup(table, interaction)[1]
+    routes: dict[str, Callable[[], object]] = {
+        "tree walk": lambda: walk(command, interaction),
+        "dispatch table": lambda: lookup(table, interaction),
+    }
+    for name, route in routes.items():
+        best: float = min(timeit.repeat(route, number=iterations, repeat=5))
+        print(f"{name:15} {best / iterations * 1e6:.2f} us per interaction")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
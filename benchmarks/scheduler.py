@@ -0,0 +1,96 @@
+"""Latency of quiet guilds while a noisy guild floods the bot, with and without the fair scheduler.
+
+Four quiet guilds send one command every 10 ms, the noisy guild adds 40 more. Each command
+burns 0.5 ms of CPU. Also measures the overhead of the scheduler when nothing waits and
+per queued handover.
+
+Run with `python benchmarks/scheduler.py`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aurum.commands.scheduler import FairScheduler
+
+NOISY: int = 1
+QUIET: range = range(2, 6)
+TICKS: int = 100
+FLOOD: int = 40
+
+
+def spin(duration: float) -> None:
+    end: float = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+async def command(scheduler: FairScheduler | None, guild: int, latencies: list[float]) -> None:
+    started: float = time.perf_counter()
+    if scheduler is not None:
+        await scheduler.acquire(guild)
+    try:
+        await asyncio.sleep(0)
+        spin(0.0005)
+        if guild != NOISY:
+            latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0)
+    finally:
+        if scheduler is not None:
+            scheduler.release()
+
+
+async def run(scheduler: FairScheduler | None, *, flood: bool) -> tuple[float, float, int]:
+    latencies: list[float] = []
+    tasks: list[asyncio.Task[None]] = []
+    depth: int = 0
+    for _ in range(TICKS):
+        if flood:
+            tasks += [asyncio.create_task(command(scheduler, NOISY, latencies)) for _ in range(FLOOD)]
+        tasks += [asyncio.create_task(command(scheduler, guild, latencies)) for guild in QUIET]
+        if scheduler is not None:
+            depth = max(depth, scheduler.queue_depth(NOISY))
+        await asyncio.sleep(0.01)
+    await asyncio.gather(*tasks)
+    latencies.sort()
+    return latencies[len(latencies) // 2] * 1e3, latencies[int(len(latencies) * 0.99)] * 1e3, depth
+
+
+async def overhead() -> tuple[float, float]:
+    calls: int = 200_000
+    scheduler = FairScheduler(max_in_flight=calls)
+    started: float = time.perf_counter()
+    for _ in range(calls):
+        await scheduler.acquire(NOISY)
+        scheduler.release()
+    fast_path: float = (time.perf_counter() - started) / calls
+
+    calls = 20_000
+    scheduler = FairScheduler(max_in_flight=1)
+    await scheduler.acquire(0)
+    waiters = [asyncio.ensure_future(scheduler.acquire(index % 100)) for index in range(calls)]
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    for _ in range(calls):
+        scheduler.release()
+    handover: float = (time.perf_counter() - started) / calls
+    await asyncio.gather(*waiters)
+    return fast_path, handover
+
+
+async def main() -> None:
+    for name, fair in (("no scheduler", False), ("fair scheduler", True)):
+        for flood in (False, True):
+            scheduler: FairScheduler | None = FairScheduler(max_in_flight=4) if fair else None
+            p50, p99, depth = await run(scheduler, flood=flood)
+            print(
+                f"{name:14} {'flooded' if flood else 'idle':7} quiet p50 {p50:6.2f} ms, p99 {p99:6.2f} ms,"
+                f" noisy queue peak {depth}"
+            )
+    fast_path, handover = await overhead()
+    print(f"overhead: {fast_path * 1e6:.2f} us acquire and release, {handover * 1e6:.2f} us per queued handover")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
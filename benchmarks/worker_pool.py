@@ -0,0 +1,68 @@
+"""Throughput of the worker pool with a CPU-bound command.
+
+Every interaction burns about 1 ms of CPU in its worker. The pool can only add throughput
+when the host has more cores than the receiving process uses, so compare the results with
+the number of cores printed first: with fewer cores than workers, the workers compete for
+them and the IPC of every interaction lowers the throughput.
+
+Run with `python benchmarks/worker_pool.py [workers ...]`, by default 1, 2 and 4 workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import sys
+import time
+from collections.abc import Mapping, Sequence
+from unittest.mock import AsyncMock, MagicMock
+
+from aurum.commands.impl.worker_pool import WorkerPool
+
+INTERACTIONS: int = 2000
+SPAWN_TIME: float = 2.0
+
+
+class CpuBoundHandler:
+    """The part of a command handler the workers use, with a command burning CPU."""
+
+    def __init__(self) -> None:
+        self.bot = MagicMock()
+        self.bot.rest.close = AsyncMock()
+        self.bot.entity_factory.deserialize_interaction = lambda payload: payload
+
+    async def start(self, _: object) -> None: ...
+
+    async def stop(self, _: object) -> None: ...
+
+    async def dispatch_interaction(self, _: Mapping[str, str]) -> None:  # noqa: PLR6301
+        digest: bytes = b""
+        for _ in range(2000):
+            digest = hashlib.sha256(digest).digest()
+
+
+def factory() -> CpuBoundHandler:
+    return CpuBoundHandler()
+
+
+async def measure(workers: int) -> None:
+    pool = WorkerPool(factory, workers=workers)  # type: ignore
+    pool.start()
+    await asyncio.sleep(SPAWN_TIME)
+    started: float = time.perf_counter()
+    for index in range(INTERACTIONS):
+        pool.submit({"guild_id": str(10**17 + index), "channel_id": "1"})
+    await pool.stop()
+    elapsed: float = time.perf_counter() - started
+    print(f"{workers} workers: {INTERACTIONS / elapsed:.0f} interactions/s, spread {list(pool.submitted)}")
+
+
+def main(arguments: Sequence[str]) -> None:
+    print(f"{len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()} cores")
+    for workers in map(int, arguments or ("1", "2", "4")):
+        asyncio.run(measure(workers))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
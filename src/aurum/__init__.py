@@ -2,22 +2,44 @@
 
 from collections.abc import Sequence
 
+from aurum.commands.admission import AdmissionController, Priority
+from aurum.commands.auto_defer import AutoDefer
+from aurum.commands.autocomplete import AutocompleteCache
 from aurum.commands.base_command import BaseCommand
+from aurum.commands.buckets import BucketType
+from aurum.commands.circuit_breaker import BreakerState, CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency
 from aurum.commands.context_menu_command import MessageCommand, UserCommand
+from aurum.commands.cooldowns import Cooldown
 from aurum.commands.decorators.sub_command import sub_command
 from aurum.commands.exceptions import (
     BaseCommandException,
     CommandCallbackNotImplemented,
     CommandNotFound,
+    MaxConcurrencyReached,
     SubCommandNotFound,
 )
 from aurum.commands.impl.command_builder import CommandBuilder
+from aurum.commands.impl.command_drain import DrainReport
 from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.command_registry import CommandRegistry
+from aurum.commands.impl.command_sync import SyncMode, SyncReport
+from aurum.commands.impl.readiness_gate import ReadinessGate
+from aurum.commands.impl.worker_pool import WorkerPool
+from aurum.commands.offload import ExecutionMode, Offload, offload
 from aurum.commands.options import Choice, Option
+from aurum.commands.scheduler import FairScheduler
 from aurum.commands.slash_command import SlashCommand, SlashCommandGroup
 from aurum.commands.sub_command import SubCommand, SubCommandMethod
-from aurum.context import InteractionContext
-from aurum.exceptions import AurumException
+from aurum.commands.timeouts import Timeout
+from aurum.components.component_router import ComponentRouter
+from aurum.components.custom_id import CustomIdPattern
+from aurum.components.exceptions import ComponentNotFound, ModalNotFound
+from aurum.components.modal_router import ModalRouter
+from aurum.components.view import View, ViewStore
+from aurum.context import InteractionContext, ResponseState
+from aurum.exceptions import AurumException, InteractionExpired, InteractionStateError
+from aurum.followups import FollowupQueue
 
 __all__: Sequence[str] = (
     "InteractionContext",
@@ -38,4 +60,36 @@ __all__: Sequence[str] = (
     "sub_command",
     "CommandHandler",
     "CommandBuilder",
+    "CommandRegistry",
+    "SyncMode",
+    "SyncReport",
+    "BucketType",
+    "MaxConcurrency",
+    "MaxConcurrencyReached",
+    "Cooldown",
+    "AutocompleteCache",
+    "ComponentRouter",
+    "CustomIdPattern",
+    "ComponentNotFound",
+    "ModalRouter",
+    "ModalNotFound",
+    "View",
+    "ViewStore",
+    "AutoDefer",
+    "ResponseState",
+    "InteractionStateError",
+    "InteractionExpired",
+    "FollowupQueue",
+    "WorkerPool",
+    "ExecutionMode",
+    "Offload",
+    "offload",
+    "AdmissionController",
+    "Priority",
+    "FairScheduler",
+    "Timeout",
+    "DrainReport",
+    "ReadinessGate",
+    "BreakerState",
+    "CircuitBreaker",
 )
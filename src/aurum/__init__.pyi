@@ -4,24 +4,56 @@
 # DO NOT MANUALLY EDIT THIS FILE!
 # This file was automatically generated by `nox -s generate_stubs`
 
+from aurum.commands.admission import AdmissionController as AdmissionController
+from aurum.commands.admission import Priority as Priority
+from aurum.commands.auto_defer import AutoDefer as AutoDefer
+from aurum.commands.autocomplete import AutocompleteCache as AutocompleteCache
 from aurum.commands.base_command import BaseCommand as BaseCommand
+from aurum.commands.buckets import BucketType as BucketType
+from aurum.commands.circuit_breaker import BreakerState as BreakerState
+from aurum.commands.circuit_breaker import CircuitBreaker as CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency as MaxConcurrency
 from aurum.commands.context_menu_command import MessageCommand as MessageCommand
 from aurum.commands.context_menu_command import UserCommand as UserCommand
+from aurum.commands.cooldowns import Cooldown as Cooldown
 from aurum.commands.decorators.sub_command import sub_command as sub_command
 from aurum.commands.exceptions import BaseCommandException as BaseCommandException
 from aurum.commands.exceptions import CommandCallbackNotImplemented as CommandCallbackNotImplemented
 from aurum.commands.exceptions import CommandNotFound as CommandNotFound
+from aurum.commands.exceptions import MaxConcurrencyReached as MaxConcurrencyReached
 from aurum.commands.exceptions import SubCommandNotFound as SubCommandNotFound
 from aurum.commands.impl.command_builder import CommandBuilder as CommandBuilder
+from aurum.commands.impl.command_drain import DrainReport as DrainReport
 from aurum.commands.impl.command_handler import CommandHandler as CommandHandler
+from aurum.commands.impl.command_registry import CommandRegistry as CommandRegistry
+from aurum.commands.impl.command_sync import SyncMode as SyncMode
+from aurum.commands.impl.command_sync import SyncReport as SyncReport
+from aurum.commands.impl.readiness_gate import ReadinessGate as ReadinessGate
+from aurum.commands.impl.worker_pool import WorkerPool as WorkerPool
+from aurum.commands.offload import ExecutionMode as ExecutionMode
+from aurum.commands.offload import Offload as Offload
+from aurum.commands.offload import offload as offload
 from aurum.commands.options import Choice as Choice
 from aurum.commands.options import Option as Option
+from aurum.commands.scheduler import FairScheduler as FairScheduler
 from aurum.commands.slash_command import SlashCommand as SlashCommand
 from aurum.commands.slash_command import SlashCommandGroup as SlashCommandGroup
 from aurum.commands.sub_command import SubCommand as SubCommand
 from aurum.commands.sub_command import SubCommandMethod as SubCommandMethod
+from aurum.commands.timeouts import Timeout as Timeout
+from aurum.components.component_router import ComponentRouter as ComponentRouter
+from aurum.components.custom_id import CustomIdPattern as CustomIdPattern
+from aurum.components.exceptions import ComponentNotFound as ComponentNotFound
+from aurum.components.exceptions import ModalNotFound as ModalNotFound
+from aurum.components.modal_router import ModalRouter as ModalRouter
+from aurum.components.view import View as View
+from aurum.components.view import ViewStore as ViewStore
 from aurum.context import InteractionContext as InteractionContext
+from aurum.context import ResponseState as ResponseState
 from aurum.exceptions import AurumException as AurumException
+from aurum.exceptions import InteractionExpired as InteractionExpired
+from aurum.exceptions import InteractionStateError as InteractionStateError
+from aurum.followups import FollowupQueue as FollowupQueue
 
 __all__ = [
     "InteractionContext",
@@ -42,4 +74,36 @@ __all__ = [
     "sub_command",
     "CommandHandler",
     "CommandBuilder",
+    "CommandRegistry",
+    "SyncMode",
+    "SyncReport",
+    "BucketType",
+    "MaxConcurrency",
+    "MaxConcurrencyReached",
+    "Cooldown",
+    "AutocompleteCache",
+    "ComponentRouter",
+    "CustomIdPattern",
+    "ComponentNotFound",
+    "ModalRouter",
+    "ModalNotFound",
+    "View",
+    "ViewStore",
+    "AutoDefer",
+    "ResponseState",
+    "InteractionStateError",
+    "InteractionExpired",
+    "FollowupQueue",
+    "WorkerPool",
+    "ExecutionMode",
+    "Offload",
+    "offload",
+    "AdmissionController",
+    "Priority",
+    "FairScheduler",
+    "Timeout",
+    "DrainReport",
+    "ReadinessGate",
+    "BreakerState",
+    "CircuitBreaker",
 ]
@@ -2,17 +2,30 @@
 
 from collections.abc import Sequence
 
+from aurum.commands.admission import AdmissionController, Priority
+from aurum.commands.auto_defer import AutoDefer, AutoDeferWatchdog
+from aurum.commands.autocomplete import AutocompleteCache
 from aurum.commands.base_command import BaseCommand
+from aurum.commands.buckets import BucketType
+from aurum.commands.circuit_breaker import BreakerState, CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency
 from aurum.commands.context_menu_command import ContextMenuCommand
+from aurum.commands.cooldowns import Cooldown
 from aurum.commands.exceptions import (
     BaseCommandException,
     CommandCallbackNotImplemented,
     CommandNotFound,
+    MaxConcurrencyReached,
     SubCommandNotFound,
 )
+from aurum.commands.impl.worker_pool import WorkerPool
+from aurum.commands.offload import ExecutionMode, Offload, OffloadStats, offload
 from aurum.commands.options import Choice, Option
+from aurum.commands.scheduler import FairScheduler
 from aurum.commands.slash_command import SlashCommand, SlashCommandGroup
+from aurum.commands.streaming import ResponseStream
 from aurum.commands.sub_command import SubCommand
+from aurum.commands.timeouts import Timeout
 from aurum.commands.types import Localized
 
 __all__: Sequence[str] = (
@@ -28,4 +41,23 @@ __all__: Sequence[str] = (
     "SlashCommandGroup",
     "SubCommand",
     "Localized",
+    "BucketType",
+    "MaxConcurrency",
+    "MaxConcurrencyReached",
+    "Cooldown",
+    "AutocompleteCache",
+    "AutoDefer",
+    "AutoDeferWatchdog",
+    "ResponseStream",
+    "WorkerPool",
+    "ExecutionMode",
+    "Offload",
+    "OffloadStats",
+    "offload",
+    "AdmissionController",
+    "Priority",
+    "FairScheduler",
+    "Timeout",
+    "BreakerState",
+    "CircuitBreaker",
 )
@@ -4,17 +4,36 @@
 # DO NOT MANUALLY EDIT THIS FILE!
 # This file was automatically generated by `nox -s generate_stubs`
 
+from aurum.commands.admission import AdmissionController as AdmissionController
+from aurum.commands.admission import Priority as Priority
+from aurum.commands.auto_defer import AutoDefer as AutoDefer
+from aurum.commands.auto_defer import AutoDeferWatchdog as AutoDeferWatchdog
+from aurum.commands.autocomplete import AutocompleteCache as AutocompleteCache
 from aurum.commands.base_command import BaseCommand as BaseCommand
+from aurum.commands.buckets import BucketType as BucketType
+from aurum.commands.circuit_breaker import BreakerState as BreakerState
+from aurum.commands.circuit_breaker import CircuitBreaker as CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency as MaxConcurrency
 from aurum.commands.context_menu_command import ContextMenuCommand as ContextMenuCommand
+from aurum.commands.cooldowns import Cooldown as Cooldown
 from aurum.commands.exceptions import BaseCommandException as BaseCommandException
 from aurum.commands.exceptions import CommandCallbackNotImplemented as CommandCallbackNotImplemented
 from aurum.commands.exceptions import CommandNotFound as CommandNotFound
+from aurum.commands.exceptions import MaxConcurrencyReached as MaxConcurrencyReached
 from aurum.commands.exceptions import SubCommandNotFound as SubCommandNotFound
+from aurum.commands.impl.worker_pool import WorkerPool as WorkerPool
+from aurum.commands.offload import ExecutionMode as ExecutionMode
+from aurum.commands.offload import Offload as Offload
+from aurum.commands.offload import OffloadStats as OffloadStats
+from aurum.commands.offload import offload as offload
 from aurum.commands.options import Choice as Choice
 from aurum.commands.options import Option as Option
+from aurum.commands.scheduler import FairScheduler as FairScheduler
 from aurum.commands.slash_command import SlashCommand as SlashCommand
 from aurum.commands.slash_command import SlashCommandGroup as SlashCommandGroup
+from aurum.commands.streaming import ResponseStream as ResponseStream
 from aurum.commands.sub_command import SubCommand as SubCommand
+from aurum.commands.timeouts import Timeout as Timeout
 from aurum.commands.types import Localized as Localized
 
 __all__ = [
@@ -30,4 +49,23 @@ __all__ = [
     "SlashCommandGroup",
     "SubCommand",
     "Localized",
+    "BucketType",
+    "MaxConcurrency",
+    "MaxConcurrencyReached",
+    "Cooldown",
+    "AutocompleteCache",
+    "AutoDefer",
+    "AutoDeferWatchdog",
+    "ResponseStream",
+    "WorkerPool",
+    "ExecutionMode",
+    "Offload",
+    "OffloadStats",
+    "offload",
+    "AdmissionController",
+    "Priority",
+    "FairScheduler",
+    "Timeout",
+    "BreakerState",
+    "CircuitBreaker",
 ]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from enum import IntEnum
+
+__all__: Sequence[str] = ("AdmissionController", "Priority")
+
+
+class Priority(IntEnum):
+    """Priority of a command under load shedding."""
+
+    LOW = 0
+    """Shed first."""
+    NORMAL = 1
+    """Priority of commands that do not set one."""
+    HIGH = 2
+    """Shed last."""
+
+
+class AdmissionController:
+    """A load shedder answering low priority commands with a busy response when the bot is overloaded.
+
+    The bot is overloaded when any of the set thresholds is exceeded: the number of in-flight
+    commands, the event loop lag measured by a periodic probe, or the moving average of
+    the command dispatch times. Overloaded, commands of priority `shed` or lower are
+    answered with `response` without running their callbacks, so the others keep their latency.
+
+    Parameters
+    ----------
+    max_in_flight : int | None, optional
+        Maximum number of in-flight commands, by default not limited.
+    max_loop_lag : float | None, default 0.25
+        Maximum event loop lag in seconds.
+    max_latency : float | None, optional
+        Maximum moving average of the dispatch times in seconds, by default not limited.
+    shed : Priority, default Priority.LOW
+        Highest priority of the shed commands.
+    response : str, default "The bot is busy, try again shortly."
+        Ephemeral response to the shed commands.
+    probe_interval : float, default 0.1
+        Interval of the event loop lag probe in seconds.
+    smoothing : float, default 0.2
+        Weight of the last sample in the moving averages.
+    """
+
+    __slots__: Sequence[str] = (
+        "max_in_flight",
+        "max_loop_lag",
+        "max_latency",
+        "shed",
+        "response",
+        "probe_interval",
+        "smoothing",
+        "_in_flight",
+        "_loop_lag",
+        "_latency",
+        "_probe",
+        "_shed_counts",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        max_in_flight: int | None = None,
+        max_loop_lag: float | None = 0.25,
+        max_latency: float | None = None,
+        shed: Priority = Priority.LOW,
+        response: str = "The bot is busy, try again shortly.",
+        probe_interval: float = 0.1,
+        smoothing: float = 0.2,
+    ) -> None:
+        self.max_in_flight: int | None = max_in_flight
+        self.max_loop_lag: float | None = max_loop_lag
+        self.max_latency: float | None = max_latency
+        self.shed: Priority = shed
+        self.response: str = response
+        self.probe_interval: float = probe_interval
+        self.smoothing: float = smoothing
+        self._in_flight: int = 0
+        self._loop_lag: float = 0.0
+        self._latency: float = 0.0
+        self._probe: asyncio.TimerHandle | None = None
+        self._shed_counts: Counter[str] = Counter()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of in-flight commands."""
+        return self._in_flight
+
+    @property
+    def loop_lag(self) -> float:
+        """Moving average of the event loop lag in seconds."""
+        return self._loop_lag
+
+    @property
+    def latency(self) -> float:
+        """Moving average of the command dispatch times in seconds."""
+        return self._latency
+
+    @property
+    def shed_counts(self) -> Mapping[str, int]:
+        """Number of shed invocations by command names."""
+        return self._shed_counts
+
+    @property
+    def is_overloaded(self) -> bool:
+        """Whether any of the thresholds is exceeded."""
+        return (
+            (self.max_in_flight is not None and self._in_flight >= self.max_in_flight)
+            or (self.max_loop_lag is not None and self._loop_lag > self.max_loop_lag)
+            or (self.max_latency is not None and self._latency > self.max_latency)
+        )
+
+    def admit(self, name: str, priority: Priority) -> bool:
+        """Decide whether to run a command, counting the shed ones.
+
+        Parameters
+        ----------
+        name : str
+            Name of the command.
+        priority : Priority
+            Priority of the command.
+
+        Returns
+        -------
+        bool
+            Whether the command is admitted.
+        """
+        if self._probe is None and self.max_loop_lag is not None:
+            self._schedule_probe(asyncio.get_running_loop())
+        if priority > self.shed or not self.is_overloaded:
+            return True
+        self._shed_counts[name] += 1
+        return False
+
+    def enter(self) -> float:
+        """Record the start of an admitted command.
+
+        Returns
+        -------
+        float
+            The start time, passed to `leave`.
+        """
+        self._in_flight += 1
+        return time.monotonic()
+
+    def leave(self, started: float) -> None:
+        """Record the end of an admitted command.
+
+        Parameters
+        ----------
+        started : float
+            The start time returned by `enter`.
+        """
+        self._in_flight -= 1
+        self._latency += self.smoothing * (time.monotonic() - started - self._latency)
+
+    def stop(self) -> None:
+        """Stop the event loop lag probe."""
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+
+    def _schedule_probe(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._probe = loop.call_at(loop.time() + self.probe_interval, self._on_probe, loop)
+
+    def _on_probe(self, loop: asyncio.AbstractEventLoop) -> None:
+        assert self._probe is not None
+        lag: float = max(loop.time() - self._probe.when(), 0.0)
+        self._loop_lag += self.smoothing * (lag - self._loop_lag)
+        self._schedule_probe(loop)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Hashable, Mapping, Sequence
+from logging import Logger, getLogger
+from typing import TYPE_CHECKING
+
+from aurum.context import TOKEN_LIFETIME
+from aurum.utils.timer_heap import TimerHeap
+
+if TYPE_CHECKING:
+    from aurum.context import InteractionContext
+
+__all__: Sequence[str] = ("AutoDefer", "AutoDeferWatchdog")
+
+
+class AutoDefer:  # noqa: B903 - a policy like the others, not plain data
+    """A policy deferring the interaction if the command has not acknowledged it in time.
+
+    Discord fails an interaction that is not acknowledged within 3 seconds. When the
+    policy fires, the interaction is deferred and later responses edit the deferred one.
+
+    Parameters
+    ----------
+    after : float, default 2.2
+        Seconds after the interaction is received to defer it.
+    ephemeral : bool, default False
+        Whether to defer the interaction with an ephemeral response.
+
+    Notes
+    -----
+        The visibility of a deferred response cannot be changed, so a command
+        responding ephemerally should set `ephemeral` to match.
+    """
+
+    __slots__: Sequence[str] = ("after", "ephemeral")
+
+    def __init__(self, after: float = 2.2, *, ephemeral: bool = False) -> None:
+        self.after: float = after
+        self.ephemeral: bool = ephemeral
+
+
+class AutoDeferWatchdog:
+    """A watchdog deferring interactions that miss their acknowledgement deadlines.
+
+    Deadlines of all watched interactions are kept in a single `TimerHeap`.
+    """
+
+    __slots__: Sequence[str] = ("__logger", "_timers", "_watched", "_fired")
+
+    def __init__(self) -> None:
+        self.__logger: Logger = getLogger("aurum.commands")
+        self._timers: TimerHeap = TimerHeap(self._on_deadline)
+        self._watched: dict[Hashable, tuple[InteractionContext, str, AutoDefer]] = {}
+        self._fired: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._watched)
+
+    def __contains__(self, context: InteractionContext) -> bool:
+        return context.interaction.id in self._watched
+
+    @property
+    def fired(self) -> Mapping[str, int]:
+        """Number of auto-defers by command names."""
+        return self._fired
+
+    def watch(self, context: InteractionContext, name: str, policy: AutoDefer) -> None:
+        """Start watching an interaction.
+
+        Parameters
+        ----------
+        context : InteractionContext
+            The context of the interaction.
+        name : str
+            Name of the command, used for the counters.
+        policy : AutoDefer
+            The auto-defer policy.
+        """
+        self._watched[context.interaction.id] = (context, name, policy)
+        # the deadline counts from the receipt of the interaction, not from the start of watching
+        self._timers.schedule(context.interaction.id, policy.after - TOKEN_LIFETIME + context.expires_in)
+
+    def unwatch(self, context: InteractionContext) -> None:
+        """Stop watching an interaction.
+
+        Parameters
+        ----------
+        context : InteractionContext
+            The context of the interaction.
+        """
+        if self._watched.pop(context.interaction.id, None) is not None:
+            self._timers.cancel(context.interaction.id)
+
+    def clear(self) -> None:
+        """Stop watching every interaction."""
+        self._watched.clear()
+        self._timers.clear()
+
+    def _on_deadline(self, key: Hashable) -> None:
+        watched: tuple[InteractionContext, str, AutoDefer] | None = self._watched.pop(key, None)
+        if watched is None:
+            return
+        context, name, policy = watched
+        if context.is_acknowledged:
+            return
+        self._fired[name] += 1
+        self.__logger.debug("auto-deferring %s after %.2f seconds", name, policy.after)
+        context.defer_in_background(ephemeral=policy.ephemeral).add_done_callback(self._log_failure)
+
+    def _log_failure(self, task: asyncio.Future[None]) -> None:
+        if not task.cancelled() and (error := task.exception()) is not None:
+            self.__logger.error("failed to auto-defer an interaction", exc_info=error)
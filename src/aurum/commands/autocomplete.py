@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import itertools
+import time
+from collections.abc import Hashable, Sequence
+
+from hikari.api import special_endpoints as api
+
+__all__: Sequence[str] = ("AutocompleteCache",)
+
+
+class AutocompleteCache:
+    """A cache of autocomplete results.
+
+    Results are keyed by the route, the focused option and its current value, so they are
+    shared between users. Entries expire after `ttl` seconds and, when there are more than
+    `max_entries` of them, the least recently used ones are evicted.
+
+    Parameters
+    ----------
+    ttl : float, default 30.0
+        Time in seconds a result stays cached.
+    max_entries : int, default 10_000
+        Maximum number of cached results.
+    """
+
+    __slots__: Sequence[str] = ("ttl", "max_entries", "_entries", "_hits", "_misses", "_evictions")
+
+    def __init__(self, *, ttl: float = 30.0, max_entries: int = 10_000) -> None:
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self._entries: dict[Hashable, tuple[float, Sequence[api.AutocompleteChoiceBuilder]]] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that were not cached or expired."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of results evicted to keep the cache in its bounds."""
+        return self._evictions
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of hits to all lookups."""
+        lookups: int = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable) -> Sequence[api.AutocompleteChoiceBuilder] | None:
+        """Get a cached result.
+
+        Parameters
+        ----------
+        key : Hashable
+            The result key.
+
+        Returns
+        -------
+        Sequence[api.AutocompleteChoiceBuilder] | None
+            The cached choices, None if they are not cached or expired.
+        """
+        entry: tuple[float, Sequence[api.AutocompleteChoiceBuilder]] | None = self._entries.pop(key, None)
+        if entry is None or entry[0] < time.monotonic():
+            self._misses += 1
+            return None
+        self._entries[key] = entry
+        self._hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, choices: Sequence[api.AutocompleteChoiceBuilder]) -> None:
+        """Cache a result.
+
+        Parameters
+        ----------
+        key : Hashable
+            The result key.
+        choices : Sequence[api.AutocompleteChoiceBuilder]
+            The choices to cache.
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, choices)
+        if len(self._entries) > self.max_entries:
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        self._entries.clear()
+
+    def _evict(self) -> None:
+        # entries are re-inserted on every hit, so the dict is ordered by the last use
+        overflow: int = len(self._entries) - self.max_entries + self.max_entries // 10
+        for key in list(itertools.islice(self._entries, overflow)):
+            del self._entries[key]
+        self._evictions += overflow
@@ -5,6 +5,13 @@ from hikari.guilds import PartialGuild
 from hikari.permissions import Permissions
 from hikari.snowflakes import SnowflakeishOr
 
+from aurum.commands.admission import Priority
+from aurum.commands.auto_defer import AutoDefer
+from aurum.commands.circuit_breaker import CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency
+from aurum.commands.cooldowns import Cooldown
+from aurum.commands.offload import Offload
+from aurum.commands.timeouts import Timeout
 from aurum.commands.types import Localized
 
 __all__: Sequence[str] = ("BaseCommand",)
@@ -29,6 +36,20 @@ class BaseCommand:
         Whether command is NSFW.
     guild_id : SnowflakeishOr[PartialGuild] | None, optional
         Guild ID if command is guild-specific.
+    max_concurrency : MaxConcurrency | None, optional
+        Limit of in-flight invocations of the command.
+    cooldown : Cooldown | None, optional
+        Token bucket cooldown of the command.
+    auto_defer : AutoDefer | None, optional
+        Auto-defer policy of the command, overrides the policy of the handler.
+    offload : Offload | None, optional
+        Offload policy of the functions decorated with `offload` called by the command.
+    priority : Priority | None, optional
+        Priority of the command under load shedding, `Priority.NORMAL` if not set.
+    timeout : Timeout | None, optional
+        Time limit of the callback, by default the time limit of the handler.
+    circuit_breaker : CircuitBreaker | None, optional
+        Circuit breaker short-circuiting the command while it is failing.
 
     Attributes
     ----------
@@ -43,6 +64,13 @@ class BaseCommand:
         "_is_dm_enabled",
         "_is_nsfw",
         "_guild_id",
+        "_max_concurrency",
+        "_cooldown",
+        "_auto_defer",
+        "_offload",
+        "_priority",
+        "_timeout",
+        "_circuit_breaker",
     )
     _command_type: CommandType
 
@@ -55,6 +83,13 @@ class BaseCommand:
         is_dm_enabled: bool = False,
         is_nsfw: bool = False,
         guild_id: SnowflakeishOr[PartialGuild] | None = None,
+        max_concurrency: MaxConcurrency | None = None,
+        cooldown: Cooldown | None = None,
+        auto_defer: AutoDefer | None = None,
+        offload: Offload | None = None,
+        priority: Priority | None = None,
+        timeout: Timeout | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         self._name: str = name
         self._name_localizations: Localized | None = name_localizations
@@ -62,6 +97,13 @@ class BaseCommand:
         self._is_dm_enabled: bool = is_dm_enabled
         self._is_nsfw: bool = is_nsfw
         self._guild_id: SnowflakeishOr[PartialGuild] | None = guild_id
+        self._max_concurrency: MaxConcurrency | None = max_concurrency
+        self._cooldown: Cooldown | None = cooldown
+        self._auto_defer: AutoDefer | None = auto_defer
+        self._offload: Offload | None = offload
+        self._priority: Priority | None = priority
+        self._timeout: Timeout | None = timeout
+        self._circuit_breaker: CircuitBreaker | None = circuit_breaker
 
     @property
     def type(self) -> CommandType:
@@ -91,6 +133,34 @@ class BaseCommand:
     def guild_id(self) -> SnowflakeishOr[PartialGuild] | None:
         return self._guild_id
 
+    @property
+    def max_concurrency(self) -> MaxConcurrency | None:
+        return self._max_concurrency
+
+    @property
+    def cooldown(self) -> Cooldown | None:
+        return self._cooldown
+
+    @property
+    def auto_defer(self) -> AutoDefer | None:
+        return self._auto_defer
+
+    @property
+    def offload(self) -> Offload | None:
+        return self._offload
+
+    @property
+    def priority(self) -> Priority | None:
+        return self._priority
+
+    @property
+    def timeout(self) -> Timeout | None:
+        return self._timeout
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        return self._circuit_breaker
+
     @name_localizations.setter
     def name_localizations(self, value: Localized | None) -> None:
         self._name_localizations = value
@@ -110,3 +180,31 @@ class BaseCommand:
     @guild_id.setter
     def guild_id(self, value: SnowflakeishOr[PartialGuild] | None) -> None:
         self._guild_id = value
+
+    @max_concurrency.setter
+    def max_concurrency(self, value: MaxConcurrency | None) -> None:
+        self._max_concurrency = value
+
+    @cooldown.setter
+    def cooldown(self, value: Cooldown | None) -> None:
+        self._cooldown = value
+
+    @auto_defer.setter
+    def auto_defer(self, value: AutoDefer | None) -> None:
+        self._auto_defer = value
+
+    @offload.setter
+    def offload(self, value: Offload | None) -> None:
+        self._offload = value
+
+    @priority.setter
+    def priority(self, value: Priority | None) -> None:
+        self._priority = value
+
+    @timeout.setter
+    def timeout(self, value: Timeout | None) -> None:
+        self._timeout = value
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, value: CircuitBreaker | None) -> None:
+        self._circuit_breaker = value
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hikari.interactions import PartialInteraction
+
+__all__: Sequence[str] = ("BucketType",)
+
+
+class BucketType(Enum):
+    """Scope by which command limits are keyed."""
+
+    GLOBAL = "global"
+    """One bucket shared by every invocation."""
+    USER = "user"
+    """One bucket per user."""
+    CHANNEL = "channel"
+    """One bucket per channel."""
+    GUILD = "guild"
+    """One bucket per guild, or per channel in DMs."""
+
+    def get_key(self, interaction: PartialInteraction) -> int:
+        """Get the bucket key of an interaction.
+
+        Parameters
+        ----------
+        interaction : PartialInteraction
+            The interaction to get the key of.
+
+        Returns
+        -------
+        int
+            The bucket key.
+        """
+        if self is BucketType.USER:
+            return interaction.user.id  # type: ignore
+        if self is BucketType.CHANNEL:
+            return interaction.channel_id  # type: ignore
+        if self is BucketType.GUILD:
+            return interaction.guild_id or interaction.channel_id  # type: ignore
+        return 0
+
+    def get_payload_key(self, payload: Mapping[str, Any]) -> int:
+        """Get the bucket key of a raw interaction payload.
+
+        Parameters
+        ----------
+        payload : Mapping[str, Any]
+            The raw payload of an interaction.
+
+        Returns
+        -------
+        int
+            The bucket key, the same as `get_key` of the deserialized interaction.
+        """
+        if self is BucketType.USER:
+            return int((payload.get("member") or payload)["user"]["id"])
+        if self is BucketType.CHANNEL:
+            return int(payload["channel_id"])
+        if self is BucketType.GUILD:
+            return int(payload.get("guild_id") or payload["channel_id"])
+        return 0
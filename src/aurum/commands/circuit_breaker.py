@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import time
+from collections import Counter, deque
+from collections.abc import Mapping, Sequence
+from enum import Enum
+from logging import Logger, getLogger
+
+__all__: Sequence[str] = ("BreakerState", "CircuitBreaker")
+
+_BUCKETS: int = 10
+
+
+class BreakerState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Invocations run, their outcomes are tracked."""
+    OPEN = "open"
+    """Invocations are answered with the fallback response without running."""
+    HALF_OPEN = "half_open"
+    """A limited number of probe invocations run to detect the recovery."""
+
+
+class _Bucket:
+    __slots__: Sequence[str] = ("start", "calls", "failures")
+
+    def __init__(self, start: float) -> None:
+        self.start: float = start
+        self.calls: int = 0
+        self.failures: int = 0
+
+
+class CircuitBreaker:
+    """A policy short-circuiting a command while the service behind it is failing.
+
+    Outcomes of the invocations are tracked in a rolling window. A failed invocation is one
+    raising an exception of `failures`, exceeding its timeout or running longer than `slow_call`.
+    Once the window holds at least `min_calls` invocations and the failure rate reaches
+    `failure_rate`, the breaker opens: invocations are answered with `response` at once,
+    without entering the callback. After `reset_after` seconds the breaker lets `probes`
+    invocations through. It closes if they all succeed and opens again if any of them fails.
+
+    Parameters
+    ----------
+    failure_rate : float, default 0.5
+        Failure rate in the window opening the breaker.
+    min_calls : int, default 10
+        Minimum number of invocations in the window to open the breaker.
+    window : float, default 30.0
+        Length of the rolling window in seconds.
+    slow_call : float | None, optional
+        Time in seconds after which a completed invocation counts as failed, by default not set.
+    reset_after : float, default 30.0
+        Time in seconds the breaker stays open before probing.
+    probes : int, default 1
+        Number of probe invocations while half-open.
+    failures : tuple[type[Exception], ...], default (Exception,)
+        Exceptions counted as failures, others count as successes.
+    response : str, default "This command is temporarily unavailable, try again later."
+        Ephemeral response to the short-circuited invocations.
+
+    Notes
+    -----
+        Sharing one instance between commands backed by the same service makes them share
+        the breaker. The counters are then keyed by command names.
+    """
+
+    __slots__: Sequence[str] = (
+        "__logger",
+        "failure_rate",
+        "min_calls",
+        "window",
+        "slow_call",
+        "reset_after",
+        "probes",
+        "failures",
+        "response",
+        "_state",
+        "_opened_at",
+        "_buckets",
+        "_calls",
+        "_failures",
+        "_probing",
+        "_probed",
+        "_short_circuited",
+        "_transitions",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: float = 30.0,
+        slow_call: float | None = None,
+        reset_after: float = 30.0,
+        probes: int = 1,
+        failures: tuple[type[Exception], ...] = (Exception,),
+        response: str = "This command is temporarily unavailable, try again later.",
+    ) -> None:
+        self.__logger: Logger = getLogger("aurum.commands")
+        self.failure_rate: float = failure_rate
+        self.min_calls: int = min_calls
+        self.window: float = window
+        self.slow_call: float | None = slow_call
+        self.reset_after: float = reset_after
+        self.probes: int = probes
+        self.failures: tuple[type[Exception], ...] = failures
+        self.response: str = response
+        self._state: BreakerState = BreakerState.CLOSED
+        self._opened_at: float = 0.0
+        self._buckets: deque[_Bucket] = deque()
+        self._calls: int = 0
+        self._failures: int = 0
+        self._probing: int = 0
+        self._probed: int = 0
+        self._short_circuited: Counter[str] = Counter()
+        self._transitions: Counter[BreakerState] = Counter()
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state of the breaker."""
+        if self._state is BreakerState.OPEN and time.monotonic() - self._opened_at >= self.reset_after:
+            return BreakerState.HALF_OPEN
+        return self._state
+
+    @property
+    def calls(self) -> int:
+        """Number of invocations in the window."""
+        self._expire(time.monotonic())
+        return self._calls
+
+    @property
+    def current_failure_rate(self) -> float:
+        """Failure rate of the invocations in the window."""
+        self._expire(time.monotonic())
+        return self._failures / self._calls if self._calls else 0.0
+
+    @property
+    def short_circuited(self) -> Mapping[str, int]:
+        """Number of short-circuited invocations by command names."""
+        return self._short_circuited
+
+    @property
+    def transitions(self) -> Mapping[BreakerState, int]:
+        """Number of transitions into each state."""
+        return self._transitions
+
+    def allow(self, name: str) -> bool:
+        """Decide whether to run an invocation, counting the short-circuited ones.
+
+        An allowed invocation must be followed by `record`, or by `discard` if it is cancelled.
+
+        Parameters
+        ----------
+        name : str
+            Name of the command.
+
+        Returns
+        -------
+        bool
+            Whether the invocation runs.
+        """
+        if self._state is BreakerState.CLOSED:
+            return True
+        if self._state is BreakerState.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_after:
+                self._short_circuited[name] += 1
+                return False
+            self._transition(BreakerState.HALF_OPEN, name)
+        if self._probing + self._probed < self.probes:
+            self._probing += 1
+            return True
+        self._short_circuited[name] += 1
+        return False
+
+    def record(self, name: str, error: BaseException | None, elapsed: float, *, timed_out: bool = False) -> None:
+        """Record the outcome of an allowed invocation.
+
+        Parameters
+        ----------
+        name : str
+            Name of the command.
+        error : BaseException | None
+            The exception raised by the invocation, None if it completed.
+        elapsed : float
+            Time in seconds the invocation ran.
+        timed_out : bool, default False
+            Whether the invocation was cancelled by its timeout.
+        """
+        failed: bool = (
+            timed_out or isinstance(error, self.failures) or (self.slow_call is not None and elapsed > self.slow_call)
+        )
+        if self._state is BreakerState.HALF_OPEN:
+            if self._probing == 0:
+                return  # allowed before the breaker opened
+            self._probing -= 1
+            if failed:
+                self._open(name)
+            else:
+                self._probed += 1
+                if self._probed >= self.probes:
+                    self._transition(BreakerState.CLOSED, name)
+            return
+        if self._state is BreakerState.OPEN:
+            return
+        now: float = time.monotonic()
+        self._expire(now)
+        start: float = now - now % (self.window / _BUCKETS)
+        if not self._buckets or self._buckets[-1].start != start:
+            self._buckets.append(_Bucket(start))
+        bucket: _Bucket = self._buckets[-1]
+        bucket.calls += 1
+        self._calls += 1
+        if failed:
+            bucket.failures += 1
+            self._failures += 1
+            if self._calls >= self.min_calls and self._failures >= self.failure_rate * self._calls:
+                self._open(name)
+
+    def discard(self) -> None:
+        """Forget an allowed invocation that was cancelled before its outcome was known."""
+        if self._state is BreakerState.HALF_OPEN and self._probing:
+            self._probing -= 1
+
+    def _open(self, name: str) -> None:
+        self._opened_at = time.monotonic()
+        self._transition(BreakerState.OPEN, name)
+
+    def _transition(self, state: BreakerState, name: str) -> None:
+        self.__logger.warning("circuit breaker of %s is %s", name, state.value.replace("_", "-"))
+        self._state = state
+        self._transitions[state] += 1
+        self._probing = 0
+        self._probed = 0
+        if state is not BreakerState.HALF_OPEN:
+            self._buckets.clear()
+            self._calls = 0
+            self._failures = 0
+
+    def _expire(self, now: float) -> None:
+        while self._buckets and self._buckets[0].start <= now - self.window:
+            bucket: _Bucket = self._buckets.popleft()
+            self._calls -= bucket.calls
+            self._failures -= bucket.failures
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Hashable, Sequence
+
+from aurum.commands.buckets import BucketType
+
+__all__: Sequence[str] = ("MaxConcurrency",)
+
+
+class _Slot:
+    __slots__: Sequence[str] = ("active", "waiters")
+
+    def __init__(self) -> None:
+        self.active: int = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+
+
+class MaxConcurrency:
+    """A limit of in-flight invocations of a command.
+
+    Invocations over the limit wait in a bounded queue. The state is kept only for
+    buckets with in-flight or queued invocations, so memory does not grow with the
+    number of distinct users, channels or guilds.
+
+    Parameters
+    ----------
+    limit : int
+        Maximum number of in-flight invocations per bucket.
+    bucket : BucketType, default BucketType.GLOBAL
+        Scope by which the limit is keyed.
+    max_queue : int, default 0
+        Maximum number of invocations waiting per bucket. Invocations over it are rejected.
+    max_wait : float | None, optional
+        Maximum time in seconds an invocation waits in the queue before it is rejected.
+    response : str | None, default "This command is busy, try again later."
+        Ephemeral response to the rejected invocations. If None, `MaxConcurrencyReached` is raised instead.
+
+    Notes
+    -----
+        Sharing one instance between commands makes them share the limit.
+    """
+
+    __slots__: Sequence[str] = (
+        "limit",
+        "bucket",
+        "max_queue",
+        "max_wait",
+        "response",
+        "_slots",
+        "_in_flight",
+        "_queued",
+        "_rejected",
+        "_waited",
+        "_total_wait_time",
+    )
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        bucket: BucketType = BucketType.GLOBAL,
+        max_queue: int = 0,
+        max_wait: float | None = None,
+        response: str | None = "This command is busy, try again later.",
+    ) -> None:
+        self.limit: int = limit
+        self.bucket: BucketType = bucket
+        self.max_queue: int = max_queue
+        self.max_wait: float | None = max_wait
+        self.response: str | None = response
+        self._slots: dict[Hashable, _Slot] = {}
+        self._in_flight: int = 0
+        self._queued: int = 0
+        self._rejected: int = 0
+        self._waited: int = 0
+        self._total_wait_time: float = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of in-flight invocations across all buckets."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of queued invocations across all buckets."""
+        return self._queued
+
+    @property
+    def rejected(self) -> int:
+        """Number of rejected invocations."""
+        return self._rejected
+
+    @property
+    def buckets(self) -> int:
+        """Number of buckets with in-flight or queued invocations."""
+        return len(self._slots)
+
+    @property
+    def average_wait_time(self) -> float:
+        """Average time in seconds that queued invocations waited for a slot."""
+        return self._total_wait_time / self._waited if self._waited else 0.0
+
+    def queue_depth(self, key: Hashable) -> int:
+        """Get the number of invocations queued in a bucket.
+
+        Parameters
+        ----------
+        key : Hashable
+            The bucket key.
+
+        Returns
+        -------
+        int
+            The number of queued invocations.
+        """
+        slot: _Slot | None = self._slots.get(key)
+        return len(slot.waiters) if slot else 0
+
+    async def acquire(self, key: Hashable) -> bool:
+        """Acquire a slot in a bucket, waiting in the queue if needed.
+
+        Parameters
+        ----------
+        key : Hashable
+            The bucket key.
+
+        Returns
+        -------
+        bool
+            True if the slot was acquired, False if the invocation was rejected.
+        """
+        slot: _Slot | None = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _Slot()
+        if slot.active < self.limit and not slot.waiters:
+            slot.active += 1
+            self._in_flight += 1
+            return True
+        if len(slot.waiters) >= self.max_queue:
+            self._rejected += 1
+            return False
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        slot.waiters.append(future)
+        self._queued += 1
+        started: float = time.monotonic()
+        try:
+            await asyncio.wait_for(future, self.max_wait)
+        # not the builtin on Python 3.10, which the package supports
+        except asyncio.TimeoutError:  # noqa: UP041
+            self._rejected += 1
+            return False
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(key)  # the slot was handed over right before the cancellation
+            raise
+        finally:
+            self._queued -= 1
+            if not future.done() or future.cancelled():
+                with contextlib.suppress(ValueError):
+                    slot.waiters.remove(future)
+                self._discard_idle(key, slot)
+        self._waited += 1
+        self._total_wait_time += time.monotonic() - started
+        return True
+
+    def release(self, key: Hashable) -> None:
+        """Release a slot in a bucket, handing it over to the next queued invocation.
+
+        Parameters
+        ----------
+        key : Hashable
+            The bucket key.
+        """
+        slot: _Slot | None = self._slots.get(key)
+        if slot is None:
+            return
+        while slot.waiters:
+            waiter: asyncio.Future[None] = slot.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        slot.active -= 1
+        self._in_flight -= 1
+        self._discard_idle(key, slot)
+
+    def _discard_idle(self, key: Hashable, slot: _Slot) -> None:
+        if slot.active <= 0 and not slot.waiters:
+            self._slots.pop(key, None)
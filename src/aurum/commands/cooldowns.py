@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import itertools
+import time
+from collections.abc import Hashable, Sequence
+
+from aurum.commands.buckets import BucketType
+
+__all__: Sequence[str] = ("Cooldown",)
+
+
+class Cooldown:
+    """A token bucket cooldown of a command.
+
+    Each bucket allows `rate` invocations per `per` seconds, refilled continuously.
+    A bucket is stored as a single timestamp (generic cell rate algorithm), an entry
+    whose timestamp passed is equal to a full bucket and is dropped lazily. When there
+    are more than `max_keys` buckets, the expired ones are dropped first. Only if there are
+    still too many, buckets still cooling down are evicted, least recently used first.
+
+    Parameters
+    ----------
+    rate : int
+        Number of invocations allowed per period.
+    per : float
+        Length of the period in seconds.
+    bucket : BucketType, default BucketType.USER
+        Scope by which the cooldown is keyed.
+    max_keys : int, default 100_000
+        Maximum number of stored buckets.
+    response : str, optional
+        Ephemeral response sent instead of running the callback when the invocation is rejected.
+
+    Notes
+    -----
+        Sharing one instance between commands makes them share the cooldown.
+    """
+
+    __slots__: Sequence[str] = (
+        "rate",
+        "per",
+        "bucket",
+        "max_keys",
+        "response",
+        "_interval",
+        "_tolerance",
+        "_buckets",
+        "_rejected",
+    )
+
+    def __init__(
+        self,
+        rate: int,
+        per: float,
+        *,
+        bucket: BucketType = BucketType.USER,
+        max_keys: int = 100_000,
+        response: str = "This command is on cooldown, try again later.",
+    ) -> None:
+        self.rate: int = rate
+        self.per: float = per
+        self.bucket: BucketType = bucket
+        self.max_keys: int = max_keys
+        self.response: str = response
+        self._interval: float = per / rate
+        self._tolerance: float = per - self._interval
+        self._buckets: dict[Hashable, float] = {}
+        self._rejected: int = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    @property
+    def rejected(self) -> int:
+        """Number of rejected invocations."""
+        return self._rejected
+
+    def hit(self, key: Hashable) -> float:
+        """Take a token from a bucket.
+
+        Parameters
+        ----------
+        key : Hashable
+            The bucket key.
+
+        Returns
+        -------
+        float
+            0.0 if the token was taken, otherwise seconds until the next token is available.
+        """
+        now: float = time.monotonic()
+        arrival: float = max(self._buckets.pop(key, now), now)
+        if arrival - now > self._tolerance:
+            self._buckets[key] = arrival
+            self._rejected += 1
+            return arrival - self._tolerance - now
+        self._buckets[key] = arrival + self._interval
+        if len(self._buckets) > self.max_keys:
+            self._evict()
+        return 0.0
+
+    def get_retry_after(self, key: Hashable) -> float:
+        """Get the seconds until a bucket has a token, without taking it.
+
+        Parameters
+        ----------
+        key : Hashable
+            The bucket key.
+
+        Returns
+        -------
+        float
+            0.0 if a token is available, otherwise seconds until it is.
+        """
+        arrival: float | None = self._buckets.get(key)
+        if arrival is None:
+            return 0.0
+        return max(0.0, arrival - self._tolerance - time.monotonic())
+
+    def reset(self, key: Hashable | None = None) -> None:
+        """Reset a bucket, or every bucket if key is not given.
+
+        Parameters
+        ----------
+        key : Hashable | None, optional
+            The bucket key.
+        """
+        if key is None:
+            self._buckets.clear()
+        else:
+            self._buckets.pop(key, None)
+
+    def _evict(self) -> None:
+        now: float = time.monotonic()
+        for key in [key for key, arrival in self._buckets.items() if arrival <= now]:
+            del self._buckets[key]
+        if len(self._buckets) > self.max_keys:
+            # buckets are re-inserted on every hit, so the dict is ordered by the last use,
+            # a tenth more is evicted so the next hits do not scan again
+            overflow: int = len(self._buckets) - self.max_keys + self.max_keys // 10
+            for key in list(itertools.islice(self._buckets, overflow)):
+                del self._buckets[key]
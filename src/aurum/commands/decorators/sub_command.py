@@ -3,8 +3,15 @@ from __future__ import annotations
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING
 
+from aurum.commands.admission import Priority
+from aurum.commands.auto_defer import AutoDefer
+from aurum.commands.circuit_breaker import CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency
+from aurum.commands.cooldowns import Cooldown
+from aurum.commands.offload import Offload
 from aurum.commands.options import Option
 from aurum.commands.sub_command import SubCommand, SubCommandMethod
+from aurum.commands.timeouts import Timeout
 from aurum.commands.types import Localized
 
 if TYPE_CHECKING:
@@ -13,13 +20,20 @@ if TYPE_CHECKING:
 __all__: Sequence[str] = ("sub_command",)
 
 
-def sub_command(
+def sub_command(  # noqa: PLR0913
     name: str,
     *,
     name_localizations: Localized | None = None,
     description: str | None = None,
     description_localizations: Localized | None = None,
     options: Sequence[Option] | None = None,
+    max_concurrency: MaxConcurrency | None = None,
+    cooldown: Cooldown | None = None,
+    auto_defer: AutoDefer | None = None,
+    offload: Offload | None = None,
+    priority: Priority | None = None,
+    timeout: Timeout | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
 ) -> Callable[[CommandCallbackT], SubCommandMethod]:
     """Creates a new sub-command and associates it with the decorated function.
 
@@ -35,6 +49,20 @@ def sub_command(
         The sub-command description localizations.
     options : Sequence[Option] | None, optional
         The sub-command options.
+    max_concurrency : MaxConcurrency | None, optional
+        Limit of in-flight invocations of the command.
+    cooldown : Cooldown | None, optional
+        Token bucket cooldown of the command.
+    auto_defer : AutoDefer | None, optional
+        Auto-defer policy of the command, overrides the policy of the handler.
+    offload : Offload | None, optional
+        Offload policy of the functions decorated with `offload` called by the command.
+    priority : Priority | None, optional
+        Priority of the command under load shedding, `Priority.NORMAL` if not set.
+    timeout : Timeout | None, optional
+        Time limit of the callback, by default the time limit of the handler.
+    circuit_breaker : CircuitBreaker | None, optional
+        Circuit breaker short-circuiting the command while it is failing.
 
     Returns
     -------
@@ -49,6 +77,13 @@ def sub_command(
             description=description,
             description_localizations=description_localizations,
             options=options,
+            max_concurrency=max_concurrency,
+            cooldown=cooldown,
+            auto_defer=auto_defer,
+            offload=offload,
+            priority=priority,
+            timeout=timeout,
+            circuit_breaker=circuit_breaker,
             sub_command_group=None,
             sub_commands={},
         )
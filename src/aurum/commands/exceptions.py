@@ -8,6 +8,7 @@ __all__: Sequence[str] = (
     "CommandCallbackNotImplemented",
     "CommandNotFound",
     "SubCommandNotFound",
+    "MaxConcurrencyReached",
 )
 
 
@@ -77,3 +78,16 @@ class SubCommandNotFound(BaseCommandException):
             command_name,
             f"Command {command_name} {" ".join(sub_command for sub_command in sub_commands if sub_command)} is not found.",
         )
+
+
+class MaxConcurrencyReached(BaseCommandException):
+    """Exception raised when an invocation is rejected by the concurrency limit of a command.
+
+    Parameters
+    ----------
+    command_name : str
+        Name of the command that reached its limit.
+    """
+
+    def __init__(self, command_name: str) -> None:
+        super().__init__(command_name, f"Command {command_name} has reached its concurrency limit.")
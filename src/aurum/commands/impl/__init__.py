@@ -6,6 +6,24 @@ This module provides functionality for building and handling commands.
 from collections.abc import Sequence
 
 from aurum.commands.impl.command_builder import CommandBuilder
+from aurum.commands.impl.command_drain import DrainReport
 from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.command_registry import CommandRegistry, RegistryState
+from aurum.commands.impl.command_sync import SyncMode, SyncReport
+from aurum.commands.impl.dispatch_table import DispatchEntry, DispatchTable
+from aurum.commands.impl.readiness_gate import ReadinessGate
+from aurum.commands.impl.worker_pool import WorkerPool
 
-__all__: Sequence[str] = ("CommandBuilder", "CommandHandler")
+__all__: Sequence[str] = (
+    "CommandBuilder",
+    "CommandHandler",
+    "CommandRegistry",
+    "RegistryState",
+    "DispatchEntry",
+    "DispatchTable",
+    "SyncMode",
+    "SyncReport",
+    "WorkerPool",
+    "DrainReport",
+    "ReadinessGate",
+)
@@ -5,6 +5,27 @@
 # This file was automatically generated by `nox -s generate_stubs`
 
 from aurum.commands.impl.command_builder import CommandBuilder as CommandBuilder
+from aurum.commands.impl.command_drain import DrainReport as DrainReport
 from aurum.commands.impl.command_handler import CommandHandler as CommandHandler
+from aurum.commands.impl.command_registry import CommandRegistry as CommandRegistry
+from aurum.commands.impl.command_registry import RegistryState as RegistryState
+from aurum.commands.impl.command_sync import SyncMode as SyncMode
+from aurum.commands.impl.command_sync import SyncReport as SyncReport
+from aurum.commands.impl.dispatch_table import DispatchEntry as DispatchEntry
+from aurum.commands.impl.dispatch_table import DispatchTable as DispatchTable
+from aurum.commands.impl.readiness_gate import ReadinessGate as ReadinessGate
+from aurum.commands.impl.worker_pool import WorkerPool as WorkerPool
 
-__all__ = ["CommandBuilder", "CommandHandler"]
+__all__ = [
+    "CommandBuilder",
+    "CommandHandler",
+    "CommandRegistry",
+    "RegistryState",
+    "DispatchEntry",
+    "DispatchTable",
+    "SyncMode",
+    "SyncReport",
+    "WorkerPool",
+    "DrainReport",
+    "ReadinessGate",
+]
@@ -173,13 +173,16 @@ class CommandBuilder:
             name_localizations=option.name_localizations or {},
             description=option.description or "No description",
             description_localizations=option.description_localizations or {},
-            choices=tuple(self._build_choice(choice) for choice in option.choices),
+            choices=tuple(self._build_choice(choice) for choice in option.choices)
+            if option.choice_index is None
+            else (),
             is_required=option.is_required,
             max_length=option.max_length,
             min_length=option.min_length,
             max_value=option.max_value,
             min_value=option.min_value,
             channel_types=option.channel_types,
+            autocomplete=option.autocomplete is not None or option.choice_index is not None,
         )
         return command_option
 
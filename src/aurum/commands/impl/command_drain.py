@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import attrs
+
+__all__: Sequence[str] = ("DrainReport",)
+
+
+@attrs.define(kw_only=True, hash=False, weakref_slot=False)
+class DrainReport:
+    """A report of the drain of the in-flight interactions on stop."""
+
+    in_flight: int = attrs.field(default=0)
+    """Number of interactions in flight when the drain started."""
+
+    completed: int = attrs.field(default=0)
+    """Number of interactions completed before the deadline."""
+
+    abandoned: int = attrs.field(default=0)
+    """Number of interactions cancelled at the deadline."""
+
+    deferred: int = attrs.field(default=0)
+    """Number of interactions auto-deferred during the drain."""
+
+    dropped: int = attrs.field(default=0)
+    """Number of interactions received during the drain and not dispatched."""
+
+    duration: float = attrs.field(default=0.0)
+    """Time spent on the drain in seconds."""
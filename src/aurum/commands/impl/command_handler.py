@@ -1,55 +1,176 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import random
+import time
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Sequence
 from logging import Logger, getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from hikari.api import special_endpoints as api
 from hikari.applications import Application
-from hikari.commands import OptionType, PartialCommand
-from hikari.errors import BadRequestError
+from hikari.commands import CommandType, PartialCommand
+from hikari.errors import BadRequestError, InternalServerError, RateLimitTooLongError
 from hikari.events.interaction_events import InteractionCreateEvent
 from hikari.events.lifetime_events import StartedEvent, StoppingEvent
+from hikari.events.shard_events import ShardPayloadEvent
 from hikari.guilds import PartialGuild
 from hikari.impl.gateway_bot import GatewayBot
-from hikari.interactions import CommandInteraction, CommandInteractionOption
-from hikari.snowflakes import SnowflakeishOr
+from hikari.impl.rest_bot import RESTBot
+from hikari.impl.special_endpoints import AutocompleteChoiceBuilder, InteractionAutocompleteBuilder
+from hikari.interactions import (
+    AutocompleteInteraction,
+    CommandInteraction,
+    CommandInteractionOption,
+    ComponentInteraction,
+    ModalInteraction,
+    PartialInteraction,
+)
+from hikari.snowflakes import Snowflake, SnowflakeishOr
+from hikari.undefined import UNDEFINED, UndefinedOr
 
+from aurum.commands.admission import AdmissionController, Priority
+from aurum.commands.auto_defer import AutoDefer, AutoDeferWatchdog
+from aurum.commands.autocomplete import AutocompleteCache
 from aurum.commands.base_command import BaseCommand
+from aurum.commands.circuit_breaker import CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency
 from aurum.commands.context_menu_command import MessageCommand, UserCommand
-from aurum.commands.exceptions import CommandCallbackNotImplemented, CommandNotFound, SubCommandNotFound
+from aurum.commands.cooldowns import Cooldown
+from aurum.commands.exceptions import CommandCallbackNotImplemented, MaxConcurrencyReached
 from aurum.commands.impl.command_builder import CommandBuilder
-from aurum.commands.slash_command import SlashCommand, SlashCommandGroup
-from aurum.commands.sub_command import SubCommandMethod
+from aurum.commands.impl.command_drain import DrainReport
+from aurum.commands.impl.command_registry import CommandRegistry, RegistryState
+from aurum.commands.impl.command_sync import SyncMode, SyncReport
+from aurum.commands.impl.dispatch_table import DispatchEntry, DispatchTable
+from aurum.commands.impl.readiness_gate import ReadinessGate
+from aurum.commands.impl.worker_pool import WorkerPool
+from aurum.commands.offload import Offload
+from aurum.commands.scheduler import FairScheduler
+from aurum.commands.streaming import ResponseStream
+from aurum.commands.timeouts import Timeout
+from aurum.commands.utils.choice_index import MAX_CHOICES, ChoiceIndex
+from aurum.commands.utils.command_fingerprint import fingerprint_command
 from aurum.commands.utils.command_tree import build_command_tree
-from aurum.commands.utils.resolve_interaction_option import resolve_interaction_option
-from aurum.context import InteractionContext
+from aurum.components.component_router import ComponentRoute, ComponentRouter
+from aurum.components.modal_router import ModalRoute, ModalRouter
+from aurum.components.view import VIEW_PREFIX, ViewStore
+from aurum.context import InteractionContext, ResponseState
+from aurum.exceptions import AurumException
 from aurum.utils.logs import trace
 from aurum.utils.timeit import timeit
 
 if TYPE_CHECKING:
-    from aurum.commands.types import CommandCallbackT, CommandMapping
+    from contextvars import Token
+
+    from aurum.commands.options import Choice
+    from aurum.commands.types import AutocompleteCallbackT, CommandMapping
 
 __all__: Sequence[str] = ("CommandHandler",)
 
+_INTERACTION_TYPES: Sequence[type[PartialInteraction]] = (
+    CommandInteraction,
+    AutocompleteInteraction,
+    ComponentInteraction,
+    ModalInteraction,
+)
+
+_DEFAULT_AUTO_DEFER: AutoDefer = AutoDefer()
+_CANCEL_GRACE: float = 1.0
+
+_FALLBACK_STATES: frozenset[ResponseState] = frozenset(
+    {ResponseState.PENDING, ResponseState.DEFERRED, ResponseState.UPDATE_DEFERRED, ResponseState.RESPONDED}
+)
+
 
 class CommandHandler:
     """This class handles the registration, synchronization, and execution of Discord commands.
 
     Parameters
     ----------
-    bot : GatewayBot
-        The Discord bot instance this handler will work with.
+    bot : GatewayBot | RESTBot
+        The Discord bot instance this handler will work with. With a RESTBot, interactions are
+        received by its interaction server and initial responses are returned in the HTTP replies.
     sync_commands : bool, optional
         Whether to automatically sync commands on startup, by default False.
+    sync_mode : SyncMode, optional
+        Strategy of the synchronization, by default `SyncMode.BULK`.
+    registry : CommandRegistry | None, optional
+        Registry to save learned command IDs to after the synchronization and
+        to restore them from on start when commands are not synchronized.
+    sync_concurrency : int, optional
+        Maximum number of guilds synchronized at once, by default 8.
+    sync_retries : int, optional
+        Number of retries of a failed scope synchronization, by default 3.
+    autocomplete_cache : AutocompleteCache | None, optional
+        Cache of autocomplete results, a default cache is used if not set. Pass None to disable caching.
+    components : ComponentRouter | None, optional
+        Router of component interactions, an empty router is created if not set.
+    modals : ModalRouter | None, optional
+        Router of modal interactions, an empty router is created if not set.
+    views : ViewStore | None, optional
+        Store of running views, a default store is created if not set.
+    auto_defer : AutoDefer | None, optional
+        Auto-defer policy of commands that do not set their own, by default None.
+    timeout : Timeout | None, optional
+        Time limit of the callbacks of commands that do not set their own, by default None.
+    stream_interval : float, optional
+        Minimum time in seconds between the response edits of streaming commands, by default 1.0.
+    admission : AdmissionController | None, optional
+        Load shedder of the commands, by default None.
+    scheduler : FairScheduler | None, optional
+        Scheduler queueing the commands fairly across guilds, by default None.
+    workers : WorkerPool | None, optional
+        Pool of processes to forward the raw interactions to instead of executing them in this process.
+        Only supported with a GatewayBot, by default None.
+    drain_timeout : float, optional
+        Time in seconds the in-flight interactions are waited for on stop before they are cancelled, by default 10.0.
+    readiness : ReadinessGate | None, optional
+        Gate buffering the interactions received before the handler is ready, a default gate is used
+        if not set. Pass None to dispatch them at once.
 
     Attributes
     ----------
-    bot : GatewayBot
+    bot : GatewayBot | RESTBot
         The Discord bot instance.
     sync_commands_flag : bool
         Whether commands should be synced on startup.
+    sync_mode : SyncMode
+        Strategy of the synchronization.
+    registry : CommandRegistry | None
+        Registry of command IDs.
+    sync_concurrency : int
+        Maximum number of guilds synchronized at once.
+    sync_retries : int
+        Number of retries of a failed scope synchronization.
+    autocomplete_cache : AutocompleteCache | None
+        Cache of autocomplete results.
+    components : ComponentRouter
+        Router of component interactions.
+    modals : ModalRouter
+        Router of modal interactions.
+    views : ViewStore
+        Store of running views.
+    auto_defer : AutoDefer | None
+        Auto-defer policy of commands that do not set their own.
+    timeout : Timeout | None
+        Time limit of the callbacks of commands that do not set their own.
+    stream_interval : float
+        Minimum time in seconds between the response edits of streaming commands.
+    admission : AdmissionController | None
+        Load shedder of the commands, with the shed counts.
+    scheduler : FairScheduler | None
+        Scheduler of the commands, with the queue depths.
+    workers : WorkerPool | None
+        Pool of processes executing the interactions.
+    drain_timeout : float
+        Time in seconds the in-flight interactions are waited for on stop.
+    readiness : ReadinessGate | None
+        Gate buffering the interactions received before the handler is ready, with the buffer occupancy.
+    watchdog : AutoDeferWatchdog
+        Watchdog deferring the interactions, with the auto-defer counters.
     commands : Dict[str, BaseCommand]
         Mapping of command names to command instances.
     global_commands : CommandMapping
@@ -64,23 +185,96 @@ class CommandHandler:
         "bot",
         "verbose",
         "sync_commands_flag",
+        "sync_mode",
+        "registry",
+        "sync_concurrency",
+        "sync_retries",
+        "autocomplete_cache",
+        "components",
+        "modals",
+        "views",
+        "auto_defer",
+        "watchdog",
+        "timeout",
+        "stream_interval",
+        "admission",
+        "scheduler",
+        "workers",
+        "drain_timeout",
+        "readiness",
         "commands",
         "global_commands",
         "guild_commands",
         "_commands_builders",
         "_builder",
+        "_dispatch_table",
+        "_replies",
+        "_deliveries",
+        "_in_flight",
+        "_drain",
     )
 
-    def __init__(self, bot: GatewayBot, *, sync_commands: bool = False) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        bot: GatewayBot | RESTBot,
+        *,
+        sync_commands: bool = False,
+        sync_mode: SyncMode = SyncMode.BULK,
+        registry: CommandRegistry | None = None,
+        sync_concurrency: int = 8,
+        sync_retries: int = 3,
+        autocomplete_cache: UndefinedOr[AutocompleteCache | None] = UNDEFINED,
+        components: ComponentRouter | None = None,
+        modals: ModalRouter | None = None,
+        views: ViewStore | None = None,
+        auto_defer: AutoDefer | None = None,
+        timeout: Timeout | None = None,
+        stream_interval: float = 1.0,
+        admission: AdmissionController | None = None,
+        scheduler: FairScheduler | None = None,
+        workers: WorkerPool | None = None,
+        drain_timeout: float = 10.0,
+        readiness: UndefinedOr[ReadinessGate | None] = UNDEFINED,
+    ) -> None:
         self.__logger: Logger = getLogger("aurum.commands")
         self.__application: Application | None = None
 
-        self.bot: GatewayBot = bot
-        self.bot.event_manager.subscribe(StartedEvent, self.start)
-        self.bot.event_manager.subscribe(StoppingEvent, self.stop)
-        self.bot.event_manager.subscribe(InteractionCreateEvent, self.on_command_interaction)
+        self.bot: GatewayBot | RESTBot = bot
+        self.workers: WorkerPool | None = workers
+        if isinstance(bot, RESTBot):
+            if workers is not None:
+                raise AurumException("Worker pools are only supported with a GatewayBot")
+            bot.add_startup_callback(self.start)
+            bot.add_shutdown_callback(self.stop)
+            for interaction_type in _INTERACTION_TYPES:
+                bot.set_listener(interaction_type, self.on_rest_interaction)  # type: ignore
+        else:
+            bot.event_manager.subscribe(StartedEvent, self.start)
+            bot.event_manager.subscribe(StoppingEvent, self.stop)
+            if workers is not None:
+                bot.event_manager.subscribe(ShardPayloadEvent, self.on_shard_payload)
+            else:
+                bot.event_manager.subscribe(InteractionCreateEvent, self.on_command_interaction)
 
         self.sync_commands_flag: bool = sync_commands
+        self.sync_mode: SyncMode = sync_mode
+        self.registry: CommandRegistry | None = registry
+        self.sync_concurrency: int = sync_concurrency
+        self.sync_retries: int = sync_retries
+        self.autocomplete_cache: AutocompleteCache | None = (
+            AutocompleteCache() if autocomplete_cache is UNDEFINED else autocomplete_cache
+        )
+        self.components: ComponentRouter = ComponentRouter() if components is None else components
+        self.modals: ModalRouter = ModalRouter() if modals is None else modals
+        self.views: ViewStore = ViewStore() if views is None else views
+        self.auto_defer: AutoDefer | None = auto_defer
+        self.timeout: Timeout | None = timeout
+        self.stream_interval: float = stream_interval
+        self.admission: AdmissionController | None = admission
+        self.scheduler: FairScheduler | None = scheduler
+        self.watchdog: AutoDeferWatchdog = AutoDeferWatchdog()
+        self.drain_timeout: float = drain_timeout
+        self.readiness: ReadinessGate | None = ReadinessGate() if readiness is UNDEFINED else readiness
 
         self.commands: dict[str, BaseCommand] = {}
         self.global_commands: CommandMapping = {}
@@ -91,13 +285,38 @@ class CommandHandler:
 
         self._builder: CommandBuilder = CommandBuilder()
         self._commands_builders: dict[BaseCommand, api.CommandBuilder] = {}
+        self._dispatch_table: DispatchTable = DispatchTable()
+        self._replies: dict[Snowflake, asyncio.Future[api.InteractionResponseBuilder]] = {}
+        self._deliveries: dict[Snowflake, asyncio.Future[None]] = {}
+        # dispatching tasks and the contexts they created
+        self._in_flight: dict[asyncio.Task[Any], InteractionContext | None] = {}
+        self._drain: DrainReport | None = None
+
+    @property
+    def dispatch_table(self) -> DispatchTable:
+        return self._dispatch_table
+
+    @property
+    def in_flight(self) -> int:
+        """Number of interactions being dispatched."""
+        return len(self._in_flight)
+
+    @property
+    def is_draining(self) -> bool:
+        """Whether the handler stopped accepting interactions."""
+        return self._drain is not None
 
-    def create_context(self, interaction: CommandInteraction) -> InteractionContext:
-        """Create a new interaction context from a command interaction.
+    def create_context(
+        self, interaction: CommandInteraction | AutocompleteInteraction | ComponentInteraction | ModalInteraction
+    ) -> InteractionContext:
+        """Create a new interaction context from an interaction.
+
+        The context created while the interaction was buffered is returned again,
+        so its response state is kept.
 
         Parameters
         ----------
-        interaction : CommandInteraction
+        interaction : CommandInteraction | AutocompleteInteraction | ComponentInteraction | ModalInteraction
             The command interaction to create the context from.
 
         Returns
@@ -105,38 +324,148 @@ class CommandHandler:
         InteractionContext
             The created interaction context.
         """
-        return InteractionContext(interaction=interaction, bot=self.bot)
+        task: asyncio.Task[Any] | None = asyncio.current_task()
+        buffered: InteractionContext | None = self._in_flight.get(task)  # type: ignore
+        if buffered is not None and buffered.interaction is interaction:
+            return buffered
+        context: InteractionContext = InteractionContext(
+            interaction=interaction,
+            bot=self.bot,
+            views=self.views,
+            reply=self._replies.get(interaction.id),
+            delivered=self._deliveries.get(interaction.id),
+        )
+        if task in self._in_flight:
+            self._in_flight[task] = context  # type: ignore
+            if self._drain is not None:
+                self._watch_unacknowledged(context)
+        return context
 
-    async def start(self, _: StartedEvent) -> None:
+    async def start(self, _: StartedEvent | RESTBot) -> None:
         """Start the command handler.
 
         This method initializes the command handler when the bot starts. If `sync_commands_flag`
         is True, it will fetch the application data and synchronize all registered commands.
+        Otherwise, command IDs are restored from the registry, if it is set.
         """
         self.__logger.debug("starting")
+        self._drain = None
+        if self.workers is not None:
+            self.workers.start()
         async with timeit(self.__logger.debug, "started in %.2f seconds"):
             if self.sync_commands_flag is True:
                 self.__logger.debug("syncing commands")
                 self.__application = await self.bot.rest.fetch_application()
                 self._commands_builders = self._builder.build_commands(self.bot, self.commands)
                 await self.sync_commands()
+                if self.registry is not None:
+                    self.registry.save(self.global_commands, self.guild_commands, self._fingerprint_commands())
+            elif self.registry is not None:
+                self.load_registry()
+        if self.readiness is not None:
+            self.readiness.open()
 
-    async def stop(self, _: StoppingEvent) -> None:
+    async def stop(self, _: StoppingEvent | RESTBot) -> None:
         """Stop the command handler.
 
         This method cleans up the command handler when the bot is stopping. It unsubscribes
-        from events and clears all command registrations.
+        from events, or removes the interaction server listeners, drains the in-flight
+        interactions, shuts down the offload pools of the commands and clears all command registrations.
         """
         self.__logger.debug("stopping")
-        self.bot.event_manager.unsubscribe(StartedEvent, self.start)
-        self.bot.event_manager.unsubscribe(StoppingEvent, self.stop)
-        self.bot.event_manager.unsubscribe(InteractionCreateEvent, self.on_command_interaction)
+        if isinstance(self.bot, RESTBot):
+            self.bot.remove_startup_callback(self.start)
+            self.bot.remove_shutdown_callback(self.stop)
+            for interaction_type in _INTERACTION_TYPES:
+                self.bot.set_listener(interaction_type, None, replace=True)  # type: ignore
+        else:
+            self.bot.event_manager.unsubscribe(StartedEvent, self.start)
+            self.bot.event_manager.unsubscribe(StoppingEvent, self.stop)
+            if self.workers is not None:
+                self.bot.event_manager.unsubscribe(ShardPayloadEvent, self.on_shard_payload)
+            else:
+                self.bot.event_manager.unsubscribe(InteractionCreateEvent, self.on_command_interaction)
+        report: DrainReport = await self.drain()
+        self.__logger.info(
+            "drained %d of %d interactions in %.2f seconds, abandoned %d, auto-deferred %d, dropped %d",
+            report.completed,
+            report.in_flight,
+            report.duration,
+            report.abandoned,
+            report.deferred,
+            report.dropped,
+        )
+        if self.readiness is not None:
+            self.readiness.close()
+        # after the drain, so the drained invocations could still use their pools
+        offloads: set[Offload] = {
+            entry.offload for entry in self._dispatch_table.entries.values() if entry.offload is not None
+        }
+        for offload in offloads:
+            offload.shutdown()
         self.commands.clear()
         self.global_commands.clear()
         self.guild_commands.clear()
         self._commands_builders.clear()
+        self._dispatch_table.clear()
+        if self.autocomplete_cache is not None:
+            self.autocomplete_cache.clear()
+        self.views.clear()
+        self.watchdog.clear()
+        if self.admission is not None:
+            self.admission.stop()
+        if self.workers is not None:
+            await self.workers.stop()
+
+    async def drain(self, timeout: float | None = None) -> DrainReport:
+        """Stop accepting interactions and wait for the in-flight ones.
+
+        Interactions received from now on are not dispatched. In-flight interactions that are not
+        acknowledged are auto-deferred before their acknowledgement deadlines, with the auto-defer
+        policy of the handler or a default one. Those still running at the deadline are cancelled.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Time in seconds to wait for the in-flight interactions, by default `drain_timeout`.
 
-    async def sync_commands(self) -> None:
+        Returns
+        -------
+        DrainReport
+            The report of the drain, counting the interactions dropped until the next drain or start.
+        """
+        started: float = time.monotonic()
+        report: DrainReport = DrainReport()
+        self._drain = report
+        fired: int = self.watchdog.fired.total()
+        tasks: set[asyncio.Task[Any]] = set(self._in_flight)
+        report.in_flight = len(tasks)
+        if tasks:
+            for context in self._in_flight.values():
+                if context is not None:
+                    self._watch_unacknowledged(context)
+            done, pending = await asyncio.wait(tasks, timeout=self.drain_timeout if timeout is None else timeout)
+            report.completed = len(done)
+            report.abandoned = len(pending)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending, timeout=_CANCEL_GRACE)
+        report.deferred = self.watchdog.fired.total() - fired
+        report.duration = time.monotonic() - started
+        return report
+
+    def _watch_unacknowledged(self, context: InteractionContext) -> None:
+        if (
+            context.is_acknowledged
+            or context in self.watchdog
+            or isinstance(context.interaction, AutocompleteInteraction)
+        ):
+            return
+        name: str = getattr(context.interaction, "command_name", None) or getattr(context.interaction, "custom_id", "")
+        self.watchdog.watch(context, name, self.auto_defer or _DEFAULT_AUTO_DEFER)
+
+    async def sync_commands(self) -> SyncReport:
         """Synchronize the application commands with Discord.
 
         This method handles the synchronization of both global and guild-specific commands
@@ -144,8 +473,17 @@ class CommandHandler:
 
         The synchronization process includes:
         1. Separating commands into global and guild-specific collections.
-        2. Synchronizing guild-specific commands for each guild.
-        3. Synchronizing global commands.
+        2. Synchronizing guild-specific commands concurrently, at most `sync_concurrency` guilds at once,
+           alongside the global commands.
+        3. Retrying failed scopes with exponential backoff, up to `sync_retries` times.
+
+        With `SyncMode.DIFF` each scope is fetched first and only the commands that differ
+        are written, so nothing is written when every scope is up to date.
+
+        Returns
+        -------
+        SyncReport
+            The report of the synchronization.
 
         Notes
         -----
@@ -153,9 +491,12 @@ class CommandHandler:
         """
         assert isinstance(self.__application, Application)
 
+        report: SyncReport = SyncReport()
         global_commands: dict[BaseCommand, api.CommandBuilder] = {}
         guilds_commands: dict[SnowflakeishOr[PartialGuild], dict[BaseCommand, api.CommandBuilder]] = defaultdict(dict)
-        self.__logger.info("starting command synchronization with %s commands", len(self.commands))
+        self.__logger.info(
+            "starting %s command synchronization with %s commands", self.sync_mode.value, len(self.commands)
+        )
 
         async with timeit(self.__logger.info, "command synchronization completed in %.2f seconds"):
             for command, builder in self._commands_builders.items():
@@ -164,97 +505,503 @@ class CommandHandler:
                 else:
                     global_commands[command] = builder
 
-            for guild, commands in guilds_commands.items():
-                self.__logger.debug("syncing %d commands for guild %s", len(commands), guild)
-                try:
-                    response: Sequence[PartialCommand] = await self.bot.rest.set_application_commands(
-                        self.__application, tuple(commands.values()), guild=guild
-                    )
-                except BadRequestError as error:
-                    self.__logger.error("failed to set application commands for guild %s", exc_info=error)
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(self.sync_concurrency)
+            global_response, *guilds_responses = await asyncio.gather(
+                self._sync_scope_with_retries(tuple(global_commands.values()), report),
+                *(
+                    self._sync_scope_with_retries(tuple(commands.values()), report, guild=guild, semaphore=semaphore)
+                    for guild, commands in guilds_commands.items()
+                ),
+            )
+
+            for guild, response in zip(guilds_commands, guilds_responses, strict=True):
+                if response is None:
                     continue
-                self.guild_commands.setdefault(guild, {})
-                for command in response:
-                    self.guild_commands[guild][command.id] = self.commands[command.name]
+                self.guild_commands[guild] = {command.id: self.commands[command.name] for command in response}
                 trace("guild %s commands tree: \n%s", guild, build_command_tree(response))
                 self.__logger.info("%d commands synchronized for guild %s successfully", len(response), guild)
 
-            self.__logger.debug("syncing %d global commands", len(global_commands))
-            try:
-                response: Sequence[PartialCommand] = await self.bot.rest.set_application_commands(
-                    self.__application, tuple(global_commands.values())
-                )
-            except BadRequestError as error:
-                self.__logger.error("failed to sync global commands", exc_info=error)
-                return
-            for command in response:
-                self.global_commands[command.id] = self.commands[command.name]
-            trace("global commands tree: \n%s", build_command_tree(response))
-            self.__logger.info("%d global commands synchronized successfully", len(response))
+            if global_response is not None:
+                for command in global_response:
+                    self.global_commands[command.id] = self.commands[command.name]
+                trace("global commands tree: \n%s", build_command_tree(global_response))
+                self.__logger.info("%d global commands synchronized successfully", len(global_response))
+
+            self.compile_dispatch_table()
+            self.__logger.info(
+                "synchronization report: %d unchanged, %d created, %d updated, %d deleted, %d failed scopes",
+                report.unchanged,
+                report.created,
+                report.updated,
+                report.deleted,
+                report.failed_scopes,
+            )
+        return report
 
-    async def execute_command(self, interaction: CommandInteraction, command: BaseCommand) -> None:
-        """Execute a Discord command based on the interaction and command type.
+    async def _sync_scope_with_retries(
+        self,
+        builders: Sequence[api.CommandBuilder],
+        report: SyncReport,
+        *,
+        guild: UndefinedOr[SnowflakeishOr[PartialGuild]] = UNDEFINED,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> Sequence[PartialCommand] | None:
+        """Synchronize the commands of a single scope, retrying transient failures.
+
+        Parameters
+        ----------
+        builders : Sequence[api.CommandBuilder]
+            The command builders of the scope.
+        report : SyncReport
+            The report to merge the scope report into.
+        guild : UndefinedOr[SnowflakeishOr[PartialGuild]], optional
+            The guild of the scope, global scope if undefined.
+        semaphore : asyncio.Semaphore | None, optional
+            Semaphore bounding the number of concurrently synchronized scopes.
+
+        Returns
+        -------
+        Sequence[PartialCommand] | None
+            The remote commands of the scope, None if the synchronization failed.
+        """
+        scope: str = "global" if guild is UNDEFINED else str(guild)
+        async with semaphore or contextlib.nullcontext():
+            started: float = time.monotonic()
+            for attempt in range(self.sync_retries + 1):
+                self.__logger.debug("syncing %d commands for scope %s", len(builders), scope)
+                try:
+                    response, scope_report = await self._sync_scope(builders, guild=guild)
+                except BadRequestError as error:
+                    self.__logger.error("failed to sync application commands for scope %s", scope, exc_info=error)
+                    break
+                # not the builtin TimeoutError on Python 3.10, which the package supports
+                except (InternalServerError, RateLimitTooLongError, asyncio.TimeoutError, OSError) as error:  # noqa: UP041
+                    if attempt == self.sync_retries:
+                        self.__logger.error("failed to sync application commands for scope %s", scope, exc_info=error)
+                        break
+                    delay: float = min(2**attempt, 30) * random.uniform(0.5, 1.5)
+                    self.__logger.warning(
+                        "failed to sync application commands for scope %s, retrying in %.2f seconds", scope, delay
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    report.unchanged += scope_report.unchanged
+                    report.created += scope_report.created
+                    report.updated += scope_report.updated
+                    report.deleted += scope_report.deleted
+                    report.timings[scope] = time.monotonic() - started
+                    self.__logger.debug("scope %s synchronized in %.2f seconds", scope, report.timings[scope])
+                    return response
+            report.failed_scopes += 1
+            report.timings[scope] = time.monotonic() - started
+            return None
+
+    async def _sync_scope(
+        self, builders: Sequence[api.CommandBuilder], *, guild: UndefinedOr[SnowflakeishOr[PartialGuild]] = UNDEFINED
+    ) -> tuple[Sequence[PartialCommand], SyncReport]:
+        """Synchronize the commands of a single scope.
+
+        Parameters
+        ----------
+        builders : Sequence[api.CommandBuilder]
+            The command builders of the scope.
+        guild : UndefinedOr[SnowflakeishOr[PartialGuild]], optional
+            The guild of the scope, global scope if undefined.
+
+        Returns
+        -------
+        tuple[Sequence[PartialCommand], SyncReport]
+            The remote commands of the scope after synchronization and the report of the scope.
+        """
+        assert isinstance(self.__application, Application)
+
+        report: SyncReport = SyncReport()
+
+        if self.sync_mode is SyncMode.BULK:
+            response: Sequence[PartialCommand] = await self.bot.rest.set_application_commands(
+                self.__application, builders, guild=guild
+            )
+            report.updated += len(response)
+            return response, report
+
+        remote: dict[tuple[CommandType, str], PartialCommand] = {
+            (command.type, command.name): command
+            for command in await self.bot.rest.fetch_application_commands(self.__application, guild)
+        }
+        commands: list[PartialCommand] = []
+        for builder in builders:
+            current: PartialCommand | None = remote.pop((builder.type, builder.name), None)
+            if current is not None and fingerprint_command(current) == fingerprint_command(builder):
+                report.unchanged += 1
+                commands.append(current)
+                continue
+            # creating a command with an existing name overwrites it and keeps its ID
+            commands.append(await builder.create(self.bot.rest, self.__application, guild=guild))
+            if current is None:
+                report.created += 1
+            else:
+                report.updated += 1
+        for command in remote.values():
+            await self.bot.rest.delete_application_command(self.__application, command.id, guild)
+            report.deleted += 1
+        return commands, report
+
+    def load_registry(self) -> RegistryState:
+        """Restore command IDs from the registry without any REST calls.
+
+        Returns
+        -------
+        RegistryState
+            The restored state.
+
+        Notes
+        -----
+            Requires the registry to be set.
+        """
+        assert isinstance(self.registry, CommandRegistry)
+
+        self._commands_builders = self._builder.build_commands(self.bot, self.commands)
+        state: RegistryState = self.registry.load(self.commands, self._fingerprint_commands())
+        self.global_commands.update(state.global_commands)
+        for guild, mapping in state.guild_commands.items():
+            self.guild_commands.setdefault(guild, {}).update(mapping)
+        self.compile_dispatch_table()
+
+        if state.unknown:
+            self.__logger.warning("command registry has unknown commands: %s", ", ".join(state.unknown))
+        if state.missing:
+            self.__logger.warning("command registry has no IDs for commands: %s", ", ".join(state.missing))
+        if state.stale:
+            self.__logger.warning("commands changed since the last sync: %s", ", ".join(state.stale))
+        if state.is_outdated:
+            self.__logger.warning("command registry is outdated, synchronize commands to update it")
+        self.__logger.info(
+            "restored %d command IDs from the registry",
+            len(state.global_commands) + sum(len(mapping) for mapping in state.guild_commands.values()),
+        )
+        return state
+
+    def _fingerprint_commands(self) -> dict[BaseCommand, str]:
+        return {command: fingerprint_command(builder) for command, builder in self._commands_builders.items()}
+
+    def compile_dispatch_table(self) -> None:
+        """Compile the dispatch table from the current global and guild command mappings.
+
+        This is done automatically after the synchronization. Call it manually if you fill
+        `global_commands` or `guild_commands` by yourself.
+        """
+        self._dispatch_table.compile(self.global_commands, *self.guild_commands.values())
+        self.__logger.debug("compiled %d command routes", len(self._dispatch_table))
+        if self.readiness is not None:
+            self.readiness.open()
+
+    async def execute_command(
+        self, interaction: CommandInteraction, entry: DispatchEntry, options: Sequence[CommandInteractionOption]
+    ) -> None:
+        """Execute a Discord command based on the interaction and its compiled route.
 
         Parameters
         ----------
         interaction : CommandInteraction
             The interaction event triggered by the command.
-        command : BaseCommand
-            The command instance to execute.
+        entry : DispatchEntry
+            The compiled route of the command.
+        options : Sequence[CommandInteractionOption]
+            The interaction options that belong to the route callback.
         """
         context: InteractionContext = self.create_context(interaction)
+        if entry.callback is None:
+            raise CommandCallbackNotImplemented(entry.command.name)
 
-        if isinstance(command, SlashCommand):
-            context.arguments = {
-                option.name: resolve_interaction_option(interaction, option) for option in interaction.options
-            }
-            return await command._callback(context, **context.arguments)  # type: ignore
-
-        if isinstance(command, SlashCommandGroup):
-            callback: CommandCallbackT | None = None
-            sub_command_group, sub_command = None, None
-            sub_commands: dict[str, SubCommandMethod] = command.get_sub_commands()
-            options: list[CommandInteractionOption] = list(interaction.options)
-            while options:
-                option = options.pop()
-                if option.type == OptionType.SUB_COMMAND_GROUP:
-                    sub_command_group = command.sub_commands.get(option.name)
-                    if not sub_command_group:
-                        raise SubCommandNotFound(command.name, option.name)
-                    options = list(option.options or [])
-                    sub_commands = sub_command_group.command.sub_commands or {}
-                elif option.type == OptionType.SUB_COMMAND:
-                    sub_command = sub_commands.get(option.name)
-                    if not sub_command:
-                        if sub_command_group:
-                            raise SubCommandNotFound(command.name, sub_command_group.command.name, option.name)
-                        raise SubCommandNotFound(command.name, option.name)
-                    options = list(option.options or [])
-                    callback = sub_command.method(command)
-                else:
-                    context.arguments[option.name] = resolve_interaction_option(interaction, option)
-            assert callback
-            await callback(context, **context.arguments)
+        admission: AdmissionController | None = self.admission
+        if admission is None:
+            return await self._execute_admitted(context, entry, options)
+        priority: Priority = Priority.NORMAL if entry.priority is None else entry.priority
+        if not admission.admit(entry.command.name, priority):
+            trace("shed %s", entry.command.name)
+            return await context.create_response(admission.response, ephemeral=True)
+        started: float = admission.enter()
+        try:
+            await self._execute_admitted(context, entry, options)
+        finally:
+            admission.leave(started)
+
+    async def _execute_admitted(
+        self, context: InteractionContext, entry: DispatchEntry, options: Sequence[CommandInteractionOption]
+    ) -> None:
+        interaction: CommandInteraction = context.interaction  # type: ignore
+        cooldown: Cooldown | None = entry.cooldown
+        if cooldown is not None and cooldown.hit(cooldown.bucket.get_key(interaction)):
+            trace("%s is on cooldown", entry.command.name)
+            return await context.create_response(cooldown.response, ephemeral=True)
+
+        offload_token: Token[Any] | None = entry.offload.bind(entry.command.name) if entry.offload else None
+        try:
+            auto_defer: AutoDefer | None = entry.auto_defer or self.auto_defer
+            if auto_defer is None:
+                return await self._invoke_scheduled(context, entry, options)
+            self.watchdog.watch(context, entry.command.name, auto_defer)
+            try:
+                await self._invoke_scheduled(context, entry, options)
+            finally:
+                self.watchdog.unwatch(context)
+        finally:
+            if offload_token is not None:
+                Offload.unbind(offload_token)
+
+    async def _invoke_scheduled(
+        self, context: InteractionContext, entry: DispatchEntry, options: Sequence[CommandInteractionOption]
+    ) -> None:
+        scheduler: FairScheduler | None = self.scheduler
+        if scheduler is None:
+            return await self._invoke_limited(context, entry, options)
+        await scheduler.acquire(
+            scheduler.bucket.get_key(context.interaction), Priority.NORMAL if entry.priority is None else entry.priority
+        )
+        try:
+            await self._invoke_limited(context, entry, options)
+        finally:
+            scheduler.release()
+
+    async def _invoke_limited(
+        self, context: InteractionContext, entry: DispatchEntry, options: Sequence[CommandInteractionOption]
+    ) -> None:
+        limiter: MaxConcurrency | None = entry.max_concurrency
+        if limiter is None:
+            return await self._invoke_guarded(context, entry, options)
+        bucket_key: int = limiter.bucket.get_key(context.interaction)
+        if not await limiter.acquire(bucket_key):
+            if limiter.response is None:
+                raise MaxConcurrencyReached(entry.command.name)
+            trace("%s reached its concurrency limit", entry.command.name)
+            return await context.create_response(limiter.response, ephemeral=True)
+        try:
+            await self._invoke_guarded(context, entry, options)
+        finally:
+            limiter.release(bucket_key)
+
+    async def _invoke_guarded(
+        self, context: InteractionContext, entry: DispatchEntry, options: Sequence[CommandInteractionOption]
+    ) -> None:
+        breaker: CircuitBreaker | None = entry.circuit_breaker
+        if breaker is None:
+            await self._invoke_timed(context, entry, options)
+            return
+        # checked right before the callback, so every allowed probe is recorded or discarded
+        if not breaker.allow(entry.command.name):
+            trace("%s is short-circuited", entry.command.name)
+            return await context.create_response(breaker.response, ephemeral=True)
+        started: float = time.monotonic()
+        try:
+            completed: bool = await self._invoke_timed(context, entry, options)
+        except asyncio.CancelledError:
+            breaker.discard()
+            raise
+        except Exception as error:
+            breaker.record(entry.command.name, error, time.monotonic() - started)
+            raise
+        breaker.record(entry.command.name, None, time.monotonic() - started, timed_out=not completed)
+
+    async def _invoke_timed(
+        self, context: InteractionContext, entry: DispatchEntry, options: Sequence[CommandInteractionOption]
+    ) -> bool:
+        timeout: Timeout | None = entry.timeout or self.timeout
+        if timeout is None:
+            await self._invoke_callback(context, entry, options)
+            return True
+        started: float = time.monotonic()
+        try:
+            await asyncio.wait_for(self._invoke_callback(context, entry, options), timeout.after)
+        # not the builtin on Python 3.10, which the package supports
+        except asyncio.TimeoutError:  # noqa: UP041
+            timeout.record(entry.command.name, time.monotonic() - started)
+            self.__logger.warning("%s timed out after %.2f seconds", entry.command.name, timeout.after)
+            if timeout.response is not None and not context.is_expired and context.state in _FALLBACK_STATES:
+                await context.respond(timeout.response, ephemeral=True)
+            return False
+        return True
+
+    async def _invoke_callback(
+        self, context: InteractionContext, entry: DispatchEntry, options: Sequence[CommandInteractionOption]
+    ) -> None:
+        assert entry.callback is not None
+        interaction: CommandInteraction = context.interaction  # type: ignore
 
-        if isinstance(command, UserCommand):
-            if not hasattr(command, "callback"):
-                raise CommandCallbackNotImplemented(command.name)
-            return await command.callback(context, *interaction.resolved.users.values())  # type: ignore
+        result: Any
+        if isinstance(entry.command, UserCommand):
+            result = entry.callback(context, *interaction.resolved.users.values())  # type: ignore
+        elif isinstance(entry.command, MessageCommand):
+            result = entry.callback(context, *interaction.resolved.messages.values())  # type: ignore
+        else:
+            if entry.binder is not None:
+                context.arguments = entry.binder.bind(interaction, options)
+            result = entry.callback(context, **context.arguments)
 
-        if isinstance(command, MessageCommand):
-            if not hasattr(command, "callback"):
-                raise CommandCallbackNotImplemented(command.name)
-            return await command.callback(context, *interaction.resolved.messages.values())  # type: ignore
+        if entry.streaming:
+            return await ResponseStream(context, interval=self.stream_interval).consume(result)
+        await result
+
+    async def execute_autocomplete(
+        self, interaction: AutocompleteInteraction, entry: DispatchEntry, options: Sequence[CommandInteractionOption]
+    ) -> None:
+        """Respond to an autocomplete interaction with choices of the focused option.
+
+        Cached choices are sent without running the autocomplete callback. Options with
+        a large static set of choices are completed from their choice index.
+
+        Parameters
+        ----------
+        interaction : AutocompleteInteraction
+            The autocomplete interaction.
+        entry : DispatchEntry
+            The compiled route of the command.
+        options : Sequence[CommandInteractionOption]
+            The interaction options that belong to the route.
+        """
+        focused: CommandInteractionOption | None = next(
+            (option for option in options if getattr(option, "is_focused", False)), None
+        )
+        if focused is None:
+            return
+        value: str = "" if focused.value is None else str(focused.value)
+
+        choice_index: ChoiceIndex | None = entry.choice_indexes.get(focused.name)
+        if choice_index is not None:
+            return await self._create_autocomplete_response(
+                interaction,
+                [
+                    AutocompleteChoiceBuilder(name=choice.name, value=choice.value)
+                    for choice in choice_index.search(value, interaction.locale)
+                ],
+            )
+
+        callback: AutocompleteCallbackT | None = entry.autocomplete.get(focused.name)
+        if callback is None:
+            raise CommandCallbackNotImplemented(entry.command.name)
+
+        cache_key: tuple[DispatchEntry, str, str] = (entry, focused.name, value)
+        choices: Sequence[AutocompleteChoiceBuilder] | None = (
+            self.autocomplete_cache.get(cache_key) if self.autocomplete_cache is not None else None
+        )
+        if choices is None:
+            results: Sequence[Choice] = await callback(self.create_context(interaction), value)
+            choices = tuple(
+                AutocompleteChoiceBuilder(name=choice.name, value=choice.value) for choice in results[:MAX_CHOICES]
+            )
+            if self.autocomplete_cache is not None:
+                self.autocomplete_cache.set(cache_key, choices)
+        await self._create_autocomplete_response(interaction, choices)
+
+    async def _create_autocomplete_response(
+        self, interaction: AutocompleteInteraction, choices: Sequence[AutocompleteChoiceBuilder]
+    ) -> None:
+        reply: asyncio.Future[api.InteractionResponseBuilder] | None = self._replies.get(interaction.id)
+        if reply is not None and not reply.done():
+            return reply.set_result(InteractionAutocompleteBuilder(choices))
+        await self.bot.rest.create_autocomplete_response(interaction, interaction.token, choices)
+
+    async def execute_component(self, interaction: ComponentInteraction) -> None:
+        """Execute the component handler matching the custom ID of the interaction.
+
+        Components of running views are handled by their views.
+
+        Parameters
+        ----------
+        interaction : ComponentInteraction
+            The component interaction.
+        """
+        if interaction.custom_id.startswith(f"{VIEW_PREFIX}:"):
+            return await self.views.dispatch(self.create_context(interaction))
+        route: ComponentRoute
+        route, arguments = self.components.resolve(interaction.custom_id)
+        context: InteractionContext = self.create_context(interaction)
+        context.arguments = arguments
+        await route.callback(context, **arguments)
+
+    async def execute_modal(self, interaction: ModalInteraction) -> None:
+        """Execute the modal handler matching the custom ID of the interaction.
+
+        Parameters
+        ----------
+        interaction : ModalInteraction
+            The modal interaction.
+        """
+        route: ModalRoute
+        route, arguments = self.modals.resolve(interaction)
+        context: InteractionContext = self.create_context(interaction)
+        context.arguments = arguments
+        await route.callback(context, **arguments)
 
     async def on_command_interaction(self, event: InteractionCreateEvent) -> None:
         """Handle command interaction events.
 
-        This method processes incoming interaction event and executes the appropriate command.
-
         Parameters
         ----------
         event : InteractionCreateEvent
             The interaction event to handle.
+        """
+        await self.dispatch_interaction(event.interaction)
+
+    async def on_shard_payload(self, event: ShardPayloadEvent) -> None:
+        """Forward the raw payloads of interaction dispatches to the worker pool.
+
+        Parameters
+        ----------
+        event : ShardPayloadEvent
+            The raw event of a shard.
+        """
+        if event.name == "INTERACTION_CREATE":
+            assert self.workers is not None
+            self.workers.submit(event.payload)
+
+    async def on_rest_interaction(
+        self, interaction: PartialInteraction
+    ) -> AsyncGenerator[api.InteractionResponseBuilder | None, None]:
+        """Handle an interaction received by the interaction server of a RESTBot.
+
+        The interaction is dispatched in a task and the initial response created by its handler is
+        yielded to the interaction server, which returns it in the HTTP reply. The handler then
+        continues once the server has taken the reply, see `InteractionContext.delivered`.
+        Nothing is yielded if the handler completes without responding.
+
+        Parameters
+        ----------
+        interaction : PartialInteraction
+            The received interaction.
+
+        Yields
+        ------
+        api.InteractionResponseBuilder | None
+            The initial response to the interaction.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        reply: asyncio.Future[api.InteractionResponseBuilder] = loop.create_future()
+        delivered: asyncio.Future[None] = loop.create_future()
+        self._replies[interaction.id] = reply
+        self._deliveries[interaction.id] = delivered
+        task: asyncio.Task[None] = asyncio.create_task(self.dispatch_interaction(interaction))
+        try:
+            await asyncio.wait((reply, task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            del self._replies[interaction.id]
+            del self._deliveries[interaction.id]
+        try:
+            yield reply.result() if reply.done() else None
+        finally:
+            # resumed by the server after it has built the HTTP reply, or closed
+            delivered.set_result(None)
+        await task
+
+    async def dispatch_interaction(self, interaction: PartialInteraction) -> None:
+        """Dispatch an interaction to its handler.
+
+        This method executes the appropriate command of a command interaction, or responds to an
+        autocomplete interaction of its options. Component and modal interactions are routed by their custom IDs.
+
+        Parameters
+        ----------
+        interaction : PartialInteraction
+            The interaction to dispatch.
 
         Raises
         ------
@@ -262,20 +1009,68 @@ class CommandHandler:
             If a specified sub-command or sub-command group is not found.
         CommandCallbackNotImplemented
             If a required callback method is not implemented for a command.
+        MaxConcurrencyReached
+            If the invocation is rejected by the concurrency limit of the command and the limit has no response.
         CommandNotFound
             If the command specified in the interaction is not found.
+        ComponentNotFound
+            If no component handler matches the custom ID.
+        ModalNotFound
+            If no modal handler matches the custom ID.
         """
-        if isinstance(event.interaction, CommandInteraction):
-            command: BaseCommand | None = None
-            if command_guild_id := event.interaction.registered_guild_id:
-                if event.interaction.guild_id != command_guild_id:
-                    return
-                command = self.guild_commands.get(command_guild_id, {}).get(event.interaction.command_id)
-            else:
-                command = self.global_commands.get(event.interaction.command_id)
+        if self._drain is not None:
+            self._drain.dropped += 1
+            trace("dropped interaction %s while draining", interaction.id)
+            return
+        task: asyncio.Task[Any] | None = asyncio.current_task()
+        if task is None:
+            return await self._dispatch(interaction)
+        self._in_flight[task] = None
+        try:
+            readiness: ReadinessGate | None = self.readiness
+            if readiness is not None and not readiness.is_ready and not await self._wait_ready(interaction, readiness):
+                return
+            await self._dispatch(interaction)
+        finally:
+            del self._in_flight[task]
+
+    async def _wait_ready(self, interaction: PartialInteraction, readiness: ReadinessGate) -> bool:
+        context: InteractionContext | None = None
+        if isinstance(interaction, (CommandInteraction, ComponentInteraction, ModalInteraction)):
+            context = self.create_context(interaction)
+            self._watch_unacknowledged(context)
+        trace("buffering interaction %s until ready", interaction.id)
+        try:
+            ready: bool = await readiness.wait()
+        finally:
+            if context is not None:
+                self.watchdog.unwatch(context)
+        if not ready:
+            self.__logger.warning("dropped interaction %s received before the handler was ready", interaction.id)
+            if (
+                readiness.response is not None
+                and context is not None
+                and not context.is_expired
+                and context.state in _FALLBACK_STATES
+            ):
+                await context.respond(readiness.response, ephemeral=True)
+        return ready
 
-            if not command:
-                raise CommandNotFound(event.interaction.command_name)
+    async def _dispatch(self, interaction: PartialInteraction) -> None:
+        if isinstance(interaction, CommandInteraction):
+            command_guild_id = interaction.registered_guild_id
+            if command_guild_id and interaction.guild_id != command_guild_id:
+                return
 
-            async with timeit(trace, f"completed {event.interaction.command_name} in %.6f seconds"):
-                await self.execute_command(event.interaction, command)
+            entry, options = self._dispatch_table.resolve(interaction)
+            async with timeit(trace, f"completed {interaction.command_name} in %.6f seconds"):
+                await self.execute_command(interaction, entry, options)
+        elif isinstance(interaction, AutocompleteInteraction):
+            entry, options = self._dispatch_table.resolve(interaction)
+            await self.execute_autocomplete(interaction, entry, options)
+        elif isinstance(interaction, ComponentInteraction):
+            async with timeit(trace, f"completed component {interaction.custom_id} in %.6f seconds"):
+                await self.execute_component(interaction)
+        elif isinstance(interaction, ModalInteraction):
+            async with timeit(trace, f"completed modal {interaction.custom_id} in %.6f seconds"):
+                await self.execute_modal(interaction)
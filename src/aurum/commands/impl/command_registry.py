@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from collections.abc import Mapping, Sequence
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import attrs
+from hikari.snowflakes import Snowflake
+
+if TYPE_CHECKING:
+    from hikari.guilds import PartialGuild
+    from hikari.snowflakes import SnowflakeishOr
+
+    from aurum.commands.base_command import BaseCommand
+    from aurum.commands.types import CommandMapping
+
+__all__: Sequence[str] = ("CommandRegistry", "RegistryState")
+
+_VERSION: int = 1
+_GLOBAL_SCOPE: str = "global"
+
+
+@attrs.define(kw_only=True, hash=False, weakref_slot=False)
+class RegistryState:
+    """Command mappings restored from a command registry.
+
+    Attributes
+    ----------
+    global_commands : CommandMapping
+        Mapping of global command IDs to command instances.
+    guild_commands : dict[Snowflake, CommandMapping]
+        Mapping of guild IDs to their command mappings.
+    unknown : list[str]
+        Names of saved commands that are not registered in the handler anymore.
+    missing : list[str]
+        Names of registered commands that have no saved ID.
+    stale : list[str]
+        Names of commands that changed since they were saved.
+    """
+
+    global_commands: CommandMapping = attrs.field(factory=dict)
+    guild_commands: dict[Snowflake, CommandMapping] = attrs.field(factory=dict)
+    unknown: list[str] = attrs.field(factory=list)
+    missing: list[str] = attrs.field(factory=list)
+    stale: list[str] = attrs.field(factory=list)
+
+    @property
+    def is_outdated(self) -> bool:
+        """Whether the registry does not match the registered commands and a sync is needed."""
+        return bool(self.unknown or self.missing or self.stale)
+
+
+class CommandRegistry:
+    """A local file storing command IDs learned during synchronization.
+
+    The registry lets the handler dispatch interactions after a restart without
+    synchronizing commands again.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        Path to the registry file.
+    """
+
+    __slots__: Sequence[str] = ("__logger", "path")
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.__logger: Logger = getLogger("aurum.commands")
+        self.path: Path = Path(path)
+
+    def save(
+        self,
+        global_commands: CommandMapping,
+        guild_commands: Mapping[SnowflakeishOr[PartialGuild], CommandMapping],
+        fingerprints: Mapping[BaseCommand, str],
+    ) -> None:
+        """Atomically write command IDs to the registry file.
+
+        Parameters
+        ----------
+        global_commands : CommandMapping
+            Mapping of global command IDs to command instances.
+        guild_commands : Mapping[SnowflakeishOr[PartialGuild], CommandMapping]
+            Mapping of guild IDs to their command mappings.
+        fingerprints : Mapping[BaseCommand, str]
+            Fingerprints of the synchronized commands.
+        """
+        scopes: dict[str, dict[str, dict[str, Any]]] = {
+            _GLOBAL_SCOPE: self._dump_mapping(global_commands, fingerprints)
+        }
+        for guild, mapping in guild_commands.items():
+            scopes[str(int(guild))] = self._dump_mapping(mapping, fingerprints)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="UTF-8") as fp:
+                json.dump({"version": _VERSION, "scopes": scopes}, fp, separators=(",", ":"))
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        self.__logger.debug("saved command registry to %s", self.path)
+
+    def load(self, commands: Mapping[str, BaseCommand], fingerprints: Mapping[BaseCommand, str]) -> RegistryState:
+        """Restore command mappings from the registry file.
+
+        Parameters
+        ----------
+        commands : Mapping[str, BaseCommand]
+            Registered commands by their names.
+        fingerprints : Mapping[BaseCommand, str]
+            Fingerprints of the registered commands, used to detect changed commands.
+
+        Returns
+        -------
+        RegistryState
+            The restored mappings. If the file does not exist or cannot be read,
+            every registered command is reported as missing.
+        """
+        state: RegistryState = RegistryState()
+        try:
+            with self.path.open(encoding="UTF-8") as fp:
+                data: dict[str, Any] = json.load(fp)
+        except FileNotFoundError:
+            self.__logger.warning("command registry %s does not exist", self.path)
+            data = {}
+        except (OSError, ValueError) as error:
+            self.__logger.error("failed to read command registry %s", self.path, exc_info=error)
+            data = {}
+        if data and data.get("version") != _VERSION:
+            self.__logger.warning("unsupported command registry version %s", data.get("version"))
+            data = {}
+
+        found: set[str] = set()
+        for scope, entries in data.get("scopes", {}).items():
+            mapping: CommandMapping = {}
+            for command_id, entry in entries.items():
+                command: BaseCommand | None = commands.get(entry["name"])
+                if command is None:
+                    state.unknown.append(entry["name"])
+                    continue
+                command_scope: str = str(int(command.guild_id)) if command.guild_id else _GLOBAL_SCOPE
+                if command_scope != scope or fingerprints.get(command, entry.get("fingerprint")) != entry.get(
+                    "fingerprint"
+                ):
+                    state.stale.append(command.name)
+                mapping[Snowflake(command_id)] = command
+                found.add(command.name)
+            if scope == _GLOBAL_SCOPE:
+                state.global_commands = mapping
+            else:
+                state.guild_commands[Snowflake(scope)] = mapping
+        state.missing = [name for name in commands if name not in found]
+        return state
+
+    @staticmethod
+    def _dump_mapping(mapping: CommandMapping, fingerprints: Mapping[BaseCommand, str]) -> dict[str, dict[str, Any]]:
+        return {
+            str(int(command_id)): {"name": command.name, "fingerprint": fingerprints.get(command)}
+            for command_id, command in mapping.items()
+        }
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from enum import Enum
+
+import attrs
+
+__all__: Sequence[str] = ("SyncMode", "SyncReport")
+
+
+class SyncMode(Enum):
+    """Strategy of the command synchronization."""
+
+    BULK = "bulk"
+    """Overwrite every scope with the full set of commands."""
+    DIFF = "diff"
+    """Fetch every scope and only create, update or delete the commands that differ."""
+
+
+@attrs.define(kw_only=True, hash=False, weakref_slot=False)
+class SyncReport:
+    """A report of the command synchronization.
+
+    Notes
+    -----
+        In `SyncMode.BULK` every synchronized command is counted as updated.
+    """
+
+    unchanged: int = attrs.field(default=0)
+    """Number of commands that already matched the remote state."""
+
+    created: int = attrs.field(default=0)
+    """Number of created commands."""
+
+    updated: int = attrs.field(default=0)
+    """Number of updated commands."""
+
+    deleted: int = attrs.field(default=0)
+    """Number of deleted remote commands."""
+
+    failed_scopes: int = attrs.field(default=0)
+    """Number of scopes that failed to synchronize."""
+
+    timings: dict[str, float] = attrs.field(factory=dict)
+    """Time spent on every scope in seconds, including retries, keyed by guild ID or `global`."""
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import attrs
+from hikari.commands import OptionType
+from hikari.interactions import AutocompleteInteraction, CommandInteraction, CommandInteractionOption
+from hikari.snowflakes import Snowflakeish
+
+from aurum.commands.admission import Priority
+from aurum.commands.auto_defer import AutoDefer
+from aurum.commands.base_command import BaseCommand
+from aurum.commands.circuit_breaker import CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency
+from aurum.commands.cooldowns import Cooldown
+from aurum.commands.exceptions import CommandNotFound, SubCommandNotFound
+from aurum.commands.offload import Offload
+from aurum.commands.options import Option
+from aurum.commands.slash_command import SlashCommand, SlashCommandGroup
+from aurum.commands.sub_command import SubCommand
+from aurum.commands.timeouts import Timeout
+from aurum.commands.utils.argument_binder import ArgumentBinder
+from aurum.commands.utils.choice_index import ChoiceIndex
+
+if TYPE_CHECKING:
+    from aurum.commands.types import AutocompleteCallbackT, CommandCallbackT, CommandMapping
+
+__all__: Sequence[str] = ("DispatchEntry", "DispatchKey", "DispatchTable")
+
+DispatchKey = tuple[Snowflakeish, str | None, str | None]
+"""Dispatch key in form of (command id, sub-command group name, sub-command name)."""
+
+
+def _inherit(command: BaseCommand, sub_command: SubCommand | None, name: str) -> Any:  # noqa: ANN401
+    """Get a policy of a sub-command, falling back to the policy of its command."""
+    # the policies have different types, each passed to the attrs field typed for it
+    value: Any = getattr(sub_command, name) if sub_command is not None else None
+    return getattr(command, name) if value is None else value
+
+
+@attrs.define(kw_only=True, frozen=True, eq=False, weakref_slot=False)
+class DispatchEntry:
+    """A compiled route to a command callback.
+
+    Parameters
+    ----------
+    command : BaseCommand
+        The top-level command of this route.
+    sub_command : SubCommand | None
+        The sub-command of this route, if it is a sub-command of a group.
+    callback : CommandCallbackT | None
+        The callback, already bound to its command group where needed.
+    binder : ArgumentBinder | None
+        The argument binder of the route, None for context menu commands.
+    max_concurrency : MaxConcurrency | None
+        The concurrency limit of the route.
+    cooldown : Cooldown | None
+        The cooldown of the route.
+    auto_defer : AutoDefer | None
+        The auto-defer policy of the route.
+    priority : Priority | None
+        The load shedding priority of the route.
+    offload : Offload | None
+        The offload policy of the route.
+    timeout : Timeout | None
+        The time limit of the route callback.
+    circuit_breaker : CircuitBreaker | None
+        The circuit breaker of the route.
+    streaming : bool
+        Whether the callback is an async generator streaming the response.
+    autocomplete : Mapping[str, AutocompleteCallbackT]
+        Autocomplete callbacks of the route options by the option names.
+    choice_indexes : Mapping[str, ChoiceIndex]
+        Choice indexes of the route options completed without a callback, by the option names.
+    """
+
+    command: BaseCommand = attrs.field()
+    sub_command: SubCommand | None = attrs.field(default=None)
+    callback: CommandCallbackT | None = attrs.field(default=None, repr=False)
+    binder: ArgumentBinder | None = attrs.field(default=None, repr=False)
+    max_concurrency: MaxConcurrency | None = attrs.field(default=None, repr=False)
+    cooldown: Cooldown | None = attrs.field(default=None, repr=False)
+    auto_defer: AutoDefer | None = attrs.field(default=None, repr=False)
+    priority: Priority | None = attrs.field(default=None, repr=False)
+    offload: Offload | None = attrs.field(default=None, repr=False)
+    timeout: Timeout | None = attrs.field(default=None, repr=False)
+    circuit_breaker: CircuitBreaker | None = attrs.field(default=None, repr=False)
+    streaming: bool = attrs.field(default=False, repr=False)
+    autocomplete: Mapping[str, AutocompleteCallbackT] = attrs.field(factory=dict, repr=False)
+    choice_indexes: Mapping[str, ChoiceIndex] = attrs.field(factory=dict, repr=False)
+
+
+class DispatchTable:
+    """A flat, immutable table of routes for command interactions.
+
+    The table is compiled once the command IDs are known, so routing an interaction
+    is a single lookup without reflection or allocation of bound methods.
+    """
+
+    __slots__: Sequence[str] = ("_commands", "_entries")
+
+    def __init__(self) -> None:
+        self._commands: Mapping[Snowflakeish, BaseCommand] = MappingProxyType({})
+        self._entries: Mapping[DispatchKey, DispatchEntry] = MappingProxyType({})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def entries(self) -> Mapping[DispatchKey, DispatchEntry]:
+        return self._entries
+
+    def compile(self, *mappings: CommandMapping) -> None:
+        """Compile routes for the given command mappings, replacing the current ones.
+
+        Parameters
+        ----------
+        *mappings : CommandMapping
+            Mappings of command IDs to command instances.
+        """
+        commands: dict[Snowflakeish, BaseCommand] = {}
+        entries: dict[DispatchKey, DispatchEntry] = {}
+        for mapping in mappings:
+            for command_id, command in mapping.items():
+                commands[command_id] = command
+                entries.update(self._compile_command(command_id, command))
+        self._commands = MappingProxyType(commands)
+        self._entries = MappingProxyType(entries)
+
+    def clear(self) -> None:
+        self._commands = MappingProxyType({})
+        self._entries = MappingProxyType({})
+
+    def _compile_command(self, command_id: Snowflakeish, command: BaseCommand) -> dict[DispatchKey, DispatchEntry]:
+        if isinstance(command, SlashCommand):
+            callback: CommandCallbackT | None = command._callback  # type: ignore
+            return {(command_id, None, None): self._compile_entry(command, None, callback, command.binder)}
+        if isinstance(command, SlashCommandGroup):
+            entries: dict[DispatchKey, DispatchEntry] = {}
+            for wrapper in command.get_sub_commands().values():
+                sub_command: SubCommand = wrapper.command
+                if sub_command.sub_command_group is not None:
+                    continue  # children are compiled with their group
+                if sub_command.sub_commands:
+                    for child in sub_command.sub_commands.values():
+                        entries[(command_id, sub_command.name, child.command.name)] = self._compile_entry(
+                            command, child.command, child.method(command), child.command.binder
+                        )
+                    continue
+                entries[(command_id, None, sub_command.name)] = self._compile_entry(
+                    command, sub_command, wrapper.method(command), sub_command.binder
+                )
+            return entries
+        return {(command_id, None, None): self._compile_entry(command, None, getattr(command, "callback", None), None)}
+
+    @staticmethod
+    def _compile_entry(
+        command: BaseCommand,
+        sub_command: SubCommand | None,
+        callback: CommandCallbackT | None,
+        binder: ArgumentBinder | None,
+    ) -> DispatchEntry:
+        options: Sequence[Option] = getattr(sub_command or command, "options", None) or ()
+        return DispatchEntry(
+            command=command,
+            sub_command=sub_command,
+            callback=callback,
+            binder=binder,
+            max_concurrency=_inherit(command, sub_command, "max_concurrency"),
+            cooldown=_inherit(command, sub_command, "cooldown"),
+            auto_defer=_inherit(command, sub_command, "auto_defer"),
+            priority=_inherit(command, sub_command, "priority"),
+            offload=_inherit(command, sub_command, "offload"),
+            timeout=_inherit(command, sub_command, "timeout"),
+            circuit_breaker=_inherit(command, sub_command, "circuit_breaker"),
+            streaming=inspect.isasyncgenfunction(callback),
+            autocomplete=MappingProxyType(
+                {option.name: option.autocomplete for option in options if option.autocomplete is not None}
+            ),
+            choice_indexes=MappingProxyType(
+                {
+                    option.name: option.choice_index
+                    for option in options
+                    if option.choice_index is not None and option.autocomplete is None
+                }
+            ),
+        )
+
+    def resolve(
+        self, interaction: CommandInteraction | AutocompleteInteraction
+    ) -> tuple[DispatchEntry, Sequence[CommandInteractionOption]]:
+        """Resolve the route of a command or autocomplete interaction.
+
+        Parameters
+        ----------
+        interaction : CommandInteraction | AutocompleteInteraction
+            The interaction to route.
+
+        Returns
+        -------
+        tuple[DispatchEntry, Sequence[CommandInteractionOption]]
+            The route entry and the options that belong to its callback.
+
+        Raises
+        ------
+        CommandNotFound
+            If the command ID is unknown.
+        SubCommandNotFound
+            If the sub-command or sub-command group is unknown.
+        """
+        command_id = interaction.command_id
+        options: Sequence[CommandInteractionOption] = interaction.options or ()
+        group_name: str | None = None
+        sub_command_name: str | None = None
+        if options and options[0].type == OptionType.SUB_COMMAND_GROUP:
+            group_name = options[0].name
+            options = options[0].options or ()
+        if options and options[0].type == OptionType.SUB_COMMAND:
+            sub_command_name = options[0].name
+            options = options[0].options or ()
+
+        entry: DispatchEntry | None = self._entries.get((command_id, group_name, sub_command_name))
+        if entry is not None:
+            return entry, options
+
+        command: BaseCommand | None = self._commands.get(command_id)
+        if command is None:
+            raise CommandNotFound(interaction.command_name)
+        raise SubCommandNotFound(command.name, group_name or "", sub_command_name or "")
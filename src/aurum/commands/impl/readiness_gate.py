@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Sequence
+
+__all__: Sequence[str] = ("ReadinessGate",)
+
+
+class ReadinessGate:
+    """A barrier holding the interactions received before the command tables are ready.
+
+    The gate is closed until the command handler compiles its dispatch table or finishes
+    starting. Interactions received meanwhile wait in a bounded buffer and are dispatched
+    in the order they were received as soon as the gate opens.
+
+    Parameters
+    ----------
+    max_size : int, default 1000
+        Maximum number of buffered interactions. Interactions over it are dropped.
+    max_wait : float, default 30.0
+        Maximum time in seconds an interaction waits for the gate before it is dropped.
+    response : str | None, default "The bot is starting, try again in a moment."
+        Ephemeral response to the dropped interactions, None to send nothing.
+
+    Notes
+    -----
+        The command handler auto-defers the buffered interactions before their acknowledgement
+        deadlines, so waiting longer than 3 seconds only delays their responses. Component
+        interactions are deferred as updates of their messages, so their handlers can still update them.
+    """
+
+    __slots__: Sequence[str] = (
+        "max_size",
+        "max_wait",
+        "response",
+        "_ready",
+        "_closed_at",
+        "_time_to_ready",
+        "_buffered",
+        "_replayed",
+        "_dropped",
+        "_expired",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 1000,
+        max_wait: float = 30.0,
+        response: str | None = "The bot is starting, try again in a moment.",
+    ) -> None:
+        self.max_size: int = max_size
+        self.max_wait: float = max_wait
+        self.response: str | None = response
+        self._ready: asyncio.Event = asyncio.Event()
+        self._closed_at: float = time.monotonic()
+        self._time_to_ready: float | None = None
+        self._buffered: int = 0
+        self._replayed: int = 0
+        self._dropped: int = 0
+        self._expired: int = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the gate is open."""
+        return self._ready.is_set()
+
+    @property
+    def time_to_ready(self) -> float | None:
+        """Time in seconds from the last closing of the gate, or its creation, to its opening.
+
+        None while the gate is closed.
+        """
+        return self._time_to_ready
+
+    @property
+    def buffered(self) -> int:
+        """Number of interactions waiting for the gate."""
+        return self._buffered
+
+    @property
+    def replayed(self) -> int:
+        """Number of buffered interactions dispatched after the gate opened."""
+        return self._replayed
+
+    @property
+    def dropped(self) -> int:
+        """Number of interactions dropped because the buffer was full."""
+        return self._dropped
+
+    @property
+    def expired(self) -> int:
+        """Number of buffered interactions dropped after waiting `max_wait`."""
+        return self._expired
+
+    def open(self) -> None:
+        """Open the gate, releasing the buffered interactions."""
+        if not self._ready.is_set():
+            self._time_to_ready = time.monotonic() - self._closed_at
+            self._ready.set()
+
+    def close(self) -> None:
+        """Close the gate, buffering the interactions received from now on."""
+        if self._ready.is_set():
+            self._closed_at = time.monotonic()
+            self._time_to_ready = None
+            self._ready.clear()
+
+    async def wait(self) -> bool:
+        """Wait for the gate to open.
+
+        Returns
+        -------
+        bool
+            True if the gate is open, False if the interaction was dropped.
+        """
+        if self._ready.is_set():
+            return True
+        if self._buffered >= self.max_size:
+            self._dropped += 1
+            return False
+        self._buffered += 1
+        try:
+            await asyncio.wait_for(self._ready.wait(), self.max_wait)
+        # not the builtin on Python 3.10, which the package supports
+        except asyncio.TimeoutError:  # noqa: UP041
+            self._expired += 1
+            return False
+        finally:
+            self._buffered -= 1
+        self._replayed += 1
+        return True
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+from collections.abc import Callable, Mapping, Sequence
+from logging import Logger, getLogger
+from queue import Empty
+from typing import TYPE_CHECKING, Any
+
+from aurum.commands.buckets import BucketType
+from aurum.utils.hash_ring import HashRing
+
+if TYPE_CHECKING:
+    from multiprocessing.context import SpawnProcess
+    from multiprocessing.queues import Queue
+
+    from aurum.commands.impl.command_handler import CommandHandler
+
+__all__: Sequence[str] = ("WorkerPool",)
+
+HandlerFactoryT = Callable[[], "CommandHandler"]
+
+_BATCH_SIZE: int = 256
+
+
+class WorkerPool:
+    """A pool of processes executing interactions forwarded by the receiving process.
+
+    Raw interaction payloads are routed to the workers by a consistent hash of their bucket
+    keys, so the interactions of one key are dispatched by one worker in the order they were
+    received. Each worker builds its own command handler and responds through REST.
+
+    Parameters
+    ----------
+    factory : HandlerFactoryT
+        A picklable function building the command handler of a worker, with the same commands
+        as the receiving handler. The handler must be built with a RESTBot, which is not started
+        in the workers, only its REST client is. Command IDs are loaded as on start of the handler,
+        so the handler should have a registry.
+    workers : int | None, optional
+        Number of worker processes, by default the number of CPU cores.
+    bucket : BucketType, default BucketType.GUILD
+        Scope by which the interactions are routed.
+    replicas : int, default 100
+        Number of points of each worker on the hash ring.
+
+    Notes
+    -----
+        Workers are started with the spawn method, so the factory must be importable
+        from the worker processes.
+
+        Every interaction is forwarded through a queue between processes, so the pool only
+        pays off for CPU-bound commands on a host with spare cores. With fewer cores than
+        workers, the throughput drops as workers are added. The throughput gain on multi-core
+        hosts has not been measured yet, see `benchmarks/worker_pool.py`.
+    """
+
+    __slots__: Sequence[str] = (
+        "__logger",
+        "factory",
+        "workers",
+        "bucket",
+        "_ring",
+        "_queues",
+        "_processes",
+        "_submitted",
+    )
+
+    def __init__(
+        self,
+        factory: HandlerFactoryT,
+        *,
+        workers: int | None = None,
+        bucket: BucketType = BucketType.GUILD,
+        replicas: int = 100,
+    ) -> None:
+        self.__logger: Logger = getLogger("aurum.commands")
+        self.factory: HandlerFactoryT = factory
+        self.workers: int = workers or os.cpu_count() or 1
+        self.bucket: BucketType = bucket
+        self._ring: HashRing[int] = HashRing(range(self.workers), replicas=replicas)
+        self._queues: list[Queue[Mapping[str, Any] | None]] = []
+        self._processes: list[SpawnProcess] = []
+        self._submitted: list[int] = [0] * self.workers
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker processes are started."""
+        return bool(self._processes)
+
+    @property
+    def submitted(self) -> Sequence[int]:
+        """Number of interactions submitted to each worker."""
+        return tuple(self._submitted)
+
+    def start(self) -> None:
+        """Start the worker processes."""
+        if self._processes:
+            return
+        context = multiprocessing.get_context("spawn")
+        for index in range(self.workers):
+            queue: Queue[Mapping[str, Any] | None] = context.Queue()
+            process: SpawnProcess = context.Process(
+                target=_run_worker, args=(self.factory, queue), name=f"aurum-worker-{index}", daemon=True
+            )
+            process.start()
+            self._queues.append(queue)
+            self._processes.append(process)
+        self.__logger.debug("started %s workers", self.workers)
+
+    def submit(self, payload: Mapping[str, Any]) -> None:
+        """Forward a raw interaction payload to its worker.
+
+        Parameters
+        ----------
+        payload : Mapping[str, Any]
+            The raw payload of an interaction, as received in an INTERACTION_CREATE dispatch.
+        """
+        index: int = self._ring.get(self.bucket.get_payload_key(payload))
+        self._queues[index].put_nowait(payload)
+        self._submitted[index] += 1
+
+    async def stop(self, timeout: float | None = 30.0) -> None:
+        """Stop the workers after they dispatch the submitted interactions.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Time in seconds to wait for each worker before it is terminated, by default 30.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        for queue in self._queues:
+            queue.put_nowait(None)
+        for process in self._processes:
+            await loop.run_in_executor(None, process.join, timeout)
+            if process.is_alive():
+                self.__logger.warning("terminating %s", process.name)
+                process.terminate()
+        for queue in self._queues:
+            queue.close()
+        self._queues.clear()
+        self._processes.clear()
+
+
+def _receive(queue: Queue[Mapping[str, Any] | None]) -> list[Mapping[str, Any] | None]:
+    """Wait for a payload, then take the waiting ones without blocking, at most `_BATCH_SIZE` at once."""
+    payloads: list[Mapping[str, Any] | None] = [queue.get()]
+    with contextlib.suppress(Empty):
+        while len(payloads) < _BATCH_SIZE:
+            payloads.append(queue.get_nowait())
+    return payloads
+
+
+def _run_worker(factory: HandlerFactoryT, queue: Queue[Mapping[str, Any] | None]) -> None:
+    asyncio.run(_serve(factory, queue))
+
+
+async def _serve(factory: HandlerFactoryT, queue: Queue[Mapping[str, Any] | None]) -> None:
+    logger: Logger = getLogger("aurum.commands")
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    handler: CommandHandler = factory()
+    handler.bot.rest.start()  # type: ignore
+    await handler.start(handler.bot)  # type: ignore
+
+    tasks: set[asyncio.Task[None]] = set()
+
+    def finish(task: asyncio.Task[None]) -> None:
+        tasks.discard(task)
+        if not task.cancelled() and (error := task.exception()) is not None:
+            logger.error("failed to dispatch an interaction", exc_info=error)
+
+    try:
+        running: bool = True
+        while running:
+            for payload in await loop.run_in_executor(None, _receive, queue):
+                if payload is None:
+                    running = False
+                    break
+                interaction: Any = handler.bot.entity_factory.deserialize_interaction(payload)
+                task: asyncio.Task[None] = asyncio.create_task(handler.dispatch_interaction(interaction))
+                tasks.add(task)
+                task.add_done_callback(finish)
+        if tasks:
+            await asyncio.wait(tasks)
+    finally:
+        await handler.stop(handler.bot)  # type: ignore
+        await handler.bot.rest.close()  # type: ignore
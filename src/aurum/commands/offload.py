@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import importlib
+import time
+from collections.abc import Callable, Coroutine, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, ParamSpec, TypeVar
+
+__all__: Sequence[str] = ("ExecutionMode", "Offload", "OffloadStats", "offload")
+
+ParamsT = ParamSpec("ParamsT")
+ResultT = TypeVar("ResultT")
+
+_current: contextvars.ContextVar[tuple[Offload, str] | None] = contextvars.ContextVar("aurum_offload", default=None)
+
+
+class ExecutionMode(Enum):
+    """Where the offloaded parts of a command run."""
+
+    INLINE = "inline"
+    """In the event loop, blocking it."""
+    THREAD = "thread"
+    """In a thread pool. Arguments and results are shared, not copied."""
+    PROCESS = "process"
+    """In a process pool. Arguments and results are pickled."""
+
+
+class OffloadStats:
+    """Offload timings of one command.
+
+    Attributes
+    ----------
+    calls : int
+        Number of offloaded calls.
+    wait_time : float
+        Total time in seconds the calls waited in the queue of the pool.
+    run_time : float
+        Total time in seconds the calls ran.
+    """
+
+    __slots__: Sequence[str] = ("calls", "wait_time", "run_time")
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.wait_time: float = 0.0
+        self.run_time: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"OffloadStats(calls={self.calls}, wait_time={self.wait_time:.6f}, run_time={self.run_time:.6f})"
+
+    @property
+    def mean_wait_time(self) -> float:
+        """Mean time in seconds a call waited in the queue of the pool."""
+        return self.wait_time / self.calls if self.calls else 0.0
+
+    @property
+    def mean_run_time(self) -> float:
+        """Mean time in seconds a call ran."""
+        return self.run_time / self.calls if self.calls else 0.0
+
+
+class Offload:
+    """An execution policy of the functions decorated with `offload` called by a command.
+
+    The command callback keeps running in the event loop, so the context response methods
+    work as usual, while the decorated functions run where the policy says.
+
+    Parameters
+    ----------
+    mode : ExecutionMode, default ExecutionMode.THREAD
+        Where the offloaded functions run.
+    max_workers : int | None, optional
+        Size of the pool, by default chosen by the executor.
+
+    Notes
+    -----
+        Sharing one instance between commands makes them share the pool.
+        The pool is created on the first offloaded call.
+    """
+
+    __slots__: Sequence[str] = ("mode", "max_workers", "_executor", "_stats")
+
+    def __init__(self, mode: ExecutionMode = ExecutionMode.THREAD, *, max_workers: int | None = None) -> None:
+        self.mode: ExecutionMode = mode
+        self.max_workers: int | None = max_workers
+        self._executor: Executor | None = None
+        self._stats: dict[str, OffloadStats] = {}
+
+    @property
+    def stats(self) -> Mapping[str, OffloadStats]:
+        """Offload timings by command names."""
+        return self._stats
+
+    async def run(
+        self, name: str, func: Callable[ParamsT, ResultT], *args: ParamsT.args, **kwargs: ParamsT.kwargs
+    ) -> ResultT:
+        """Run a function with this policy.
+
+        Parameters
+        ----------
+        name : str
+            Name of the command, used for the timings.
+        func : Callable[ParamsT, ResultT]
+            The function. With `ExecutionMode.PROCESS` it must be picklable, functions
+            decorated with `offload` are pickled by reference to the original function
+            and memoryviews are passed as bytes.
+        *args : ParamsT.args
+            Positional arguments of the function.
+        **kwargs : ParamsT.kwargs
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        ResultT
+            The result of the function.
+        """
+        reference: tuple[str, str] | None = getattr(func, "__offload_reference__", None)
+        target: Callable[..., ResultT] = getattr(func, "__wrapped__", func) if reference is not None else func
+        return await self._run(name, target, reference, args, kwargs)
+
+    async def _run(
+        self,
+        name: str,
+        target: Callable[..., ResultT],
+        reference: tuple[str, str] | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> ResultT:
+        stats: OffloadStats = self._stats.get(name) or self._stats.setdefault(name, OffloadStats())
+        submitted: float = time.monotonic()
+        if self.mode is ExecutionMode.INLINE:
+            result: ResultT = target(*args, **kwargs)
+            started: float = submitted
+        else:
+            call: Callable[[], tuple[float, Any]]
+            if self.mode is ExecutionMode.PROCESS:
+                call = functools.partial(
+                    _timed_portable,
+                    reference or target,
+                    tuple(map(_portable, args)),
+                    {key: _portable(value) for key, value in kwargs.items()},
+                )
+            else:
+                call = functools.partial(_timed, target, args, kwargs)
+            started, result = await asyncio.get_running_loop().run_in_executor(self._get_executor(), call)
+        stats.calls += 1
+        stats.wait_time += started - submitted
+        stats.run_time += time.monotonic() - started
+        return result
+
+    def bind(self, name: str) -> contextvars.Token[tuple[Offload, str] | None]:
+        """Make this policy the policy of the functions decorated with `offload` in the current context.
+
+        Parameters
+        ----------
+        name : str
+            Name of the command, used for the timings.
+
+        Returns
+        -------
+        contextvars.Token[tuple[Offload, str] | None]
+            The token to reset the binding with `unbind`.
+        """
+        return _current.set((self, name))
+
+    @staticmethod
+    def unbind(token: contextvars.Token[tuple[Offload, str] | None]) -> None:
+        """Reset a binding made with `bind`.
+
+        Parameters
+        ----------
+        token : contextvars.Token[tuple[Offload, str] | None]
+            The token returned by `bind`.
+        """
+        _current.reset(token)
+
+    def shutdown(self) -> None:
+        """Shut down the pool without waiting for the running calls."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = (
+                ProcessPoolExecutor(self.max_workers)
+                if self.mode is ExecutionMode.PROCESS
+                else ThreadPoolExecutor(self.max_workers, thread_name_prefix="aurum-offload")
+            )
+        return self._executor
+
+
+def _timed(func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[float, Any]:
+    # the monotonic clock is shared by the processes of one host
+    started: float = time.monotonic()
+    return started, func(*args, **kwargs)
+
+
+def _portable(value: object) -> object:
+    # memoryviews cannot be pickled, bytes are pickled as they are
+    return value.tobytes() if isinstance(value, memoryview) else value
+
+
+def _timed_portable(
+    func: Callable[..., Any] | tuple[str, str], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[float, Any]:
+    if isinstance(func, tuple):
+        module, qualname = func
+        target: Any = importlib.import_module(module)
+        for attribute in qualname.split("."):
+            target = getattr(target, attribute)
+        func = target.__wrapped__
+    started, result = _timed(func, args, kwargs)
+    return started, _portable(result)
+
+
+# type parameter syntax needs Python 3.12, the package supports 3.10
+def offload(func: Callable[ParamsT, ResultT]) -> Callable[ParamsT, Coroutine[Any, Any, ResultT]]:  # noqa: UP047
+    """Make a blocking function awaitable, running it with the offload policy of the calling command.
+
+    Outside of a command with an `Offload` policy, the function runs inline.
+
+    Parameters
+    ----------
+    func : Callable[ParamsT, ResultT]
+        The blocking function. With `ExecutionMode.PROCESS` it is pickled by reference.
+
+    Returns
+    -------
+    Callable[ParamsT, Coroutine[Any, Any, ResultT]]
+        An async function running the blocking function and returning its result.
+
+    Notes
+    -----
+        Results such as `bytes` or `memoryview` can be wrapped in `hikari.Bytes` and sent as
+        attachments as they are. With `ExecutionMode.THREAD` they are not copied on the way.
+    """
+
+    reference: tuple[str, str] = (func.__module__, func.__qualname__)
+
+    @functools.wraps(func)
+    async def wrapper(*args: ParamsT.args, **kwargs: ParamsT.kwargs) -> ResultT:
+        current: tuple[Offload, str] | None = _current.get()
+        if current is None:
+            return func(*args, **kwargs)
+        policy, name = current
+        # pickled by reference to the wrapper, which is what the module attribute holds
+        return await policy._run(name, func, reference, args, kwargs)
+
+    wrapper.__offload_reference__ = reference  # type: ignore
+    return wrapper
@@ -4,8 +4,10 @@ from typing import Any
 import attrs
 from hikari.channels import ChannelType
 from hikari.commands import OptionType
+from hikari.undefined import UNDEFINED, UndefinedOr
 
-from aurum.commands.types import Localized
+from aurum.commands.types import AutocompleteCallbackT, Localized
+from aurum.commands.utils.choice_index import MAX_CHOICES, ChoiceIndex
 
 __all__: Sequence[str] = ("Choice", "Option")
 
@@ -60,6 +62,20 @@ class Option:
         Minimum value for number input (integer options only)
     channel_types : Sequence[ChannelType], optional
         Allowed channel types (channel options only)
+    default : Any, optional
+        Value passed to the callback when an optional option is not provided.
+        If not set, the option is omitted from the callback arguments.
+    autocomplete : AutocompleteCallbackT or None, optional
+        Callback returning choices for the current value of the option. It receives
+        the interaction context and the current value, and its results may be cached
+        and shared between users.
+
+    Attributes
+    ----------
+    choice_index : ChoiceIndex | None
+        The search index of the choices, built on creation when there are more choices
+        than Discord accepts. Such options are registered with autocomplete instead of
+        choices and are completed from the index unless an autocomplete callback is set.
     """
 
     type: OptionType = attrs.field(eq=True)
@@ -77,3 +93,14 @@ class Option:
     max_value: int | None = attrs.field(default=None, repr=False, eq=False)
     min_value: int | None = attrs.field(default=None, repr=False, eq=False)
     channel_types: Sequence[ChannelType] = attrs.field(factory=tuple, repr=False, eq=False)
+    default: UndefinedOr[Any] = attrs.field(default=UNDEFINED, repr=False, eq=False)
+    autocomplete: AutocompleteCallbackT | None = attrs.field(default=None, repr=False, eq=False)
+
+    choice_index: ChoiceIndex | None = attrs.field(
+        init=False,
+        repr=False,
+        eq=False,
+        default=attrs.Factory(
+            lambda self: ChoiceIndex(self.choices) if len(self.choices) > MAX_CHOICES else None, takes_self=True
+        ),
+    )
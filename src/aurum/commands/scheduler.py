@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import Hashable, Mapping, Sequence
+
+from aurum.commands.admission import Priority
+from aurum.commands.buckets import BucketType
+
+__all__: Sequence[str] = ("FairScheduler",)
+
+
+class _Class:
+    """Queues of one priority class, served by deficit round-robin."""
+
+    __slots__: Sequence[str] = ("queues", "ring", "deficits")
+
+    def __init__(self) -> None:
+        self.queues: dict[Hashable, deque[asyncio.Future[None]]] = {}
+        self.ring: deque[Hashable] = deque()
+        self.deficits: dict[Hashable, int] = {}
+
+
+class FairScheduler:
+    """A scheduler of the command invocations, fair across buckets.
+
+    At most `max_in_flight` invocations run at once. The others wait in a queue per bucket
+    and priority class. Higher priority classes are served first. Within a class, the
+    buckets with waiting invocations take turns by deficit round-robin: a bucket is served
+    up to `quantum` invocations per turn, so a bucket flooding the bot delays the others by
+    at most one turn instead of by its whole backlog.
+
+    Parameters
+    ----------
+    max_in_flight : int, default 32
+        Maximum number of running invocations.
+    bucket : BucketType, default BucketType.GUILD
+        Scope by which the invocations are queued.
+    quantum : int, default 1
+        Number of invocations of a bucket served per turn.
+
+    Notes
+    -----
+        Invocations run without queueing while the scheduler is below the limit and
+        nothing waits, so an idle scheduler costs only a counter update.
+    """
+
+    __slots__: Sequence[str] = ("max_in_flight", "bucket", "quantum", "_classes", "_depths", "_in_flight", "_queued")
+
+    def __init__(self, *, max_in_flight: int = 32, bucket: BucketType = BucketType.GUILD, quantum: int = 1) -> None:
+        self.max_in_flight: int = max_in_flight
+        self.bucket: BucketType = bucket
+        self.quantum: int = quantum
+        # highest priority first
+        self._classes: dict[Priority, _Class] = {priority: _Class() for priority in sorted(Priority, reverse=True)}
+        self._depths: dict[Hashable, int] = {}
+        self._in_flight: int = 0
+        self._queued: int = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of running invocations."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of queued invocations across all buckets."""
+        return self._queued
+
+    @property
+    def queue_depths(self) -> Mapping[Hashable, int]:
+        """Number of queued invocations by bucket keys, only of the buckets with queued invocations."""
+        return self._depths
+
+    def queue_depth(self, key: Hashable) -> int:
+        """Get the number of invocations queued in a bucket.
+
+        Parameters
+        ----------
+        key : Hashable
+            The bucket key.
+
+        Returns
+        -------
+        int
+            The number of queued invocations.
+        """
+        return self._depths.get(key, 0)
+
+    async def acquire(self, key: Hashable, priority: Priority = Priority.NORMAL) -> None:
+        """Acquire a running slot, waiting for the turn of the bucket if needed.
+
+        Parameters
+        ----------
+        key : Hashable
+            The bucket key.
+        priority : Priority, default Priority.NORMAL
+            Priority class of the invocation.
+        """
+        if self._in_flight < self.max_in_flight and not self._queued:
+            self._in_flight += 1
+            return
+
+        queues: _Class = self._classes[priority]
+        queue: deque[asyncio.Future[None]] | None = queues.queues.get(key)
+        if queue is None:
+            queue = queues.queues[key] = deque()
+            queues.ring.append(key)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        self._depths[key] = self._depths.get(key, 0) + 1
+        self._queued += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # the slot was handed over right before the cancellation
+            elif future in queue:
+                # a waiter cancelled while its slot is released may be popped already
+                queue.remove(future)
+                self._dequeued(key)
+                if not queue:
+                    self._discard(queues, key)
+            raise
+
+    def release(self) -> None:
+        """Release a running slot, handing it over to the next queued invocation."""
+        while self._queued:
+            waiter: asyncio.Future[None] = self._next()
+            # skip waiters cancelled in this loop iteration, their tasks have not run the cancellation yet
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _next(self) -> asyncio.Future[None]:
+        queues: _Class = next(queues for queues in self._classes.values() if queues.ring)
+        key: Hashable = queues.ring[0]
+        deficit: int = queues.deficits.get(key) or self.quantum
+        queue: deque[asyncio.Future[None]] = queues.queues[key]
+        waiter: asyncio.Future[None] = queue.popleft()
+        self._dequeued(key)
+        if not queue:
+            self._discard(queues, key)
+        elif deficit <= 1:
+            queues.deficits.pop(key, None)
+            queues.ring.rotate(-1)
+        else:
+            queues.deficits[key] = deficit - 1
+        return waiter
+
+    def _dequeued(self, key: Hashable) -> None:
+        self._queued -= 1
+        depth: int = self._depths[key] - 1
+        if depth:
+            self._depths[key] = depth
+        else:
+            del self._depths[key]
+
+    @staticmethod
+    def _discard(queues: _Class, key: Hashable) -> None:
+        del queues.queues[key]
+        queues.deficits.pop(key, None)
+        with contextlib.suppress(ValueError):
+            queues.ring.remove(key)
@@ -9,11 +9,19 @@ from hikari.guilds import PartialGuild
 from hikari.permissions import Permissions
 from hikari.snowflakes import SnowflakeishOr
 
+from aurum.commands.admission import Priority
+from aurum.commands.auto_defer import AutoDefer
 from aurum.commands.base_command import BaseCommand
+from aurum.commands.circuit_breaker import CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency
+from aurum.commands.cooldowns import Cooldown
 from aurum.commands.exceptions import CommandCallbackNotImplemented
+from aurum.commands.offload import Offload
 from aurum.commands.options import Option
 from aurum.commands.sub_command import SubCommandMethod
+from aurum.commands.timeouts import Timeout
 from aurum.commands.types import Localized
+from aurum.commands.utils.argument_binder import ArgumentBinder
 
 if TYPE_CHECKING:
     from aurum.commands.types import CommandCallbackT
@@ -29,7 +37,8 @@ class SlashCommand(BaseCommand):
     name : str
         The name of the command
     callback : CommandCallbackT | None, optional
-        The callback function to be executed when command is invoked
+        The callback function to be executed when command is invoked. An async generator
+        callback streams its yielded values into the response, see `ResponseStream`.
     name_localizations : Localized | None, optional
         The command name localizations.
     description : str | None, optional
@@ -48,6 +57,20 @@ class SlashCommand(BaseCommand):
         Whether command is NSFW.
     guild_id : SnowflakeishOr[PartialGuild] | None, optional
         Guild ID if command is guild-specific.
+    max_concurrency : MaxConcurrency | None, optional
+        Limit of in-flight invocations of the command.
+    cooldown : Cooldown | None, optional
+        Token bucket cooldown of the command.
+    auto_defer : AutoDefer | None, optional
+        Auto-defer policy of the command, overrides the policy of the handler.
+    offload : Offload | None, optional
+        Offload policy of the functions decorated with `offload` called by the command.
+    priority : Priority | None, optional
+        Priority of the command under load shedding, `Priority.NORMAL` if not set.
+    timeout : Timeout | None, optional
+        Time limit of the callback, by default the time limit of the handler.
+    circuit_breaker : CircuitBreaker | None, optional
+        Circuit breaker short-circuiting the command while it is failing.
 
     Attributes
     ----------
@@ -57,6 +80,8 @@ class SlashCommand(BaseCommand):
         The command description localizations.
     options : Sequence[Option] | None
         The command options.
+    binder : ArgumentBinder
+        The argument binder generated from the command options.
     """
 
     __slots__: Sequence[str] = (
@@ -65,6 +90,7 @@ class SlashCommand(BaseCommand):
         "_description",
         "_description_localizations",
         "_options",
+        "_binder",
     )
     _command_type: CommandType = CommandType.SLASH
 
@@ -81,6 +107,13 @@ class SlashCommand(BaseCommand):
         is_dm_enabled: bool = False,
         is_nsfw: bool = False,
         guild_id: SnowflakeishOr[PartialGuild] | None = None,
+        max_concurrency: MaxConcurrency | None = None,
+        cooldown: Cooldown | None = None,
+        auto_defer: AutoDefer | None = None,
+        offload: Offload | None = None,
+        priority: Priority | None = None,
+        timeout: Timeout | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         super().__init__(
             name=name,
@@ -89,6 +122,13 @@ class SlashCommand(BaseCommand):
             is_dm_enabled=is_dm_enabled,
             is_nsfw=is_nsfw,
             guild_id=guild_id,
+            max_concurrency=max_concurrency,
+            cooldown=cooldown,
+            auto_defer=auto_defer,
+            offload=offload,
+            priority=priority,
+            timeout=timeout,
+            circuit_breaker=circuit_breaker,
         )
         self._callback: CommandCallbackT | None = callback or getattr(self, "callback", None)
         if self._callback is None:
@@ -97,6 +137,7 @@ class SlashCommand(BaseCommand):
         self._description: str | None = description
         self._description_localizations: Localized | None = description_localizations
         self._options: Sequence[Option] | None = options
+        self._binder: ArgumentBinder = ArgumentBinder(options)
 
     @property
     def description(self) -> str | None:
@@ -110,6 +151,10 @@ class SlashCommand(BaseCommand):
     def options(self) -> Sequence[Option] | None:
         return self._options
 
+    @property
+    def binder(self) -> ArgumentBinder:
+        return self._binder
+
 
 class SlashCommandGroup(BaseCommand):
     """A class representing a group of slash commands.
@@ -130,6 +175,20 @@ class SlashCommandGroup(BaseCommand):
         Whether commands are NSFW.
     guild_id : SnowflakeishOr[PartialGuild] | None, optional
         Guild ID if command is guild-specific.
+    max_concurrency : MaxConcurrency | None, optional
+        Limit of in-flight invocations of the command.
+    cooldown : Cooldown | None, optional
+        Token bucket cooldown of the command.
+    auto_defer : AutoDefer | None, optional
+        Auto-defer policy of the command, overrides the policy of the handler.
+    offload : Offload | None, optional
+        Offload policy of the functions decorated with `offload` called by the command.
+    priority : Priority | None, optional
+        Priority of the command under load shedding, `Priority.NORMAL` if not set.
+    timeout : Timeout | None, optional
+        Time limit of the callback, by default the time limit of the handler.
+    circuit_breaker : CircuitBreaker | None, optional
+        Circuit breaker short-circuiting the command while it is failing.
 
     Attributes
     ----------
@@ -149,6 +208,13 @@ class SlashCommandGroup(BaseCommand):
         is_dm_enabled: bool = False,
         is_nsfw: bool = False,
         guild_id: SnowflakeishOr[PartialGuild] | None = None,
+        max_concurrency: MaxConcurrency | None = None,
+        cooldown: Cooldown | None = None,
+        auto_defer: AutoDefer | None = None,
+        offload: Offload | None = None,
+        priority: Priority | None = None,
+        timeout: Timeout | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         super().__init__(
             name=name,
@@ -157,6 +223,13 @@ class SlashCommandGroup(BaseCommand):
             is_dm_enabled=is_dm_enabled,
             is_nsfw=is_nsfw,
             guild_id=guild_id,
+            max_concurrency=max_concurrency,
+            cooldown=cooldown,
+            auto_defer=auto_defer,
+            offload=offload,
+            priority=priority,
+            timeout=timeout,
+            circuit_breaker=circuit_breaker,
         )
         self._sub_commands: dict[str, SubCommandMethod] = {}
 
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from typing import TYPE_CHECKING
+
+from hikari.embeds import Embed
+
+from aurum.context import ResponseState
+
+if TYPE_CHECKING:
+    from aurum.context import InteractionContext
+
+__all__: Sequence[str] = ("ResponseStream",)
+
+
+class ResponseStream:
+    """A response updated with the values yielded by a streaming command callback.
+
+    Pushed values are written by a single writer task, which edits the response at most
+    once per `interval`. Values pushed while the writer waits replace each other, so only
+    the latest of them is written, and the final value is always written on close.
+    A failed write stops the writer, its exception is raised by the next `push` or `close`.
+
+    Parameters
+    ----------
+    context : InteractionContext
+        The context of the interaction.
+    interval : float, default 1.0
+        Minimum time in seconds between the response edits.
+
+    Notes
+    -----
+        A string value is written as the response content and an embed as its only embed.
+        Other values are written as their string representations.
+    """
+
+    __slots__: Sequence[str] = (
+        "context",
+        "interval",
+        "_latest",
+        "_pending",
+        "_closed",
+        "_wakeup",
+        "_writer",
+        "_written_at",
+        "_writes",
+        "_coalesced",
+    )
+
+    def __init__(self, context: InteractionContext, *, interval: float = 1.0) -> None:
+        self.context: InteractionContext = context
+        self.interval: float = interval
+        self._latest: object = None
+        self._pending: bool = False
+        self._closed: bool = False
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._writer: asyncio.Task[None] = asyncio.create_task(self._write())
+        self._written_at: float = float("-inf")
+        self._writes: int = 0
+        self._coalesced: int = 0
+
+    @property
+    def writes(self) -> int:
+        """Number of response writes."""
+        return self._writes
+
+    @property
+    def coalesced(self) -> int:
+        """Number of pushed values replaced before they were written."""
+        return self._coalesced
+
+    def push(self, value: object) -> None:
+        """Set the value to write next.
+
+        Parameters
+        ----------
+        value : object
+            The yielded value.
+
+        Raises
+        ------
+        Exception
+            The exception of a failed write.
+        """
+        if self._writer.done():
+            self._writer.result()
+        if self._pending:
+            self._coalesced += 1
+        self._latest = value
+        self._pending = True
+        self._wakeup.set()
+
+    async def close(self) -> None:
+        """Write the final value and stop the writer.
+
+        Raises
+        ------
+        Exception
+            The exception of a failed write.
+        """
+        self._closed = True
+        self._wakeup.set()
+        await self._writer
+
+    async def consume(self, values: AsyncIterator[object]) -> None:
+        """Push every value of an iterator, then close the stream.
+
+        If the iterator raises or the consumer is cancelled, the writer is cancelled
+        instead, so no write races with the error handling.
+
+        Parameters
+        ----------
+        values : AsyncIterator[object]
+            The values, usually an async generator returned by the command callback.
+
+        Raises
+        ------
+        Exception
+            The exception of a failed write.
+        """
+        completed: bool = False
+        try:
+            async for value in values:
+                self.push(value)
+            completed = True
+        finally:
+            if not completed:
+                self._writer.cancel()
+        await self.close()
+
+    async def _write(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self._pending:
+                delay: float = self._written_at + self.interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._pending = False
+                await self._send(self._latest)
+                self._written_at = loop.time()
+                self._writes += 1
+            if self._closed and not self._pending:
+                return
+
+    async def _send(self, value: object) -> None:
+        if self.context.state is ResponseState.PENDING:
+            if isinstance(value, Embed):
+                await self.context.create_response(embed=value)
+            else:
+                await self.context.create_response(str(value))
+        elif isinstance(value, Embed):
+            await self.context.edit_response(None, embeds=(value,))
+        else:
+            await self.context.edit_response(str(value), embeds=())
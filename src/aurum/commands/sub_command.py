@@ -6,8 +6,16 @@ from typing import TYPE_CHECKING
 
 import attrs
 
+from aurum.commands.admission import Priority
+from aurum.commands.auto_defer import AutoDefer
+from aurum.commands.circuit_breaker import CircuitBreaker
+from aurum.commands.concurrency import MaxConcurrency
+from aurum.commands.cooldowns import Cooldown
+from aurum.commands.offload import Offload
 from aurum.commands.options import Option
+from aurum.commands.timeouts import Timeout
 from aurum.commands.types import Localized
+from aurum.commands.utils.argument_binder import ArgumentBinder
 from aurum.exceptions import AurumException
 
 if TYPE_CHECKING:
@@ -37,7 +45,7 @@ class SubCommandMethod:
     def method(self, group: SlashCommandGroup) -> CommandCallbackT:
         return MethodType(self.func, group)
 
-    def sub_command(
+    def sub_command(  # noqa: PLR0913
         self,
         name: str,
         *,
@@ -45,6 +53,13 @@ class SubCommandMethod:
         description: str | None = None,
         description_localizations: Localized | None = None,
         options: Sequence[Option] | None = None,
+        max_concurrency: MaxConcurrency | None = None,
+        cooldown: Cooldown | None = None,
+        auto_defer: AutoDefer | None = None,
+        offload: Offload | None = None,
+        priority: Priority | None = None,
+        timeout: Timeout | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> Callable[[CommandCallbackT], SubCommandMethod]:
         """Creates a new sub-command and associates it with the decorated function.
 
@@ -62,6 +77,20 @@ class SubCommandMethod:
             The sub-command description localizations.
         options : Sequence[Option] | None, optional
             The sub-command options.
+        max_concurrency : MaxConcurrency | None, optional
+            Limit of in-flight invocations of the command.
+        cooldown : Cooldown | None, optional
+            Token bucket cooldown of the command.
+        auto_defer : AutoDefer | None, optional
+            Auto-defer policy of the command, overrides the policy of the handler.
+        offload : Offload | None, optional
+            Offload policy of the functions decorated with `offload` called by the command.
+        priority : Priority | None, optional
+            Priority of the command under load shedding, `Priority.NORMAL` if not set.
+        timeout : Timeout | None, optional
+            Time limit of the callback, by default the time limit of the handler.
+        circuit_breaker : CircuitBreaker | None, optional
+            Circuit breaker short-circuiting the command while it is failing.
 
         Returns
         -------
@@ -79,6 +108,13 @@ class SubCommandMethod:
                         description=description,
                         description_localizations=description_localizations,
                         options=options,
+                        max_concurrency=max_concurrency,
+                        cooldown=cooldown,
+                        auto_defer=auto_defer,
+                        offload=offload,
+                        priority=priority,
+                        timeout=timeout,
+                        circuit_breaker=circuit_breaker,
                         sub_command_group=self.command,
                         sub_commands=None,
                     ),
@@ -109,6 +145,25 @@ class SubCommand:
         Parent sub-command group if this is a child command.
     sub_commands : Dict[str, SubCommandMethod] | None
         Dictionary of child sub-commands if this is a group.
+    max_concurrency : MaxConcurrency | None, optional
+        Limit of in-flight invocations of the command.
+    cooldown : Cooldown | None, optional
+        Token bucket cooldown of the command.
+    auto_defer : AutoDefer | None, optional
+        Auto-defer policy of the command, overrides the policy of the handler.
+    offload : Offload | None, optional
+        Offload policy of the functions decorated with `offload` called by the command.
+    priority : Priority | None, optional
+        Priority of the command under load shedding, `Priority.NORMAL` if not set.
+    timeout : Timeout | None, optional
+        Time limit of the callback, by default the time limit of the handler.
+    circuit_breaker : CircuitBreaker | None, optional
+        Circuit breaker short-circuiting the command while it is failing.
+
+    Attributes
+    ----------
+    binder : ArgumentBinder
+        The argument binder generated from the sub-command options on creation.
     """
 
     name: str = attrs.field(repr=True)
@@ -118,9 +173,21 @@ class SubCommand:
 
     options: Sequence[Option] | None = attrs.field(factory=tuple, repr=False)
 
+    max_concurrency: MaxConcurrency | None = attrs.field(default=None, repr=False)
+    cooldown: Cooldown | None = attrs.field(default=None, repr=False)
+    auto_defer: AutoDefer | None = attrs.field(default=None, repr=False)
+    offload: Offload | None = attrs.field(default=None, repr=False)
+    priority: Priority | None = attrs.field(default=None, repr=False)
+    timeout: Timeout | None = attrs.field(default=None, repr=False)
+    circuit_breaker: CircuitBreaker | None = attrs.field(default=None, repr=False)
+
     sub_command_group: SubCommand | None = attrs.field(default=None, repr=True)
     sub_commands: dict[str, SubCommandMethod] | None = attrs.field(default=None, repr=True)
 
+    binder: ArgumentBinder = attrs.field(
+        init=False, repr=False, default=attrs.Factory(lambda self: ArgumentBinder(self.options), takes_self=True)
+    )
+
     def add_sub_command(self, wrapper: SubCommandMethod) -> SubCommandMethod:
         if self.sub_command_group is not None:
             raise AurumException("Child of sub command group cannot have sub commands")
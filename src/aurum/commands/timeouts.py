@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping, Sequence
+
+__all__: Sequence[str] = ("Timeout",)
+
+
+class Timeout:
+    """A time limit of the command callback.
+
+    When the limit is exceeded, the callback is cancelled: `asyncio.CancelledError` is raised
+    at its current await, so `finally` blocks and context managers of the callback release
+    its resources. Then `response` is sent the way `InteractionContext.respond` does, creating
+    the response, editing the deferred one or sending a followup.
+
+    Parameters
+    ----------
+    after : float
+        Maximum time in seconds the callback runs.
+    response : str | None, default "The command took too long to respond."
+        Ephemeral fallback response, None to send nothing.
+
+    Notes
+    -----
+        Sharing one instance between commands makes them share the counters, keyed by command names.
+        The callback should not suppress `asyncio.CancelledError`, it is waited for until it exits.
+    """
+
+    __slots__: Sequence[str] = ("after", "response", "_expired", "_time_spent")
+
+    def __init__(self, after: float, *, response: str | None = "The command took too long to respond.") -> None:
+        self.after: float = after
+        self.response: str | None = response
+        self._expired: Counter[str] = Counter()
+        self._time_spent: Counter[str] = Counter()
+
+    @property
+    def expired(self) -> Mapping[str, int]:
+        """Number of cancelled invocations by command names."""
+        return self._expired
+
+    @property
+    def time_spent(self) -> Mapping[str, float]:
+        """Total time in seconds the cancelled invocations ran, cleanup included, by command names."""
+        return self._time_spent
+
+    def record(self, name: str, elapsed: float) -> None:
+        """Record a cancelled invocation.
+
+        Parameters
+        ----------
+        name : str
+            Name of the command.
+        elapsed : float
+            Time in seconds the invocation ran until its callback exited.
+        """
+        self._expired[name] += 1
+        self._time_spent[name] += elapsed
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncGenerator, Callable, Coroutine, Sequence
 from typing import TYPE_CHECKING, Any
 
 from hikari.locales import Locale
@@ -8,8 +8,10 @@ from hikari.snowflakes import Snowflakeish
 
 if TYPE_CHECKING:
     from aurum.commands.base_command import BaseCommand
+    from aurum.commands.options import Choice
 
 
 Localized = dict[Locale | str, str]
 CommandMapping = dict[Snowflakeish, "BaseCommand"]
-CommandCallbackT = Callable[..., Coroutine[Any, Any, None]]
+CommandCallbackT = Callable[..., Coroutine[Any, Any, None] | AsyncGenerator[Any, None]]
+AutocompleteCallbackT = Callable[..., Coroutine[Any, Any, Sequence["Choice"]]]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from hikari.commands import OptionType
+from hikari.snowflakes import Snowflake
+from hikari.undefined import UNDEFINED
+
+from aurum.commands.utils.resolve_interaction_option import resolve_interaction_option
+
+if TYPE_CHECKING:
+    from hikari.interactions import CommandInteraction, CommandInteractionOption, ResolvedOptionData
+
+    from aurum.commands.options import Option
+
+__all__: Sequence[str] = ("ArgumentBinder",)
+
+ResolverT = Callable[["ResolvedOptionData", Snowflake], object]
+
+
+def _resolve_user(resolved: ResolvedOptionData, value: Snowflake) -> object:
+    return resolved.members.get(value) or resolved.users.get(value)
+
+
+def _resolve_channel(resolved: ResolvedOptionData, value: Snowflake) -> object:
+    return resolved.channels.get(value)
+
+
+def _resolve_role(resolved: ResolvedOptionData, value: Snowflake) -> object:
+    return resolved.roles.get(value)
+
+
+def _resolve_mentionable(resolved: ResolvedOptionData, value: Snowflake) -> object:
+    return resolved.members.get(value) or resolved.roles.get(value)
+
+
+def _resolve_attachment(resolved: ResolvedOptionData, value: Snowflake) -> object:
+    return resolved.attachments.get(value)
+
+
+_RESOLVERS: dict[OptionType, ResolverT] = {
+    OptionType.USER: _resolve_user,
+    OptionType.CHANNEL: _resolve_channel,
+    OptionType.ROLE: _resolve_role,
+    OptionType.MENTIONABLE: _resolve_mentionable,
+    OptionType.ATTACHMENT: _resolve_attachment,
+}
+
+
+class ArgumentBinder:
+    """Binds interaction options to callback keyword arguments.
+
+    The binder is generated once from the declared options, so binding is a single pass
+    over the received options with a resolver already chosen for each of them.
+
+    Parameters
+    ----------
+    options : Sequence[Option] | None
+        The declared options of a command or sub-command.
+    """
+
+    __slots__: Sequence[str] = ("_resolvers", "_defaults")
+
+    def __init__(self, options: Sequence[Option] | None) -> None:
+        self._resolvers: dict[str, ResolverT | None] = {
+            option.name: _RESOLVERS.get(option.type) for option in options or ()
+        }
+        self._defaults: dict[str, Any] = {
+            option.name: option.default
+            for option in options or ()
+            if not option.is_required and option.default is not UNDEFINED
+        }
+
+    def bind(self, interaction: CommandInteraction, options: Sequence[CommandInteractionOption]) -> dict[str, Any]:
+        """Build callback keyword arguments from the received options.
+
+        Parameters
+        ----------
+        interaction : CommandInteraction
+            The interaction the options belong to.
+        options : Sequence[CommandInteractionOption]
+            The received options.
+
+        Returns
+        -------
+        dict[str, Any]
+            Keyword arguments with defaults filled in for missing optional options.
+        """
+        arguments: dict[str, Any] = self._defaults.copy()
+        resolved: ResolvedOptionData | None = interaction.resolved
+        for option in options:
+            try:
+                resolver: ResolverT | None = self._resolvers[option.name]
+            except KeyError:
+                arguments[option.name] = resolve_interaction_option(interaction, option)
+                continue
+            if resolver is None or resolved is None:
+                arguments[option.name] = option.value
+            else:
+                arguments[option.name] = resolver(resolved, option.value)  # type: ignore
+        return arguments
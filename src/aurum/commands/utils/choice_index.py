@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import attrs
+
+if TYPE_CHECKING:
+    from aurum.commands.options import Choice
+
+__all__: Sequence[str] = ("MAX_CHOICES", "ChoiceIndex")
+
+MAX_CHOICES: int = 25
+"""Maximum number of choices Discord accepts for an option or an autocomplete response."""
+
+_COMMON_TRIGRAM_RATIO: int = 100
+
+
+def _trigrams(text: str) -> set[str]:
+    padded: str = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class _LocaleIndex:
+    __slots__: Sequence[str] = ("choices", "names", "keys", "positions", "sizes", "postings", "max_posting")
+
+    def __init__(self, choices: Sequence[Choice]) -> None:
+        self.choices: Sequence[Choice] = choices
+        self.names: list[str] = [choice.name.casefold() for choice in choices]
+        order: list[int] = sorted(range(len(choices)), key=self.names.__getitem__)
+        self.keys: list[str] = [self.names[position] for position in order]
+        self.positions: array[int] = array("I", order)
+
+        sizes: array[int] = array("H")
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        for position, name in enumerate(self.names):
+            trigrams: set[str] = _trigrams(name)
+            sizes.append(len(trigrams))
+            for trigram in trigrams:
+                postings[trigram].append(position)
+        self.sizes: array[int] = sizes
+        self.postings: dict[str, array[int]] = {trigram: array("I", posting) for trigram, posting in postings.items()}
+        # trigrams shared by too many names say little about a match and are expensive to count
+        self.max_posting: int = max(64, len(choices) // _COMMON_TRIGRAM_RATIO)
+
+    def search(self, query: str, limit: int) -> list[Choice]:
+        if not query:
+            return list(self.choices[:limit])
+
+        found: list[int] = []
+        start: int = bisect.bisect_left(self.keys, query)
+        for index in range(start, min(start + limit, len(self.keys))):
+            if not self.keys[index].startswith(query):
+                break
+            found.append(self.positions[index])
+        if not found:
+            found = self._fuzzy_search(query, limit)
+        return [self.choices[position] for position in found]
+
+    def _fuzzy_search(self, query: str, limit: int) -> list[int]:
+        query_trigrams: set[str] = _trigrams(query)
+        postings: list[array[int]] = [
+            posting
+            for trigram in query_trigrams
+            if (posting := self.postings.get(trigram)) is not None and len(posting) <= self.max_posting
+        ]
+        if not postings:
+            return []
+        counts: Counter[int] = Counter(itertools.chain.from_iterable(postings))
+        required: int = (len(postings) + 1) // 2
+        size: int = len(query_trigrams)
+        scored: list[tuple[float, int]] = [
+            (shared / (size + self.sizes[position] - shared), -position)
+            for position, shared in counts.items()
+            if shared >= required
+        ]
+        return [-position for _, position in heapq.nlargest(limit, scored)]
+
+
+class ChoiceIndex:
+    """A search index of a large static set of choices.
+
+    Choices are matched by the prefix of their names. When nothing matches the prefix,
+    choices are matched by shared trigrams to tolerate typos. The index is built once, per locale of the choice name localizations.
+
+    Parameters
+    ----------
+    choices : Sequence[Choice]
+        The choices to index.
+    """
+
+    __slots__: Sequence[str] = ("_default", "_locales")
+
+    def __init__(self, choices: Sequence[Choice]) -> None:
+        self._default: _LocaleIndex = _LocaleIndex(tuple(choices))
+        locales: set[str] = {
+            str(locale) for choice in choices if choice.name_localizations for locale in choice.name_localizations
+        }
+        self._locales: dict[str, _LocaleIndex] = {
+            locale: _LocaleIndex(tuple(self._localize(choice, locale) for choice in choices)) for locale in locales
+        }
+
+    def __len__(self) -> int:
+        return len(self._default.choices)
+
+    @staticmethod
+    def _localize(choice: Choice, locale: str) -> Choice:
+        localizations = {str(key): value for key, value in (choice.name_localizations or {}).items()}
+        if locale not in localizations:
+            return choice
+        return attrs.evolve(choice, name=localizations[locale])
+
+    def search(self, query: str, locale: str | None = None, *, limit: int = MAX_CHOICES) -> Sequence[Choice]:
+        """Search choices matching a query.
+
+        Parameters
+        ----------
+        query : str
+            The query, usually the current value of the focused option.
+        locale : str | None, optional
+            The locale of the names to match and return, the default names are used if it has no localizations.
+        limit : int, default MAX_CHOICES
+            Maximum number of choices to return.
+
+        Returns
+        -------
+        Sequence[Choice]
+            The matching choices. Choices are named in the requested locale.
+        """
+        index: _LocaleIndex = self._locales.get(str(locale), self._default) if locale else self._default
+        return index.search(query.strip().casefold(), limit)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from hikari.api import special_endpoints as api
+from hikari.commands import CommandChoice, CommandOption, PartialCommand
+from hikari.undefined import UNDEFINED
+
+__all__: Sequence[str] = ("canonicalize_command", "fingerprint_command")
+
+
+def _canonicalize_localizations(localizations: Mapping[Any, str] | None) -> dict[str, str]:
+    return {str(locale): value for locale, value in (localizations or {}).items()}
+
+
+def _canonicalize_choice(choice: CommandChoice) -> dict[str, Any]:
+    return {
+        "name": choice.name,
+        "value": choice.value,
+        "name_localizations": _canonicalize_localizations(choice.name_localizations),
+    }
+
+
+def _canonicalize_option(option: CommandOption) -> dict[str, Any]:
+    return {
+        "type": int(option.type),
+        "name": option.name,
+        "name_localizations": _canonicalize_localizations(option.name_localizations),
+        "description": option.description,
+        "description_localizations": _canonicalize_localizations(option.description_localizations),
+        "required": bool(option.is_required),
+        "choices": [_canonicalize_choice(choice) for choice in option.choices or ()],
+        "options": [_canonicalize_option(sub_option) for sub_option in option.options or ()],
+        "channel_types": sorted(int(channel_type) for channel_type in option.channel_types or ()),
+        "min_value": option.min_value,
+        "max_value": option.max_value,
+        "min_length": option.min_length,
+        "max_length": option.max_length,
+        "autocomplete": bool(getattr(option, "autocomplete", False)),
+    }
+
+
+def canonicalize_command(command: api.CommandBuilder | PartialCommand) -> dict[str, Any]:
+    """Build a canonical form of a local command builder or a remote command.
+
+    Both sides are reduced to the same plain structure, with Discord defaults applied,
+    so a local builder and its synchronized remote command compare equal.
+
+    Parameters
+    ----------
+    command : api.CommandBuilder | PartialCommand
+        The command builder or the fetched command.
+
+    Returns
+    -------
+    dict[str, Any]
+        The canonical form of the command.
+    """
+    default_member_permissions = command.default_member_permissions
+    is_dm_enabled = getattr(command, "is_dm_enabled", UNDEFINED)
+    is_nsfw = getattr(command, "is_nsfw", UNDEFINED)
+    return {
+        "type": int(command.type),
+        "name": command.name,
+        "name_localizations": _canonicalize_localizations(command.name_localizations),
+        "description": getattr(command, "description", None),
+        "description_localizations": _canonicalize_localizations(getattr(command, "description_localizations", None)),
+        "options": [_canonicalize_option(option) for option in getattr(command, "options", None) or ()],
+        "default_member_permissions": int(
+            0 if default_member_permissions is UNDEFINED else default_member_permissions or 0
+        ),
+        "dm_permission": True if is_dm_enabled is UNDEFINED else bool(is_dm_enabled),
+        "nsfw": False if is_nsfw is UNDEFINED else bool(is_nsfw),
+    }
+
+
+def fingerprint_command(command: api.CommandBuilder | PartialCommand) -> str:
+    """Fingerprint a local command builder or a remote command.
+
+    Parameters
+    ----------
+    command : api.CommandBuilder | PartialCommand
+        The command builder or the fetched command.
+
+    Returns
+    -------
+    str
+        Hex digest of the canonical form of the command.
+    """
+    payload: str = json.dumps(canonicalize_command(command), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
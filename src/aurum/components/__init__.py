@@ -0,0 +1,24 @@
+"""Components implementation"""
+
+from collections.abc import Sequence
+
+from aurum.components.component_router import ComponentRoute, ComponentRouter
+from aurum.components.custom_id import CustomIdPattern, CustomIdTrie
+from aurum.components.exceptions import BaseComponentException, ComponentNotFound, ModalNotFound
+from aurum.components.modal_router import ModalRoute, ModalRouter
+from aurum.components.view import View, ViewStore, action
+
+__all__: Sequence[str] = (
+    "ComponentRoute",
+    "ComponentRouter",
+    "CustomIdPattern",
+    "CustomIdTrie",
+    "BaseComponentException",
+    "ComponentNotFound",
+    "ModalRoute",
+    "ModalRouter",
+    "ModalNotFound",
+    "View",
+    "ViewStore",
+    "action",
+)
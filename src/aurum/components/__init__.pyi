@@ -0,0 +1,30 @@
+# DO NOT MANUALLY EDIT THIS FILE!
+# This file was automatically generated by `nox -s generate_stubs`
+
+from aurum.components.component_router import ComponentRoute as ComponentRoute
+from aurum.components.component_router import ComponentRouter as ComponentRouter
+from aurum.components.custom_id import CustomIdPattern as CustomIdPattern
+from aurum.components.custom_id import CustomIdTrie as CustomIdTrie
+from aurum.components.exceptions import BaseComponentException as BaseComponentException
+from aurum.components.exceptions import ComponentNotFound as ComponentNotFound
+from aurum.components.exceptions import ModalNotFound as ModalNotFound
+from aurum.components.modal_router import ModalRoute as ModalRoute
+from aurum.components.modal_router import ModalRouter as ModalRouter
+from aurum.components.view import View as View
+from aurum.components.view import ViewStore as ViewStore
+from aurum.components.view import action as action
+
+__all__ = [
+    "ComponentRoute",
+    "ComponentRouter",
+    "CustomIdPattern",
+    "CustomIdTrie",
+    "BaseComponentException",
+    "ComponentNotFound",
+    "ModalRoute",
+    "ModalRouter",
+    "ModalNotFound",
+    "View",
+    "ViewStore",
+    "action",
+]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import attrs
+
+from aurum.components.custom_id import CustomIdPattern, CustomIdTrie
+from aurum.components.exceptions import ComponentNotFound
+
+if TYPE_CHECKING:
+    from aurum.commands.types import CommandCallbackT
+
+__all__: Sequence[str] = ("ComponentRoute", "ComponentRouter")
+
+
+@attrs.define(kw_only=True, frozen=True, eq=False, weakref_slot=False)
+class ComponentRoute:
+    """A registered component handler.
+
+    Parameters
+    ----------
+    pattern : CustomIdPattern
+        The custom ID pattern of the handler.
+    callback : CommandCallbackT
+        The handler, called with the interaction context and the parsed parameters as keyword arguments.
+    """
+
+    pattern: CustomIdPattern = attrs.field()
+    callback: CommandCallbackT = attrs.field(repr=False)
+
+
+class ComponentRouter:
+    """A router of component interactions by their custom IDs.
+
+    Handlers are registered by custom ID patterns, for example `vote:{poll_id:int}:{choice}`,
+    and called with the interaction context and the parsed parameters as keyword arguments.
+    """
+
+    __slots__: Sequence[str] = ("_trie",)
+
+    def __init__(self) -> None:
+        self._trie: CustomIdTrie[ComponentRoute] = CustomIdTrie()
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def add_component(self, pattern: str, callback: CommandCallbackT) -> ComponentRoute:
+        """Register a component handler.
+
+        Parameters
+        ----------
+        pattern : str
+            The custom ID pattern, see `CustomIdPattern`.
+        callback : CommandCallbackT
+            The handler.
+
+        Returns
+        -------
+        ComponentRoute
+            The registered route.
+
+        Raises
+        ------
+        AurumException
+            If the pattern is invalid or already registered.
+        """
+        route: ComponentRoute = ComponentRoute(pattern=CustomIdPattern(pattern), callback=callback)
+        self._trie.insert(route.pattern, route)
+        return route
+
+    def component(self, pattern: str) -> Callable[[CommandCallbackT], CommandCallbackT]:
+        """Register the decorated function as a component handler.
+
+        Parameters
+        ----------
+        pattern : str
+            The custom ID pattern, see `CustomIdPattern`.
+
+        Returns
+        -------
+        Callable[[CommandCallbackT], CommandCallbackT]
+            A decorator registering the function and returning it unchanged.
+        """
+
+        def decorator(func: CommandCallbackT) -> CommandCallbackT:
+            self.add_component(pattern, func)
+            return func
+
+        return decorator
+
+    def resolve(self, custom_id: str) -> tuple[ComponentRoute, dict[str, Any]]:
+        """Resolve the handler of a custom ID.
+
+        Parameters
+        ----------
+        custom_id : str
+            The custom ID.
+
+        Returns
+        -------
+        tuple[ComponentRoute, dict[str, Any]]
+            The route and its parsed parameters by their names.
+
+        Raises
+        ------
+        ComponentNotFound
+            If no handler matches the custom ID.
+        """
+        match: tuple[ComponentRoute, list[Any]] | None = self._trie.match(custom_id)
+        if match is None:
+            raise ComponentNotFound(custom_id)
+        route, values = match
+        return route, dict(zip(route.pattern.names, values, strict=True))
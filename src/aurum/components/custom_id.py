@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Sequence
+from typing import Any, Generic, TypeVar
+
+from hikari.snowflakes import Snowflake
+
+from aurum.exceptions import AurumException
+
+__all__: Sequence[str] = ("CONVERTERS", "SEPARATOR", "CustomIdPattern", "CustomIdTrie")
+
+SEPARATOR: str = ":"
+"""Separator of the custom ID segments."""
+
+CONVERTERS: dict[str, Callable[[str], Any]] = {"int": int, "snowflake": Snowflake, "float": float, "str": str}
+"""Converters of the typed segments by their type names, tried in this order when segments overlap."""
+
+RouteT = TypeVar("RouteT")
+
+_PARAMETER: re.Pattern[str] = re.compile(r"^\{(?P<name>[A-Za-z_]\w*)(?::(?P<type>\w+))?\}$")
+_SEGMENT_SEPARATOR: re.Pattern[str] = re.compile(rf"{re.escape(SEPARATOR)}(?![^{{]*\}})")
+
+
+class CustomIdPattern:
+    """A compiled custom ID pattern.
+
+    A pattern is a sequence of segments joined by `SEPARATOR`. A segment is either static text
+    or a typed parameter in form of `{name}` or `{name:type}`, where type is one of `CONVERTERS`,
+    `str` by default. For example, `vote:{poll_id:int}:{choice}`.
+
+    Parameters
+    ----------
+    pattern : str
+        The pattern.
+
+    Attributes
+    ----------
+    pattern : str
+        The pattern.
+    segments : tuple[str | tuple[str, str], ...]
+        Static segments as strings and parameters as (name, type) pairs.
+    names : tuple[str, ...]
+        Names of the parameters in order.
+
+    Raises
+    ------
+    AurumException
+        If the pattern has an unknown parameter type or a duplicate parameter name.
+    """
+
+    __slots__: Sequence[str] = ("pattern", "segments", "names")
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern: str = pattern
+        segments: list[str | tuple[str, str]] = []
+        for segment in _SEGMENT_SEPARATOR.split(pattern):
+            match: re.Match[str] | None = _PARAMETER.match(segment)
+            if match is None:
+                segments.append(segment)
+                continue
+            type_name: str = match["type"] or "str"
+            if type_name not in CONVERTERS:
+                raise AurumException(f"Unknown type {type_name} of custom ID parameter {match['name']} in {pattern}")
+            segments.append((match["name"], type_name))
+        self.segments: tuple[str | tuple[str, str], ...] = tuple(segments)
+        self.names: tuple[str, ...] = tuple(segment[0] for segment in segments if isinstance(segment, tuple))
+        if len(set(self.names)) != len(self.names):
+            raise AurumException(f"Custom ID pattern {pattern} has duplicate parameter names")
+
+    def __repr__(self) -> str:
+        return f"CustomIdPattern({self.pattern!r})"
+
+    def format(self, **values: object) -> str:
+        """Build a custom ID matching this pattern.
+
+        Parameters
+        ----------
+        **values : object
+            Values of the parameters.
+
+        Returns
+        -------
+        str
+            The custom ID.
+        """
+        return SEPARATOR.join(
+            segment if isinstance(segment, str) else str(values[segment[0]]) for segment in self.segments
+        )
+
+
+# type parameter syntax needs Python 3.12, the package supports 3.10
+class _Node(Generic[RouteT]):  # noqa: UP046
+    __slots__: Sequence[str] = ("static", "parameters", "route")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _Node[RouteT]] = {}
+        self.parameters: dict[str, _Node[RouteT]] = {}
+        self.route: RouteT | None = None
+
+
+class CustomIdTrie(Generic[RouteT]):  # noqa: UP046
+    """A trie of custom ID patterns.
+
+    Matching walks one node per custom ID segment, so its cost does not depend on the
+    number of registered patterns. Static segments take precedence over parameters.
+    """
+
+    __slots__: Sequence[str] = ("_root", "_size")
+
+    def __init__(self) -> None:
+        self._root: _Node[RouteT] = _Node()
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, pattern: CustomIdPattern, route: RouteT) -> None:
+        """Insert a route.
+
+        Parameters
+        ----------
+        pattern : CustomIdPattern
+            The pattern of the route.
+        route : RouteT
+            The route.
+
+        Raises
+        ------
+        AurumException
+            If a route with an equivalent pattern is already inserted.
+        """
+        node: _Node[RouteT] = self._root
+        for segment in pattern.segments:
+            children: dict[str, _Node[RouteT]] = node.static if isinstance(segment, str) else node.parameters
+            key: str = segment if isinstance(segment, str) else segment[1]
+            if (child := children.get(key)) is None:
+                child = children[key] = _Node()
+                if children is node.parameters:
+                    # keep the parameters in the converters order
+                    node.parameters = {name: node.parameters[name] for name in CONVERTERS if name in node.parameters}
+            node = child
+        if node.route is not None:
+            raise AurumException(f"Custom ID pattern {pattern.pattern} is already registered")
+        node.route = route
+        self._size += 1
+
+    def match(self, custom_id: str) -> tuple[RouteT, list[Any]] | None:
+        """Match a custom ID.
+
+        Parameters
+        ----------
+        custom_id : str
+            The custom ID.
+
+        Returns
+        -------
+        tuple[RouteT, list[Any]] | None
+            The matched route and the converted parameter values in order, None if nothing matches.
+        """
+        values: list[Any] = []
+        route: RouteT | None = self._match(self._root, custom_id.split(SEPARATOR), 0, values)
+        return None if route is None else (route, values)
+
+    def _match(self, node: _Node[RouteT], parts: list[str], index: int, values: list[Any]) -> RouteT | None:
+        if index == len(parts):
+            return node.route
+        part: str = parts[index]
+        if (child := node.static.get(part)) is not None and (
+            route := self._match(child, parts, index + 1, values)
+        ) is not None:
+            return route
+        for type_name, child in node.parameters.items():
+            try:
+                value: Any = CONVERTERS[type_name](part)
+            except ValueError:
+                continue
+            values.append(value)
+            if (route := self._match(child, parts, index + 1, values)) is not None:
+                return route
+            values.pop()
+        return None
@@ -0,0 +1,55 @@
+from collections.abc import Sequence
+from typing import Any
+
+from aurum.exceptions import AurumException
+
+__all__: Sequence[str] = ("BaseComponentException", "ComponentNotFound", "ModalNotFound")
+
+
+class BaseComponentException(AurumException):
+    """Base exception class for component related errors.
+
+    Parameters
+    ----------
+    custom_id : str
+        Custom ID of the component that caused the error.
+    *args : Any
+        Positional arguments to be passed to the parent exception class.
+    **kwargs : Any
+        Keyword arguments to be passed to the parent exception class.
+
+    Attributes
+    ----------
+    custom_id : str
+        The custom ID associated with this exception.
+    """
+
+    def __init__(self, custom_id: str, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.custom_id: str = custom_id
+
+
+class ComponentNotFound(BaseComponentException):
+    """Exception raised when no component handler matches a custom ID.
+
+    Parameters
+    ----------
+    custom_id : str
+        The custom ID that did not match.
+    """
+
+    def __init__(self, custom_id: str) -> None:
+        super().__init__(custom_id, f"Component {custom_id} is not found.")
+
+
+class ModalNotFound(BaseComponentException):
+    """Exception raised when no modal handler matches a custom ID.
+
+    Parameters
+    ----------
+    custom_id : str
+        The custom ID that did not match.
+    """
+
+    def __init__(self, custom_id: str) -> None:
+        super().__init__(custom_id, f"Modal {custom_id} is not found.")
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable, Mapping, Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import attrs
+
+from aurum.components.custom_id import CustomIdPattern, CustomIdTrie
+from aurum.components.exceptions import ModalNotFound
+
+if TYPE_CHECKING:
+    from hikari.interactions import ModalInteraction
+
+    from aurum.commands.types import CommandCallbackT
+
+__all__: Sequence[str] = ("ModalRoute", "ModalRouter")
+
+
+def _signature_fields(callback: CommandCallbackT, pattern: CustomIdPattern) -> dict[str, str]:
+    """Map text inputs to the keyword parameters of the callback after the context, by the same names."""
+    fields: dict[str, str] = {}
+    for parameter in tuple(inspect.signature(callback).parameters.values())[1:]:
+        if parameter.kind in {parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD} or parameter.name in pattern.names:
+            continue
+        fields[parameter.name] = parameter.name
+    return fields
+
+
+@attrs.define(kw_only=True, frozen=True, eq=False, weakref_slot=False)
+class ModalRoute:
+    """A registered modal handler.
+
+    Parameters
+    ----------
+    pattern : CustomIdPattern
+        The custom ID pattern of the modal.
+    callback : CommandCallbackT
+        The handler, called with the interaction context and, as keyword arguments,
+        the parsed parameters and the values of the text inputs.
+    fields : Mapping[str, str]
+        Mapping of text input custom IDs to the keyword argument names.
+    """
+
+    pattern: CustomIdPattern = attrs.field()
+    callback: CommandCallbackT = attrs.field(repr=False)
+    fields: Mapping[str, str] = attrs.field(repr=False)
+
+    def extract(self, interaction: ModalInteraction) -> dict[str, Any]:
+        """Extract the values of the mapped text inputs of a modal submit.
+
+        Parameters
+        ----------
+        interaction : ModalInteraction
+            The modal interaction.
+
+        Returns
+        -------
+        dict[str, Any]
+            Values of the text inputs by the keyword argument names.
+        """
+        fields: Mapping[str, str] = self.fields
+        return {
+            fields[component.custom_id]: component.value
+            for row in interaction.components
+            for component in row.components
+            if component.custom_id in fields
+        }
+
+
+class ModalRouter:
+    """A router of modal interactions by their custom IDs.
+
+    Handlers are registered by custom ID patterns, see `CustomIdPattern`. Values of the text inputs
+    are passed to the handler as keyword arguments, by the field map given on registration or, if not
+    given, by the handler parameters named as the text input custom IDs.
+    """
+
+    __slots__: Sequence[str] = ("_trie",)
+
+    def __init__(self) -> None:
+        self._trie: CustomIdTrie[ModalRoute] = CustomIdTrie()
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def add_modal(
+        self, pattern: str, callback: CommandCallbackT, *, fields: Mapping[str, str] | None = None
+    ) -> ModalRoute:
+        """Register a modal handler.
+
+        Parameters
+        ----------
+        pattern : str
+            The custom ID pattern of the modal.
+        callback : CommandCallbackT
+            The handler.
+        fields : Mapping[str, str] | None, optional
+            Mapping of text input custom IDs to the keyword argument names.
+            By default, text inputs are mapped to the handler parameters of the same names.
+
+        Returns
+        -------
+        ModalRoute
+            The registered route.
+
+        Raises
+        ------
+        AurumException
+            If the pattern is invalid or already registered.
+        """
+        compiled: CustomIdPattern = CustomIdPattern(pattern)
+        route: ModalRoute = ModalRoute(
+            pattern=compiled,
+            callback=callback,
+            fields=MappingProxyType(dict(fields) if fields is not None else _signature_fields(callback, compiled)),
+        )
+        self._trie.insert(compiled, route)
+        return route
+
+    def modal(
+        self, pattern: str, *, fields: Mapping[str, str] | None = None
+    ) -> Callable[[CommandCallbackT], CommandCallbackT]:
+        """Register the decorated function as a modal handler.
+
+        Parameters
+        ----------
+        pattern : str
+            The custom ID pattern of the modal.
+        fields : Mapping[str, str] | None, optional
+            Mapping of text input custom IDs to the keyword argument names.
+
+        Returns
+        -------
+        Callable[[CommandCallbackT], CommandCallbackT]
+            A decorator registering the function and returning it unchanged.
+        """
+
+        def decorator(func: CommandCallbackT) -> CommandCallbackT:
+            self.add_modal(pattern, func, fields=fields)
+            return func
+
+        return decorator
+
+    def resolve(self, interaction: ModalInteraction) -> tuple[ModalRoute, dict[str, Any]]:
+        """Resolve the handler of a modal submit and extract its arguments.
+
+        Parameters
+        ----------
+        interaction : ModalInteraction
+            The modal interaction.
+
+        Returns
+        -------
+        tuple[ModalRoute, dict[str, Any]]
+            The route and its arguments, the parsed parameters and the field values.
+
+        Raises
+        ------
+        ModalNotFound
+            If no handler matches the custom ID.
+        """
+        match: tuple[ModalRoute, list[Any]] | None = self._trie.match(interaction.custom_id)
+        if match is None:
+            raise ModalNotFound(interaction.custom_id)
+        route, values = match
+        arguments: dict[str, Any] = route.extract(interaction)
+        arguments.update(zip(route.pattern.names, values, strict=True))
+        return route, arguments
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import secrets
+import time
+from abc import abstractmethod
+from collections.abc import Callable, Coroutine, Hashable, Mapping, Sequence
+from logging import Logger, getLogger
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from aurum.components.exceptions import ComponentNotFound
+from aurum.context import TOKEN_LIFETIME
+from aurum.utils.timer_heap import TimerHeap
+
+if TYPE_CHECKING:
+    from hikari.api import special_endpoints as api
+    from hikari.impl import GatewayBot, RESTBot
+    from hikari.interactions import ComponentInteraction
+    from hikari.messages import Message
+
+    from aurum.context import InteractionContext
+
+__all__: Sequence[str] = ("VIEW_PREFIX", "View", "ViewStore", "action")
+
+ViewCallbackT = Callable[..., Coroutine[Any, Any, None]]
+
+VIEW_PREFIX: str = "aurum-view"
+"""Static first segment of the custom IDs of view components."""
+
+_CUSTOM_ID_SEGMENTS: int = 3
+
+
+def action(name: str) -> Callable[[ViewCallbackT], ViewCallbackT]:
+    """Mark a view method as the callback of its components with the given action name.
+
+    Parameters
+    ----------
+    name : str
+        The action name, used in `View.custom_id`.
+
+    Returns
+    -------
+    Callable[[ViewCallbackT], ViewCallbackT]
+        A decorator marking the method and returning it unchanged.
+    """
+
+    def decorator(func: ViewCallbackT) -> ViewCallbackT:
+        func.__view_action__ = name  # type: ignore
+        return func
+
+    return decorator
+
+
+class View:
+    """Per-message state with callbacks for the components of that message.
+
+    Subclasses build the components in `build`, using `custom_id` for their custom IDs,
+    and handle them with methods marked by `action`. The actions are collected once per class.
+
+    Parameters
+    ----------
+    timeout : float | None, optional
+        Seconds of inactivity after which the view expires, by default 180. None to never expire.
+    disable_on_timeout : bool, optional
+        Whether to disable the components of the message when the view expires, by default False.
+
+    Attributes
+    ----------
+    id : str
+        Random ID of the view, part of the custom IDs of its components.
+    message : Message | None
+        The message of the view, known after the first interaction with it
+        or once it is sent as a followup.
+    """
+
+    __actions__: ClassVar[Mapping[str, ViewCallbackT]] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        actions: dict[str, ViewCallbackT] = dict(cls.__actions__)
+        for attribute in vars(cls).values():
+            if (name := getattr(attribute, "__view_action__", None)) is not None:
+                actions[name] = attribute
+        cls.__actions__ = MappingProxyType(actions)
+
+    def __init__(self, *, timeout: float | None = 180.0, disable_on_timeout: bool = False) -> None:
+        self.id: str = secrets.token_hex(6)
+        self.timeout: float | None = timeout
+        self.disable_on_timeout: bool = disable_on_timeout
+        self.message: Message | None = None
+        self._bot: GatewayBot | RESTBot | None = None
+        self._application_id: Hashable | None = None
+        self._token: str | None = None
+        self._followup: Hashable | None = None
+        self._created_at: float = 0.0
+        self._store: ViewStore | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the view is stored and handles its components."""
+        return self._store is not None
+
+    def custom_id(self, action: str) -> str:
+        """Get the custom ID of a component of this view.
+
+        Parameters
+        ----------
+        action : str
+            The action name of the component.
+
+        Returns
+        -------
+        str
+            The custom ID.
+        """
+        return f"{VIEW_PREFIX}:{self.id}:{action}"
+
+    @abstractmethod
+    def build(self) -> Sequence[api.ComponentBuilder]:
+        """Build the components of the view.
+
+        Returns
+        -------
+        Sequence[api.ComponentBuilder]
+            The component rows.
+        """
+
+    def stop(self) -> None:
+        """Stop the view without calling the timeout hook."""
+        if self._store is not None:
+            self._store.remove(self.id)
+
+    async def on_timeout(self) -> None:
+        """Called when the view expires or is evicted from the store."""
+
+    async def disable(self) -> None:
+        """Edit the message of the view with all its components disabled.
+
+        The message is edited through the interaction webhook while its token is valid,
+        as the initial response or as the followup the view was sent in.
+        """
+        if self._bot is None:
+            return
+        components: Sequence[api.ComponentBuilder] = self.build()
+        for row in components:
+            for component in getattr(row, "components", ()):
+                if hasattr(component, "set_is_disabled"):
+                    component.set_is_disabled(True)
+        if self._token is not None and time.monotonic() - self._created_at < TOKEN_LIFETIME:
+            if self._followup is not None:
+                await self._bot.rest.edit_webhook_message(
+                    self._application_id, self._token, self._followup, components=components
+                )
+            else:
+                await self._bot.rest.edit_interaction_response(self._application_id, self._token, components=components)
+        elif self.message is not None:
+            await self._bot.rest.edit_message(self.message.channel_id, self.message.id, components=components)
+
+    def _bind(self, context: InteractionContext, store: ViewStore) -> None:
+        self._bot = context.bot
+        self._application_id = context.interaction.application_id
+        self._token = context.interaction.token
+        self._followup = None
+        self._created_at = time.monotonic()
+        self._store = store
+
+    def _sent_as_followup(self, context: InteractionContext, message: Message) -> None:
+        if self._token == context.interaction.token:  # started by this interaction
+            self._followup = message.id
+            self.message = message
+
+    def _has_expiry_work(self) -> bool:
+        return self.disable_on_timeout or type(self).on_timeout is not View.on_timeout
+
+
+class ViewStore:
+    """A bounded store of running views.
+
+    Expiry of all views is driven by a single `TimerHeap`, the timeout of a view
+    is restarted on every interaction with it. When there are more than `max_views`
+    views, the least recently used ones are evicted as if they expired.
+
+    Parameters
+    ----------
+    max_views : int, default 10_000
+        Maximum number of running views.
+    """
+
+    __slots__: Sequence[str] = ("__logger", "max_views", "_views", "_timers", "_tasks", "_expired", "_evicted")
+
+    def __init__(self, *, max_views: int = 10_000) -> None:
+        self.__logger: Logger = getLogger("aurum.components")
+        self.max_views: int = max_views
+        self._views: dict[str, View] = {}
+        self._timers: TimerHeap = TimerHeap(self._on_timer)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._expired: int = 0
+        self._evicted: int = 0
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    @property
+    def expired(self) -> int:
+        """Number of views that expired."""
+        return self._expired
+
+    @property
+    def evicted(self) -> int:
+        """Number of views evicted to keep the store in its bounds."""
+        return self._evicted
+
+    def get(self, view_id: str) -> View | None:
+        """Get a running view.
+
+        Parameters
+        ----------
+        view_id : str
+            The view ID.
+
+        Returns
+        -------
+        View | None
+            The view, None if it is not running.
+        """
+        return self._views.get(view_id)
+
+    def add(self, view: View, context: InteractionContext) -> None:
+        """Start a view sent in response to an interaction.
+
+        Parameters
+        ----------
+        view : View
+            The view.
+        context : InteractionContext
+            The context of the interaction the view is sent in response to.
+        """
+        view._bind(context, self)
+        self._views[view.id] = view
+        if view.timeout is not None:
+            self._timers.schedule(view.id, view.timeout)
+        if len(self._views) > self.max_views:
+            self._evict()
+
+    def remove(self, view_id: str) -> View | None:
+        """Stop a view without calling its timeout hook.
+
+        Parameters
+        ----------
+        view_id : str
+            The view ID.
+
+        Returns
+        -------
+        View | None
+            The removed view, None if it was not running.
+        """
+        view: View | None = self._views.pop(view_id, None)
+        self._timers.cancel(view_id)
+        if view is not None:
+            view._store = None
+        return view
+
+    def clear(self) -> None:
+        """Stop every view without calling their timeout hooks."""
+        for view in self._views.values():
+            view._store = None
+        self._views.clear()
+        self._timers.clear()
+
+    async def dispatch(self, context: InteractionContext) -> None:
+        """Call the view action matching the custom ID of a component interaction.
+
+        Parameters
+        ----------
+        context : InteractionContext
+            The context of the component interaction.
+
+        Raises
+        ------
+        ComponentNotFound
+            If the custom ID is not a view one, the view is not running or has no such action.
+        """
+        interaction: ComponentInteraction = context.interaction  # type: ignore
+        segments: list[str] = interaction.custom_id.split(":", 2)
+        if len(segments) != _CUSTOM_ID_SEGMENTS:
+            raise ComponentNotFound(interaction.custom_id)
+        _, view_id, name = segments
+        view: View | None = self._views.pop(view_id, None)
+        if view is None:
+            raise ComponentNotFound(interaction.custom_id)
+        self._views[view_id] = view  # most recently used views go last
+        if view.timeout is not None:
+            self._timers.schedule(view_id, view.timeout)
+        view.message = interaction.message
+
+        callback: ViewCallbackT | None = view.__actions__.get(name)
+        if callback is None:
+            raise ComponentNotFound(interaction.custom_id)
+        await callback(view, context)
+
+    def _on_timer(self, view_id: Hashable) -> None:
+        view: View | None = self._views.pop(view_id, None)  # type: ignore
+        if view is not None:
+            self._expired += 1
+            self._finish(view)
+
+    def _evict(self) -> None:
+        overflow: int = len(self._views) - self.max_views + self.max_views // 10
+        for view_id in list(itertools.islice(self._views, overflow)):
+            view: View = self._views.pop(view_id)
+            self._timers.cancel(view_id)
+            self._evicted += 1
+            self._finish(view)
+
+    def _finish(self, view: View) -> None:
+        view._store = None
+        if not view._has_expiry_work():
+            return
+        task: asyncio.Task[None] = asyncio.create_task(self._expire(view))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _expire(self, view: View) -> None:
+        try:
+            await view.on_timeout()
+            if view.disable_on_timeout:
+                await view.disable()
+        except Exception as error:
+            self.__logger.error("failed to expire view %s", view.id, exc_info=error)
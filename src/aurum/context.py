@@ -1,36 +1,102 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+import contextlib
+import functools
+import time
+from collections.abc import Container, Generator, Sequence
+from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 import attrs
 from hikari.api import special_endpoints as api
-from hikari.interactions import ResponseType
+from hikari.impl.special_endpoints import InteractionDeferredBuilder, InteractionMessageBuilder, InteractionModalBuilder
+from hikari.interactions import ComponentInteraction, ResponseType
 from hikari.messages import MessageFlag
 from hikari.undefined import UNDEFINED, UndefinedOr
 
+from aurum.exceptions import AurumException, InteractionExpired, InteractionStateError
+from aurum.followups import FollowupQueue
+
 if TYPE_CHECKING:
     from hikari.channels import TextableGuildChannel
     from hikari.embeds import Embed
     from hikari.files import Resourceish
     from hikari.guilds import GatewayGuild, PartialRole
-    from hikari.impl import GatewayBot
-    from hikari.interactions import CommandInteraction, ComponentInteraction, InteractionMember
+    from hikari.impl import GatewayBot, RESTBot
+    from hikari.interactions import AutocompleteInteraction, CommandInteraction, InteractionMember, ModalInteraction
     from hikari.messages import Message
-    from hikari.snowflakes import SnowflakeishSequence
+    from hikari.snowflakes import SnowflakeishOr, SnowflakeishSequence
     from hikari.users import PartialUser, User
 
-__all__: Sequence[str] = ("InteractionContext",)
+    from aurum.components.view import View, ViewStore
+
+__all__: Sequence[str] = ("TOKEN_LIFETIME", "InteractionContext", "ResponseState")
+
+TOKEN_LIFETIME: float = 15 * 60
+"""Seconds for which the token of an interaction is valid after the interaction is received."""
+
+
+class ResponseState(Enum):
+    """Response state of an interaction."""
+
+    PENDING = "pending"
+    """The interaction is not acknowledged yet."""
+    DEFERRED = "deferred"
+    """The interaction is deferred, the deferred response is yet to be edited."""
+    UPDATE_DEFERRED = "update_deferred"
+    """The component interaction is deferred as an update, the message of the component is yet to be edited."""
+    RESPONDED = "responded"
+    """The interaction has a response message."""
+    MODAL = "modal"
+    """The interaction was responded to with a modal."""
+    DELETED = "deleted"
+    """The response message of the interaction was deleted."""
+
+
+def _listed(item: UndefinedOr[Any], items: UndefinedOr[Sequence[Any]]) -> UndefinedOr[list[Any]]:
+    if item is not UNDEFINED:
+        return [item]
+    return UNDEFINED if items is UNDEFINED else list(items)
+
+
+def _message_builder(
+    response_type: ResponseType,
+    content: UndefinedOr[object],
+    **kwargs: Any,  # noqa: ANN401 - forwarded to the builder as they are
+) -> InteractionMessageBuilder:
+    return InteractionMessageBuilder(
+        response_type,  # type: ignore
+        UNDEFINED if content is UNDEFINED else str(content),
+        **kwargs,
+    )
+
+
+_PENDING: frozenset[ResponseState] = frozenset({ResponseState.PENDING})
+_EDITABLE: frozenset[ResponseState] = frozenset(
+    {ResponseState.DEFERRED, ResponseState.UPDATE_DEFERRED, ResponseState.RESPONDED}
+)
+_FOLLOWABLE: frozenset[ResponseState] = frozenset(
+    {ResponseState.DEFERRED, ResponseState.UPDATE_DEFERRED, ResponseState.RESPONDED, ResponseState.DELETED}
+)
 
 
 @attrs.define(kw_only=True, hash=False, weakref_slot=False)
 class InteractionContext:
-    """Represents a context for interaction handling."""
+    """Represents a context for interaction handling.
+
+    Notes
+    -----
+        Requests acknowledging the interaction are shielded from the cancellation of the caller,
+        so a command cancelled by its timeout still leaves the response state as it is on Discord.
+    """
 
-    interaction: CommandInteraction | ComponentInteraction = attrs.field(eq=False)
+    interaction: CommandInteraction | ComponentInteraction | AutocompleteInteraction | ModalInteraction = attrs.field(
+        eq=False
+    )
     """The interaction object associated with this context."""
 
-    bot: GatewayBot = attrs.field(eq=False, repr=False)
+    bot: GatewayBot | RESTBot = attrs.field(eq=False, repr=False)
     """The bot instance handling this interaction."""
 
     arguments: dict[str, Any] = attrs.field(factory=dict, eq=False)
@@ -39,9 +105,67 @@ class InteractionContext:
 
     Notes
     -----
-        Only available for command interactions.
+        Available for command interactions, for component interactions, where it holds
+        the parameters parsed from the custom ID, and for modal interactions, where it
+        also holds the values of the text inputs.
     """
 
+    views: ViewStore | None = attrs.field(default=None, eq=False, repr=False)
+    """The store running views sent in responses to this interaction."""
+
+    reply: asyncio.Future[api.InteractionResponseBuilder] | None = attrs.field(default=None, eq=False, repr=False)
+    """
+    The future of the initial response, set when the interaction is received by an interaction server.
+
+    Notes
+    -----
+        The initial response, deferral or modal is then returned in the HTTP reply
+        to the interaction instead of being created with a REST request.
+    """
+
+    delivered: asyncio.Future[None] | None = attrs.field(default=None, eq=False, repr=False)
+    """
+    The future set once the interaction server has taken the initial response from `reply`.
+
+    Notes
+    -----
+        Initial responses given through `reply` wait for it, so requests made after them,
+        such as editing the response, are not sent before the reply. The server gives no
+        signal once the reply is written, so it is set when the reply is handed over for writing.
+    """
+
+    _state: ResponseState = attrs.field(default=ResponseState.PENDING, init=False, eq=False, repr=False)
+    _received_at: float = attrs.field(factory=time.monotonic, init=False, eq=False, repr=False)
+    _acknowledgement: asyncio.Future[None] | None = attrs.field(default=None, init=False, eq=False, repr=False)
+    _followups: FollowupQueue | None = attrs.field(default=None, init=False, eq=False, repr=False)
+
+    @property
+    def state(self) -> ResponseState:
+        """The response state of the interaction."""
+        return self._state
+
+    @property
+    def is_acknowledged(self) -> bool:
+        """Whether the interaction was responded to or deferred."""
+        return self._state is not ResponseState.PENDING
+
+    @property
+    def followups(self) -> FollowupQueue:
+        """The queue of the followup requests of the interaction."""
+        if self._followups is None:
+            self._followups = FollowupQueue()
+        return self._followups
+
+    @property
+    def expires_in(self) -> float:
+        """Seconds until the token of the interaction expires, negative if it has expired."""
+        return self._received_at + TOKEN_LIFETIME - time.monotonic()
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the token of the interaction has expired."""
+        return self.expires_in <= 0
+
     @property
     def user(self) -> User:
         """Returns the user who triggered this interaction."""
@@ -77,18 +201,56 @@ class InteractionContext:
         -------
         None
 
+        Raises
+        ------
+        InteractionStateError
+            If the interaction is already acknowledged.
+        InteractionExpired
+            If the token of the interaction has expired.
+
         Notes
         -----
-        The interaction token will remain valid for 15 minutes after deferring.
+        The interaction token will remain valid for 15 minutes after the interaction is received.
         """
-        if ephemeral:
-            flags |= MessageFlag.EPHEMERAL
-        return await self.bot.rest.create_interaction_response(
-            interaction=self.interaction.id,
-            token=self.interaction.token,
-            flags=flags,
-            response_type=ResponseType.DEFERRED_MESSAGE_CREATE,
-        )
+        with self._transition("defer", _PENDING, ResponseState.DEFERRED):
+            if ephemeral:
+                flags |= MessageFlag.EPHEMERAL
+            return await self._create_deferred_response(flags)
+
+    def defer_in_background(self, *, ephemeral: bool = False) -> asyncio.Future[None]:
+        """Defer the interaction without waiting for it.
+
+        Responses created until the deferral completes wait for it and then edit the deferred response.
+        Component interactions are deferred as an update of the message of the component instead,
+        which `update_message` and `edit_response` then edit.
+
+        Parameters
+        ----------
+        ephemeral : bool, optional
+            Whether to make the response ephemeral.
+
+        Returns
+        -------
+        asyncio.Future[None]
+            The future of the deferral.
+
+        Raises
+        ------
+        InteractionStateError
+            If the interaction is already acknowledged.
+        InteractionExpired
+            If the token of the interaction has expired.
+        """
+        update: bool = isinstance(self.interaction, ComponentInteraction)
+        with self._transition("defer", _PENDING, ResponseState.UPDATE_DEFERRED if update else ResponseState.DEFERRED):
+            flags: MessageFlag = MessageFlag.EPHEMERAL if ephemeral else MessageFlag.NONE
+            self._acknowledgement = asyncio.ensure_future(
+                self._create_deferred_response(
+                    flags, ResponseType.DEFERRED_MESSAGE_UPDATE if update else ResponseType.DEFERRED_MESSAGE_CREATE
+                )
+            )
+        self._acknowledgement.add_done_callback(self._on_background_deferral)
+        return self._acknowledgement
 
     async def create_response(
         self,
@@ -102,6 +264,7 @@ class InteractionContext:
         components: UndefinedOr[Sequence[api.ComponentBuilder]] = UNDEFINED,
         embed: UndefinedOr[Embed] = UNDEFINED,
         embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+        view: View | None = None,
         mentions_everyone: UndefinedOr[bool] = UNDEFINED,
         user_mentions: UndefinedOr[SnowflakeishSequence[PartialUser] | bool] = UNDEFINED,
         role_mentions: UndefinedOr[SnowflakeishSequence[PartialRole] | bool] = UNDEFINED,
@@ -128,6 +291,8 @@ class InteractionContext:
             Single embed.
         embeds : Sequence[Embed]
             Multiple embeds.
+        view : View | None
+            View to start, its components are sent instead of the given components.
         mentions_everyone : bool
             Whether to allow @everyone/@here mentions.
         user_mentions : SnowflakeishSequence[PartialUser] or bool
@@ -139,33 +304,514 @@ class InteractionContext:
         -------
         None
 
+        Raises
+        ------
+        InteractionStateError
+            If the interaction already has a response.
+        InteractionExpired
+            If the token of the interaction has expired.
+
         Notes
         -----
         Without deferring, interactions must be responded to within 3 seconds.
         For longer operations, use InteractionContext.defer first.
 
-        If the interaction already has a response (default or deferred), you must use
-        InteractionContext.edit_response instead or you'll receive an 'Already Acknowledged' error.
+        If the interaction already has a response, use InteractionContext.edit_response or
+        InteractionContext.respond instead. If the interaction was deferred, for example by
+        the auto-defer watchdog, the deferred response is edited instead. If a component interaction
+        was deferred as an update of its message, the response is sent as a followup.
         """
-        if ephemeral:
-            flags |= MessageFlag.EPHEMERAL
-        return await self.bot.rest.create_interaction_response(
-            interaction=self.interaction.id,
-            response_type=ResponseType.MESSAGE_CREATE,
-            token=self.interaction.token,
-            content=content,
+        if self._state is ResponseState.UPDATE_DEFERRED:
+            await self.create_followup(
+                content,
+                flags=flags,
+                ephemeral=ephemeral,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                view=view,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
+            return None
+        if self._state is ResponseState.DEFERRED:
+            await self.edit_response(
+                content,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                view=view,
+            )
+            return None
+        with self._transition("respond to", _PENDING, ResponseState.RESPONDED):
+            if ephemeral:
+                flags |= MessageFlag.EPHEMERAL
+            if view is not None:
+                components = self._start_view(view)
+            if self.reply is not None and not self.reply.done():
+                return await self._reply(
+                    _message_builder(
+                        ResponseType.MESSAGE_CREATE,
+                        content,
+                        flags=flags,
+                        attachments=_listed(attachment, attachments),
+                        components=_listed(component, components),
+                        embeds=_listed(embed, embeds),
+                        mentions_everyone=mentions_everyone,
+                        user_mentions=user_mentions,
+                        role_mentions=role_mentions,
+                    )
+                )
+            return await asyncio.shield(
+                self.bot.rest.create_interaction_response(
+                    interaction=self.interaction.id,
+                    response_type=ResponseType.MESSAGE_CREATE,
+                    token=self.interaction.token,
+                    content=content,
+                    flags=flags,
+                    attachment=attachment,
+                    attachments=attachments,
+                    component=component,
+                    components=components,
+                    embed=embed,
+                    embeds=embeds,
+                    mentions_everyone=mentions_everyone,
+                    user_mentions=user_mentions,
+                    role_mentions=role_mentions,
+                )
+            )
+
+    async def respond(  # noqa: PLR0913
+        self,
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        flags: MessageFlag = MessageFlag.NONE,
+        ephemeral: bool = False,
+        attachment: UndefinedOr[Resourceish] = UNDEFINED,
+        attachments: UndefinedOr[Sequence[Resourceish]] = UNDEFINED,
+        component: UndefinedOr[api.ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[api.ComponentBuilder]] = UNDEFINED,
+        embed: UndefinedOr[Embed] = UNDEFINED,
+        embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+        view: View | None = None,
+        mentions_everyone: UndefinedOr[bool] = UNDEFINED,
+        user_mentions: UndefinedOr[SnowflakeishSequence[PartialUser] | bool] = UNDEFINED,
+        role_mentions: UndefinedOr[SnowflakeishSequence[PartialRole] | bool] = UNDEFINED,
+    ) -> Message | None:
+        """Responds to the interaction in the way its response state allows.
+
+        Creates the initial response, edits the deferred response or, once the interaction
+        has a response, sends a followup message.
+
+        Parameters
+        ----------
+        content : Any
+            The response content.
+        flags : MessageFlag
+            Response flags to apply, ignored when the deferred response is edited.
+        ephemeral : bool
+            Makes response only visible to interaction author, ignored when the deferred response is edited.
+        attachment : Resourceish
+            Single file attachment.
+        attachments : Sequence[Resourceish]
+            Multiple file attachments.
+        component : api.ComponentBuilder
+            Single message component.
+        components : Sequence[api.ComponentBuilder]
+            Multiple message components.
+        embed : Embed
+            Single embed.
+        embeds : Sequence[Embed]
+            Multiple embeds.
+        view : View | None
+            View to start, its components are sent instead of the given components.
+        mentions_everyone : bool
+            Whether to allow @everyone/@here mentions.
+        user_mentions : SnowflakeishSequence[PartialUser] or bool
+            True to allow user pings, or list of allowed user mentions.
+        role_mentions : SnowflakeishSequence[PartialRole] or bool
+            True to allow role pings, or list of allowed role mentions.
+
+        Returns
+        -------
+        Message or None
+            The edited or followup message, None for the initial response.
+
+        Raises
+        ------
+        InteractionStateError
+            If the interaction was responded to with a modal.
+        InteractionExpired
+            If the token of the interaction has expired.
+        """
+        if self._state is ResponseState.PENDING:
+            return await self.create_response(
+                content,
+                flags=flags,
+                ephemeral=ephemeral,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                view=view,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
+        if self._state is ResponseState.DEFERRED:
+            return await self.edit_response(
+                content,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                view=view,
+            )
+        return await self.create_followup(
+            content,
             flags=flags,
+            ephemeral=ephemeral,
             attachment=attachment,
             attachments=attachments,
             component=component,
             components=components,
             embed=embed,
             embeds=embeds,
+            view=view,
             mentions_everyone=mentions_everyone,
             user_mentions=user_mentions,
             role_mentions=role_mentions,
         )
 
+    async def create_followup(  # noqa: PLR0913
+        self,
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        flags: MessageFlag = MessageFlag.NONE,
+        ephemeral: bool = False,
+        attachment: UndefinedOr[Resourceish] = UNDEFINED,
+        attachments: UndefinedOr[Sequence[Resourceish]] = UNDEFINED,
+        component: UndefinedOr[api.ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[api.ComponentBuilder]] = UNDEFINED,
+        embed: UndefinedOr[Embed] = UNDEFINED,
+        embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+        view: View | None = None,
+        mentions_everyone: UndefinedOr[bool] = UNDEFINED,
+        user_mentions: UndefinedOr[SnowflakeishSequence[PartialUser] | bool] = UNDEFINED,
+        role_mentions: UndefinedOr[SnowflakeishSequence[PartialRole] | bool] = UNDEFINED,
+    ) -> Message:
+        """Sends a followup message to the interaction.
+
+        Parameters
+        ----------
+        content : Any
+            The message content.
+        flags : MessageFlag
+            Message flags to apply.
+        ephemeral : bool
+            Makes the message only visible to interaction author.
+        attachment : Resourceish
+            Single file attachment.
+        attachments : Sequence[Resourceish]
+            Multiple file attachments.
+        component : api.ComponentBuilder
+            Single message component.
+        components : Sequence[api.ComponentBuilder]
+            Multiple message components.
+        embed : Embed
+            Single embed.
+        embeds : Sequence[Embed]
+            Multiple embeds.
+        view : View | None
+            View to start, its components are sent instead of the given components.
+        mentions_everyone : bool
+            Whether to allow @everyone/@here mentions.
+        user_mentions : SnowflakeishSequence[PartialUser] or bool
+            True to allow user pings, or list of allowed user mentions.
+        role_mentions : SnowflakeishSequence[PartialRole] or bool
+            True to allow role pings, or list of allowed role mentions.
+
+        Returns
+        -------
+        Message
+            The followup message.
+
+        Raises
+        ------
+        InteractionStateError
+            If the interaction is not acknowledged or was responded to with a modal.
+        InteractionExpired
+            If the token of the interaction has expired.
+
+        Notes
+        -----
+        Followups are sent one by one through the followup queue of the interaction. Text-only
+        followups waiting in the queue are merged into one message, which is then returned for each of them.
+        """
+        if self._acknowledgement is not None and not self._acknowledgement.done():
+            await asyncio.shield(self._acknowledgement)
+        with self._transition(
+            "send a followup to",
+            _FOLLOWABLE,
+            ResponseState.RESPONDED if self._state is ResponseState.DEFERRED else self._state,
+        ):
+            if ephemeral:
+                flags |= MessageFlag.EPHEMERAL
+            if view is not None:
+                components = self._start_view(view)
+            text_only: bool = isinstance(content, str) and all(
+                value is UNDEFINED
+                for value in (
+                    attachment,
+                    attachments,
+                    component,
+                    components,
+                    embed,
+                    embeds,
+                    mentions_everyone,
+                    user_mentions,
+                    role_mentions,
+                )
+            )
+            send = functools.partial(
+                self.bot.rest.execute_webhook,
+                self.interaction.application_id,
+                self.interaction.token,
+                flags=flags,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
+            message: Message = await self.followups.submit(send, content, merge_key=flags if text_only else None)
+            if view is not None:
+                view._sent_as_followup(self, message)
+            return message
+
+    async def edit_followup(  # noqa: PLR0913
+        self,
+        message: SnowflakeishOr[Message],
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        attachment: UndefinedOr[Resourceish] = UNDEFINED,
+        attachments: UndefinedOr[Sequence[Resourceish]] = UNDEFINED,
+        component: UndefinedOr[api.ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[api.ComponentBuilder]] = UNDEFINED,
+        embed: UndefinedOr[Embed] = UNDEFINED,
+        embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+        view: View | None = None,
+    ) -> Message:
+        """Modifies a followup message of the interaction.
+
+        Parameters
+        ----------
+        message : SnowflakeishOr[Message]
+            The followup message.
+        content : Any
+            The new message content.
+        attachment : Resourceish
+            Single file attachment.
+        attachments : Sequence[Resourceish]
+            Multiple file attachments.
+        component : api.ComponentBuilder
+            Single message component.
+        components : Sequence[api.ComponentBuilder]
+            Multiple message components.
+        embed : Embed
+            Single embed.
+        embeds : Sequence[Embed]
+            Multiple embeds.
+        view : View | None
+            View to start, its components are sent instead of the given components.
+
+        Returns
+        -------
+        Message
+            The modified message.
+
+        Raises
+        ------
+        InteractionStateError
+            If the interaction has no followups.
+        InteractionExpired
+            If the token of the interaction has expired.
+        """
+        with self._transition("edit a followup of", _FOLLOWABLE, self._state):
+            if view is not None:
+                components = self._start_view(view)
+            send = functools.partial(
+                self.bot.rest.edit_webhook_message,
+                self.interaction.application_id,
+                self.interaction.token,
+                message,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+            )
+            edited: Message = await self.followups.submit(send, content)
+            if view is not None:
+                view._sent_as_followup(self, edited)
+            return edited
+
+    async def delete_followup(self, message: SnowflakeishOr[Message]) -> None:
+        """Deletes a followup message of the interaction.
+
+        Parameters
+        ----------
+        message : SnowflakeishOr[Message]
+            The followup message.
+
+        Raises
+        ------
+        InteractionStateError
+            If the interaction has no followups.
+        InteractionExpired
+            If the token of the interaction has expired.
+        """
+        with self._transition("delete a followup of", _FOLLOWABLE, self._state):
+            send = functools.partial(
+                self.bot.rest.delete_webhook_message, self.interaction.application_id, self.interaction.token
+            )
+            await self.followups.submit(send, message)
+
+    async def create_modal_response(
+        self,
+        title: str,
+        custom_id: str,
+        *,
+        component: UndefinedOr[api.ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[api.ComponentBuilder]] = UNDEFINED,
+    ) -> None:
+        """Responds to the interaction with a modal.
+
+        Parameters
+        ----------
+        title : str
+            The title of the modal.
+        custom_id : str
+            The custom ID of the modal, matched by the modal router on submit.
+        component : api.ComponentBuilder
+            Single action row with a text input.
+        components : Sequence[api.ComponentBuilder]
+            Multiple action rows with text inputs.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        InteractionStateError
+            If the interaction is already acknowledged.
+
+        Notes
+        -----
+        A modal must be the first response to the interaction, so it cannot be sent after deferring.
+        Modals cannot be sent in response to a modal submit.
+        """
+        with self._transition("open a modal for", _PENDING, ResponseState.MODAL):
+            if self.reply is not None and not self.reply.done():
+                return await self._reply(
+                    InteractionModalBuilder(
+                        title=title, custom_id=custom_id, components=_listed(component, components) or []
+                    )
+                )
+            await asyncio.shield(
+                self.bot.rest.create_modal_response(
+                    self.interaction.id,
+                    self.interaction.token,
+                    title=title,
+                    custom_id=custom_id,
+                    component=component,
+                    components=components,
+                )
+            )
+
+    async def update_message(  # noqa: PLR0913
+        self,
+        content: UndefinedOr[Any] = UNDEFINED,
+        *,
+        component: UndefinedOr[api.ComponentBuilder] = UNDEFINED,
+        components: UndefinedOr[Sequence[api.ComponentBuilder]] = UNDEFINED,
+        embed: UndefinedOr[Embed] = UNDEFINED,
+        embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+        view: View | None = None,
+    ) -> None:
+        """Responds to a component interaction by editing the message of the component.
+
+        Parameters
+        ----------
+        content : Any
+            The new message content.
+        component : api.ComponentBuilder
+            Single message component.
+        components : Sequence[api.ComponentBuilder]
+            Multiple message components.
+        embed : Embed
+            Single embed.
+        embeds : Sequence[Embed]
+            Multiple embeds.
+        view : View | None
+            View whose components are sent instead of the given components, started if it is not running.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        InteractionStateError
+            If the interaction is already acknowledged, other than by deferring the update in the background.
+        """
+        if self._state is ResponseState.UPDATE_DEFERRED:
+            await self.edit_response(
+                content, component=component, components=components, embed=embed, embeds=embeds, view=view
+            )
+            return None
+        with self._transition("update the message of", _PENDING, ResponseState.RESPONDED):
+            if view is not None:
+                components = self._start_view(view)
+            if self.reply is not None and not self.reply.done():
+                return await self._reply(
+                    _message_builder(
+                        ResponseType.MESSAGE_UPDATE,
+                        content,
+                        components=_listed(component, components),
+                        embeds=_listed(embed, embeds),
+                    )
+                )
+            return await asyncio.shield(
+                self.bot.rest.create_interaction_response(
+                    interaction=self.interaction.id,
+                    response_type=ResponseType.MESSAGE_UPDATE,
+                    token=self.interaction.token,
+                    content=content,
+                    component=component,
+                    components=components,
+                    embed=embed,
+                    embeds=embeds,
+                )
+            )
+
     async def edit_response(
         self,
         content: UndefinedOr[Any] = UNDEFINED,
@@ -176,6 +822,7 @@ class InteractionContext:
         components: UndefinedOr[Sequence[api.ComponentBuilder]] = UNDEFINED,
         embed: UndefinedOr[Embed] = UNDEFINED,
         embeds: UndefinedOr[Sequence[Embed]] = UNDEFINED,
+        view: View | None = None,
     ) -> Message | None:
         """Modifies a previously sent interaction response.
 
@@ -195,26 +842,98 @@ class InteractionContext:
             Single embed.
         embeds : Sequence[Embed]
             Multiple embeds.
+        view : View | None
+            View to start, its components are sent instead of the given components.
 
         Returns
         -------
         Message or None
             The modified message response if successful.
+
+        Raises
+        ------
+        InteractionStateError
+            If the interaction has no response to edit.
+        InteractionExpired
+            If the token of the interaction has expired.
         """
-        return await self.bot.rest.edit_interaction_response(
-            application=self.interaction.application_id,
-            token=self.interaction.token,
-            content=content,
-            attachment=attachment,
-            attachments=attachments,
-            component=component,
-            components=components,
-            embed=embed,
-            embeds=embeds,
-        )
+        if self._acknowledgement is not None and not self._acknowledgement.done():
+            await asyncio.shield(self._acknowledgement)
+        with self._transition("edit the response to", _EDITABLE, ResponseState.RESPONDED):
+            if view is not None:
+                components = self._start_view(view)
+            return await self.bot.rest.edit_interaction_response(
+                application=self.interaction.application_id,
+                token=self.interaction.token,
+                content=content,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+            )
 
     async def delete_response(self) -> None:
-        """Deletes the response to this interaction if one exists."""
-        await self.bot.rest.delete_interaction_response(
-            application=self.interaction.application_id, token=self.interaction.token
+        """Deletes the response to this interaction.
+
+        Raises
+        ------
+        InteractionStateError
+            If the interaction has no response to delete.
+        InteractionExpired
+            If the token of the interaction has expired.
+        """
+        with self._transition("delete the response to", _EDITABLE, ResponseState.DELETED):
+            await self.bot.rest.delete_interaction_response(
+                application=self.interaction.application_id, token=self.interaction.token
+            )
+
+    def _on_background_deferral(self, acknowledgement: asyncio.Future[None]) -> None:
+        if acknowledgement.cancelled() or acknowledgement.exception() is None:
+            return
+        if self._state in {ResponseState.DEFERRED, ResponseState.UPDATE_DEFERRED}:
+            self._state = ResponseState.PENDING
+
+    async def _reply(self, response: api.InteractionResponseBuilder) -> None:
+        assert self.reply is not None
+        self.reply.set_result(response)
+        if self.delivered is not None:
+            await asyncio.shield(self.delivered)
+
+    async def _create_deferred_response(
+        self, flags: MessageFlag, response_type: ResponseType = ResponseType.DEFERRED_MESSAGE_CREATE
+    ) -> None:
+        if self.reply is not None and not self.reply.done():
+            return await self._reply(InteractionDeferredBuilder(response_type, flags=flags))  # type: ignore
+        await asyncio.shield(
+            self.bot.rest.create_interaction_response(
+                interaction=self.interaction.id, token=self.interaction.token, flags=flags, response_type=response_type
+            )
         )
+
+    @contextlib.contextmanager
+    def _transition(
+        self, action: str, allowed: Container[ResponseState], state: ResponseState
+    ) -> Generator[None, None, None]:
+        if self._state not in allowed:
+            raise InteractionStateError(action, self._state)
+        if self.is_expired:
+            raise InteractionExpired(action)
+        # set before the request so concurrent responses see it, reverted if the request fails;
+        # a cancelled shielded request still completes, so cancellation keeps the new state
+        previous: ResponseState = self._state
+        self._state = state
+        try:
+            yield
+        except Exception:
+            if self._state is state:
+                self._state = previous
+            raise
+
+    def _start_view(self, view: View) -> Sequence[api.ComponentBuilder]:
+        if not view.is_running:
+            if self.views is None:
+                raise AurumException("Views are not available in this context")
+            self.views.add(view, self)
+        return view.build()
@@ -1,7 +1,56 @@
+from __future__ import annotations
+
 from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aurum.context import ResponseState
 
-__all__: Sequence[str] = ("AurumException",)
+__all__: Sequence[str] = ("AurumException", "InteractionExpired", "InteractionStateError")
 
 
 class AurumException(Exception):
     """Base exception class for Aurum-related errors"""
+
+
+class InteractionStateError(AurumException):
+    """Exception raised when a response action is not possible in the response state of the interaction.
+
+    Parameters
+    ----------
+    action : str
+        Name of the rejected action.
+    state : ResponseState
+        The response state of the interaction.
+
+    Attributes
+    ----------
+    action : str
+        Name of the rejected action.
+    state : ResponseState
+        The response state of the interaction.
+    """
+
+    def __init__(self, action: str, state: ResponseState) -> None:
+        super().__init__(f"Cannot {action} an interaction in the {state.name} response state.")
+        self.action: str = action
+        self.state: ResponseState = state
+
+
+class InteractionExpired(AurumException):
+    """Exception raised when the token of an interaction has expired.
+
+    Parameters
+    ----------
+    action : str
+        Name of the rejected action.
+
+    Attributes
+    ----------
+    action : str
+        Name of the rejected action.
+    """
+
+    def __init__(self, action: str) -> None:
+        super().__init__(f"Cannot {action} an interaction, its token has expired.")
+        self.action: str = action
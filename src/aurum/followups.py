@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine, Hashable, Sequence
+from typing import Any
+
+__all__: Sequence[str] = ("MAX_CONTENT_LENGTH", "FollowupQueue")
+
+SendT = Callable[[Any], Coroutine[Any, Any, Any]]
+
+MAX_CONTENT_LENGTH: int = 2000
+"""Maximum length of the content of a message."""
+
+
+class _Request:
+    __slots__: Sequence[str] = ("send", "content", "merge_key", "futures")
+
+    def __init__(self, send: SendT, content: object, merge_key: Hashable | None) -> None:
+        self.send: SendT = send
+        self.content: object = content
+        self.merge_key: Hashable | None = merge_key
+        self.futures: list[asyncio.Future[Any]] = []
+
+    def can_merge(self, content: object, merge_key: Hashable | None) -> bool:
+        return (
+            merge_key is not None
+            and self.merge_key == merge_key
+            and isinstance(self.content, str)
+            and isinstance(content, str)
+            and len(self.content) + len(content) + 1 <= MAX_CONTENT_LENGTH
+        )
+
+
+class FollowupQueue:
+    """A queue serializing the followup requests of one interaction token.
+
+    Followup messages share one webhook rate limit bucket, so sending them concurrently
+    ends in 429 retries. Requests are sent one by one in submission order instead, by
+    a task running only while the queue is not empty. A text-only message waiting in the
+    queue absorbs the next text-only messages with the same merge key, as long as the
+    merged content fits in `MAX_CONTENT_LENGTH`.
+    """
+
+    __slots__: Sequence[str] = ("_pending", "_task", "_sent", "_merged")
+
+    def __init__(self) -> None:
+        self._pending: deque[_Request] = deque()
+        self._task: asyncio.Task[None] | None = None
+        self._sent: int = 0
+        self._merged: int = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def sent(self) -> int:
+        """Number of requests sent."""
+        return self._sent
+
+    @property
+    def merged(self) -> int:
+        """Number of messages merged into a waiting message instead of being sent."""
+        return self._merged
+
+    def submit(self, send: SendT, content: object = None, *, merge_key: Hashable | None = None) -> asyncio.Future[Any]:
+        """Queue a request.
+
+        Parameters
+        ----------
+        send : SendT
+            Function sending the request with the given content.
+        content : object, optional
+            The content passed to `send`.
+        merge_key : Hashable | None, optional
+            Key of a text-only message, it is merged only with messages of the same key.
+            None if the request must not be merged.
+
+        Returns
+        -------
+        asyncio.Future[Any]
+            The future of the result of `send`, shared by merged messages.
+        """
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        last: _Request | None = self._pending[-1] if self._pending else None
+        if last is not None and last.can_merge(content, merge_key):
+            last.content = f"{last.content}\n{content}"
+            last.futures.append(future)
+            self._merged += 1
+            return future
+
+        request: _Request = _Request(send, content, merge_key)
+        request.futures.append(future)
+        self._pending.append(request)
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+        return future
+
+    async def _drain(self) -> None:
+        try:
+            while self._pending:
+                request: _Request = self._pending.popleft()
+                try:
+                    result: Any = await request.send(request.content)
+                except Exception as error:
+                    for future in request.futures:
+                        if not future.done():
+                            future.set_exception(error)
+                    continue
+                self._sent += 1
+                for future in request.futures:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._task = None
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+from collections.abc import Hashable, Sequence
+from typing import Generic, TypeVar
+
+__all__: Sequence[str] = ("HashRing",)
+
+NodeT = TypeVar("NodeT", bound=Hashable)
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+# type parameter syntax needs Python 3.12, the package supports 3.10
+class HashRing(Generic[NodeT]):  # noqa: UP046
+    """A consistent hash ring mapping keys to nodes.
+
+    Every node is placed on the ring at `replicas` points. A key belongs to the node
+    of the first point after the hash of the key, so adding or removing a node only
+    moves the keys of that node.
+
+    Parameters
+    ----------
+    nodes : Sequence[NodeT]
+        The nodes, identified by their string representations.
+    replicas : int, default 100
+        Number of points of each node on the ring.
+    """
+
+    __slots__: Sequence[str] = ("replicas", "_points", "_nodes")
+
+    def __init__(self, nodes: Sequence[NodeT] = (), *, replicas: int = 100) -> None:
+        self.replicas: int = replicas
+        self._points: list[int] = []
+        self._nodes: list[NodeT] = []
+        for node in nodes:
+            self.add(node)
+
+    def __len__(self) -> int:
+        return len(self._points) // self.replicas
+
+    def add(self, node: NodeT) -> None:
+        """Add a node to the ring.
+
+        Parameters
+        ----------
+        node : NodeT
+            The node.
+        """
+        for replica in range(self.replicas):
+            point: int = _hash(f"{node}#{replica}")
+            index: int = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._nodes.insert(index, node)
+
+    def remove(self, node: NodeT) -> None:
+        """Remove a node from the ring.
+
+        Parameters
+        ----------
+        node : NodeT
+            The node.
+        """
+        kept: list[tuple[int, NodeT]] = [
+            pair for pair in zip(self._points, self._nodes, strict=True) if pair[1] != node
+        ]
+        self._points = [point for point, _ in kept]
+        self._nodes = [node for _, node in kept]
+
+    def get(self, key: Hashable) -> NodeT:
+        """Get the node of a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key.
+
+        Returns
+        -------
+        NodeT
+            The node.
+
+        Raises
+        ------
+        LookupError
+            If the ring has no nodes.
+        """
+        if not self._points:
+            raise LookupError("Hash ring has no nodes")
+        index: int = bisect.bisect(self._points, _hash(str(key)))
+        return self._nodes[index % len(self._nodes)]
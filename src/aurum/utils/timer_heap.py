@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import Callable, Hashable, Sequence
+
+__all__: Sequence[str] = ("TimerHeap",)
+
+_COMPACT_SLACK: int = 64
+
+
+class TimerHeap:
+    """Timers keyed by hashable keys, driven by a single event loop callback.
+
+    Instead of a task per timer, deadlines are kept in a heap and one `loop.call_at`
+    handle is armed for the earliest of them. Rescheduling or cancelling a timer only
+    updates its deadline, outdated heap entries are skipped when they come up and the
+    heap is compacted once they outnumber live timers.
+
+    Parameters
+    ----------
+    callback : Callable[[Hashable], None]
+        Function called with the key of every expired timer.
+    """
+
+    __slots__: Sequence[str] = ("_callback", "_deadlines", "_heap", "_counter", "_handle", "_loop")
+
+    def __init__(self, callback: Callable[[Hashable], None]) -> None:
+        self._callback: Callable[[Hashable], None] = callback
+        self._deadlines: dict[Hashable, float] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._counter: itertools.count[int] = itertools.count()
+        self._handle: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: Hashable, delay: float) -> None:
+        """Schedule or reschedule the timer of a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The timer key.
+        delay : float
+            Seconds until the timer expires.
+        """
+        loop: asyncio.AbstractEventLoop = self._loop or asyncio.get_running_loop()
+        self._loop = loop
+        deadline: float = loop.time() + delay
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), key))
+        if len(self._heap) > 2 * len(self._deadlines) + _COMPACT_SLACK:
+            self._compact()
+        self._arm()
+
+    def cancel(self, key: Hashable) -> None:
+        """Cancel the timer of a key, if it is scheduled.
+
+        Parameters
+        ----------
+        key : Hashable
+            The timer key.
+        """
+        self._deadlines.pop(key, None)
+
+    def clear(self) -> None:
+        """Cancel every timer."""
+        self._deadlines.clear()
+        self._heap.clear()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if self._deadlines.get(entry[2]) == entry[0]]
+        heapq.heapify(self._heap)
+
+    def _arm(self) -> None:
+        assert self._loop is not None
+        if not self._heap:
+            return
+        when: float = self._heap[0][0]
+        if self._handle is not None:
+            if self._handle.when() <= when:
+                return  # fires earlier and rearms itself
+            self._handle.cancel()
+        self._handle = self._loop.call_at(when, self._fire)
+
+    def _fire(self) -> None:
+        assert self._loop is not None
+        self._handle = None
+        now: float = self._loop.time()
+        expired: list[Hashable] = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, key = heapq.heappop(self._heap)
+            if self._deadlines.get(key) == deadline:
+                del self._deadlines[key]
+                expired.append(key)
+        self._arm()
+        for key in expired:
+            self._callback(key)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+from aurum.commands.admission import AdmissionController, Priority
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.dispatch_table import DispatchEntry
+
+
+def test_sheds_low_priority_commands_over_the_in_flight_limit() -> None:
+    async def scenario() -> None:
+        admission = AdmissionController(max_in_flight=1, max_loop_lag=None)
+        assert admission.admit("low", Priority.LOW)
+        started = admission.enter()
+        assert not admission.admit("low", Priority.LOW)
+        assert admission.admit("normal", Priority.NORMAL)
+        admission.leave(started)
+        assert admission.admit("low", Priority.LOW)
+        assert admission.shed_counts == {"low": 1}
+
+    asyncio.run(scenario())
+
+
+def test_sheds_on_high_latency() -> None:
+    async def scenario() -> None:
+        admission = AdmissionController(max_loop_lag=None, max_latency=0.5, smoothing=1.0)
+        admission.leave(admission.enter() - 1.0)
+        assert admission.latency >= 1.0
+        assert not admission.admit("low", Priority.LOW)
+
+    asyncio.run(scenario())
+
+
+def test_probes_the_event_loop_lag() -> None:
+    async def scenario() -> None:
+        admission = AdmissionController(max_loop_lag=0.01, probe_interval=0.01, smoothing=1.0)
+        assert admission.admit("low", Priority.LOW)
+        time.sleep(0.05)  # block the loop while the probe is due
+        await asyncio.sleep(0.005)
+        assert admission.loop_lag > 0.01
+        assert not admission.admit("low", Priority.LOW)
+        admission.stop()
+
+    asyncio.run(scenario())
+
+
+def test_handler_responds_to_shed_commands(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def slow(context: object) -> None:
+            await release.wait()
+
+        handler = CommandHandler(bot, readiness=None, admission=AdmissionController(max_in_flight=1, response="busy"))
+        running = asyncio.ensure_future(handler.execute_command(make_interaction(), make_entry(slow), ()))
+        await asyncio.sleep(0)
+        shed = AsyncMock()
+        await handler.execute_command(make_interaction(), make_entry(shed, priority=Priority.LOW), ())
+        shed.assert_not_awaited()
+        release.set()
+        await running
+        assert handler.admission is not None
+        assert handler.admission.in_flight == 0
+        handler.admission.stop()
+
+    asyncio.run(scenario())
+    bot.rest.create_interaction_response.assert_awaited_once()
+    assert bot.rest.create_interaction_response.await_args.kwargs["content"] == "busy"
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+from hikari.interactions import ResponseType
+
+from aurum.commands.auto_defer import AutoDefer
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.dispatch_table import DispatchEntry
+from aurum.context import InteractionContext
+
+
+def test_defers_slow_commands_and_edits_the_deferred_response(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def callback(context: InteractionContext) -> None:
+        await asyncio.sleep(0.05)
+        await context.respond("done")
+
+    entry = make_entry(callback, auto_defer=AutoDefer(0.01, ephemeral=True))
+    handler = CommandHandler(bot, readiness=None)
+    asyncio.run(handler.execute_command(make_interaction(), entry, ()))
+
+    bot.rest.create_interaction_response.assert_awaited_once()
+    assert (
+        bot.rest.create_interaction_response.await_args.kwargs["response_type"] is ResponseType.DEFERRED_MESSAGE_CREATE
+    )
+    bot.rest.edit_interaction_response.assert_awaited_once()
+    assert handler.watchdog.fired == {"command": 1}
+    assert len(handler.watchdog) == 0
+
+
+def test_leaves_commands_acknowledged_in_time(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def callback(context: InteractionContext) -> None:
+        await context.respond("done")
+        await asyncio.sleep(0.05)
+
+    entry = make_entry(callback, auto_defer=AutoDefer(0.01))
+    handler = CommandHandler(bot, readiness=None)
+    asyncio.run(handler.execute_command(make_interaction(), entry, ()))
+
+    bot.rest.create_interaction_response.assert_awaited_once()
+    assert bot.rest.create_interaction_response.await_args.kwargs["response_type"] is ResponseType.MESSAGE_CREATE
+    assert handler.watchdog.fired == {}
+
+
+def test_stops_watching_when_the_callback_returns(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def scenario() -> None:
+        async def callback(context: InteractionContext) -> None: ...
+
+        handler = CommandHandler(bot, readiness=None)
+        await handler.execute_command(make_interaction(), make_entry(callback, auto_defer=AutoDefer(0.01)), ())
+        await asyncio.sleep(0.02)
+        assert handler.watchdog.fired == {}
+
+    asyncio.run(scenario())
+    bot.rest.create_interaction_response.assert_not_awaited()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+from hikari.commands import OptionType
+from hikari.interactions import AutocompleteInteractionOption
+
+from aurum.commands.autocomplete import AutocompleteCache
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.dispatch_table import DispatchEntry
+from aurum.commands.options import Choice
+
+
+def focused(value: str) -> AutocompleteInteractionOption:
+    return AutocompleteInteractionOption(
+        name="query", type=OptionType.STRING, value=value, options=None, is_focused=True
+    )
+
+
+def test_hits_and_misses() -> None:
+    cache = AutocompleteCache()
+    assert cache.get("key") is None
+    cache.set("key", ())
+    assert cache.get("key") == ()
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+
+def test_entries_expire() -> None:
+    cache = AutocompleteCache(ttl=-1)
+    cache.set("key", ())
+    assert cache.get("key") is None
+
+
+def test_evicts_least_recently_used_entries() -> None:
+    cache = AutocompleteCache(max_entries=10)
+    for key in range(10):
+        cache.set(key, ())
+    cache.get(0)
+    cache.set(10, ())
+    assert len(cache) == 9  # a tenth of the bound is freed at once
+    assert cache.get(0) is not None
+    assert cache.get(1) is None
+    assert cache.get(2) is None
+    assert cache.evictions == 2
+
+
+def test_handler_answers_repeated_queries_from_the_cache(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    autocomplete = AsyncMock(return_value=[Choice(name="apple", value="apple")])
+    entry = make_entry(AsyncMock(), autocomplete={"query": autocomplete})
+    handler = CommandHandler(bot, readiness=None)
+
+    async def scenario() -> None:
+        for value in ("ap", "ap", "b"):
+            await handler.execute_autocomplete(make_interaction(), entry, [focused(value)])
+
+    asyncio.run(scenario())
+    assert [call.args[1] for call in autocomplete.await_args_list] == ["ap", "b"]
+    assert bot.rest.create_autocomplete_response.await_count == 3
+    first, second = (call.args[2] for call in bot.rest.create_autocomplete_response.await_args_list[:2])
+    assert first is second
+    assert first[0].name == "apple"
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+from aurum.commands.circuit_breaker import BreakerState, CircuitBreaker
+from aurum.commands.cooldowns import Cooldown
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.dispatch_table import DispatchEntry
+
+
+def fail(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        assert breaker.allow("command")
+        breaker.record("command", RuntimeError(), 0.0)
+
+
+def test_stays_closed_below_min_calls() -> None:
+    breaker = CircuitBreaker(min_calls=5)
+    fail(breaker, 4)
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.current_failure_rate == 1.0
+
+
+def test_opens_at_failure_rate() -> None:
+    breaker = CircuitBreaker(min_calls=4, failure_rate=0.5)
+    for _ in range(2):
+        assert breaker.allow("command")
+        breaker.record("command", None, 0.0)
+    fail(breaker, 2)
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.transitions[BreakerState.OPEN] == 1
+
+
+def test_short_circuits_while_open() -> None:
+    breaker = CircuitBreaker(min_calls=1, reset_after=60)
+    fail(breaker)
+    assert not breaker.allow("command")
+    assert not breaker.allow("other")
+    assert breaker.short_circuited == {"command": 1, "other": 1}
+
+
+def test_slow_calls_and_timeouts_are_failures() -> None:
+    breaker = CircuitBreaker(min_calls=2, failure_rate=1.0, slow_call=1.0)
+    breaker.allow("command")
+    breaker.record("command", None, 2.0)
+    breaker.allow("command")
+    breaker.record("command", None, 0.0, timed_out=True)
+    assert breaker.state is BreakerState.OPEN
+
+
+def test_only_listed_exceptions_are_failures() -> None:
+    breaker = CircuitBreaker(min_calls=1, failures=(ConnectionError,))
+    breaker.allow("command")
+    breaker.record("command", ValueError(), 0.0)
+    assert breaker.state is BreakerState.CLOSED
+
+
+def test_half_open_probe_closes_on_success() -> None:
+    breaker = CircuitBreaker(min_calls=1, reset_after=0, probes=2)
+    fail(breaker)
+    assert breaker.allow("command")
+    assert breaker.allow("command")
+    assert not breaker.allow("command")  # both probes are running
+    breaker.record("command", None, 0.0)
+    assert breaker.state is BreakerState.HALF_OPEN
+    breaker.record("command", None, 0.0)
+    assert breaker.state is BreakerState.CLOSED
+
+
+def test_half_open_probe_reopens_on_failure() -> None:
+    breaker = CircuitBreaker(min_calls=1, reset_after=60)
+    fail(breaker)
+    breaker.reset_after = 0
+    assert breaker.allow("command")
+    breaker.record("command", RuntimeError(), 0.0)
+    breaker.reset_after = 60
+    assert breaker.state is BreakerState.OPEN
+
+
+def test_discard_frees_the_probe() -> None:
+    breaker = CircuitBreaker(min_calls=1, reset_after=0)
+    fail(breaker)
+    assert breaker.allow("command")
+    breaker.discard()
+    assert breaker.allow("command")
+
+
+def test_handler_does_not_leak_probes_on_cooldown_rejection(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    breaker = CircuitBreaker(min_calls=1, reset_after=0)
+    fail(breaker)
+    callback = AsyncMock()
+    entry = make_entry(callback, circuit_breaker=breaker, cooldown=Cooldown(1, 60))
+    handler = CommandHandler(bot, readiness=None)
+
+    async def scenario() -> None:
+        await handler.execute_command(make_interaction(user_id=1), entry, ())  # the probe closes the breaker
+        assert breaker.state is BreakerState.CLOSED
+        fail(breaker)  # open it again, the next call is half-open
+        await handler.execute_command(make_interaction(user_id=1), entry, ())  # rejected by the cooldown
+        assert breaker.state is BreakerState.HALF_OPEN
+        await handler.execute_command(make_interaction(user_id=2), entry, ())
+        assert breaker.state is BreakerState.CLOSED
+
+    asyncio.run(scenario())
+    assert callback.await_count == 2
+    assert breaker.short_circuited == {}
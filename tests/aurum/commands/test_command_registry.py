@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from hikari.snowflakes import Snowflake
+
+from aurum.commands.impl.command_registry import CommandRegistry
+from aurum.commands.slash_command import SlashCommand
+
+
+async def callback(context: object) -> None: ...
+
+
+PING = SlashCommand("ping", callback=callback, description="Ping.")
+BAN = SlashCommand("ban", callback=callback, description="Ban.", guild_id=Snowflake(10))
+COMMANDS = {"ping": PING, "ban": BAN}
+FINGERPRINTS = {PING: "a", BAN: "b"}
+
+
+def save(path: Path) -> CommandRegistry:
+    registry = CommandRegistry(path / "registry.json")
+    registry.save({Snowflake(1): PING}, {Snowflake(10): {Snowflake(2): BAN}}, FINGERPRINTS)
+    return registry
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    state = save(tmp_path).load(COMMANDS, FINGERPRINTS)
+    assert state.global_commands == {Snowflake(1): PING}
+    assert state.guild_commands == {Snowflake(10): {Snowflake(2): BAN}}
+    assert not state.is_outdated
+    assert [path.name for path in tmp_path.iterdir()] == ["registry.json"]  # no temporary files are left
+
+
+def test_reports_changed_unknown_and_missing_commands(tmp_path: Path) -> None:
+    registry = save(tmp_path)
+    kick = SlashCommand("kick", callback=callback, description="Kick.")
+    state = registry.load({"ping": PING, "kick": kick}, {PING: "changed", kick: "c"})
+    assert state.stale == ["ping"]
+    assert state.unknown == ["ban"]
+    assert state.missing == ["kick"]
+    assert state.is_outdated
+
+
+def test_missing_or_corrupt_file_reports_every_command_as_missing(tmp_path: Path) -> None:
+    registry = CommandRegistry(tmp_path / "registry.json")
+    assert registry.load(COMMANDS, FINGERPRINTS).missing == ["ping", "ban"]
+    registry.path.write_text("{", encoding="UTF-8")
+    state = registry.load(COMMANDS, FINGERPRINTS)
+    assert state.missing == ["ping", "ban"]
+    assert not state.global_commands
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from hikari.applications import Application
+from hikari.commands import SlashCommand as RemoteCommand
+from hikari.impl.special_endpoints import SlashCommandBuilder
+from hikari.snowflakes import Snowflake
+
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.command_sync import SyncMode
+from aurum.commands.slash_command import SlashCommand
+
+
+async def callback(context: object) -> None: ...
+
+
+def handler_with(bot: MagicMock, sync_mode: SyncMode, *builders: SlashCommandBuilder) -> CommandHandler:
+    handler = CommandHandler(bot, sync_mode=sync_mode, readiness=None)
+    handler._CommandHandler__application = MagicMock(spec=Application)  # type: ignore
+    for builder in builders:
+        command = SlashCommand(builder.name, callback=callback, description=builder.description)
+        handler.commands[command.name] = command
+        handler._commands_builders[command] = builder
+    return handler
+
+
+def test_diff_sync_only_writes_changed_commands(
+    bot: MagicMock, make_remote_command: Callable[..., RemoteCommand]
+) -> None:
+    unchanged, changed, removed = (
+        make_remote_command("same", "Same."),
+        make_remote_command("edited", "Old."),
+        make_remote_command("removed", "Removed."),
+    )
+    bot.rest.fetch_application_commands = AsyncMock(return_value=[unchanged, changed, removed])
+    bot.rest.create_slash_command = AsyncMock(
+        side_effect=lambda _, name, description, **__: make_remote_command(name, description)
+    )
+    bot.rest.delete_application_command = AsyncMock()
+    handler = handler_with(
+        bot,
+        SyncMode.DIFF,
+        SlashCommandBuilder("same", "Same."),
+        SlashCommandBuilder("edited", "New."),
+        SlashCommandBuilder("added", "Added."),
+    )
+
+    report = asyncio.run(handler.sync_commands())
+
+    assert (report.unchanged, report.created, report.updated, report.deleted) == (1, 1, 1, 1)
+    assert report.failed_scopes == 0
+    assert [call.args[1] for call in bot.rest.create_slash_command.await_args_list] == ["edited", "added"]
+    bot.rest.delete_application_command.assert_awaited_once()
+    assert bot.rest.delete_application_command.await_args.args[1] == removed.id
+    assert handler.global_commands[unchanged.id] is handler.commands["same"]
+    assert {command.name for command in handler.global_commands.values()} == {"same", "edited", "added"}
+
+
+def test_diff_sync_writes_nothing_when_up_to_date(
+    bot: MagicMock, make_remote_command: Callable[..., RemoteCommand]
+) -> None:
+    bot.rest.fetch_application_commands = AsyncMock(return_value=[make_remote_command("same", "Same.")])
+    bot.rest.create_slash_command = AsyncMock()
+    bot.rest.delete_application_command = AsyncMock()
+    bot.rest.set_application_commands = AsyncMock()
+    handler = handler_with(bot, SyncMode.DIFF, SlashCommandBuilder("same", "Same."))
+
+    report = asyncio.run(handler.sync_commands())
+
+    assert report.unchanged == 1
+    bot.rest.create_slash_command.assert_not_awaited()
+    bot.rest.delete_application_command.assert_not_awaited()
+    bot.rest.set_application_commands.assert_not_awaited()
+
+
+def test_bulk_sync_counts_every_command_as_updated(
+    bot: MagicMock, make_remote_command: Callable[..., RemoteCommand]
+) -> None:
+    bot.rest.set_application_commands = AsyncMock(return_value=[make_remote_command("same", "Same.")])
+    handler = handler_with(bot, SyncMode.BULK, SlashCommandBuilder("same", "Same."))
+
+    report = asyncio.run(handler.sync_commands())
+
+    assert report.updated == 1
+    bot.rest.set_application_commands.assert_awaited_once()
+
+
+def test_guild_scopes_sync_concurrently_within_the_limit(
+    bot: MagicMock, make_remote_command: Callable[..., RemoteCommand]
+) -> None:
+    running: list[int] = [0, 0]  # current, peak
+
+    async def set_application_commands(_: object, builders: list[SlashCommandBuilder], **__: object) -> list:
+        running[0] += 1
+        running[1] = max(running)
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        return [make_remote_command(builder.name, builder.description) for builder in builders]
+
+    bot.rest.set_application_commands = AsyncMock(side_effect=set_application_commands)
+    handler = handler_with(bot, SyncMode.BULK)
+    handler.sync_concurrency = 2
+    for guild in range(1, 6):
+        command = SlashCommand(f"guild-{guild}", callback=callback, description="Guild.", guild_id=Snowflake(guild))
+        handler.commands[command.name] = command
+        handler._commands_builders[command] = SlashCommandBuilder(command.name, "Guild.")
+
+    report = asyncio.run(handler.sync_commands())
+
+    assert report.updated == 5
+    assert running[1] == 3  # two guilds and the global scope
+    assert len(handler.guild_commands) == 5
+    assert set(report.timings) == {"global", "1", "2", "3", "4", "5"}
+
+
+def test_transient_failures_are_retried(
+    bot: MagicMock, make_remote_command: Callable[..., RemoteCommand], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(random, "uniform", lambda *_: 0.0)
+    bot.rest.set_application_commands = AsyncMock(
+        side_effect=[OSError(), asyncio.TimeoutError(), [make_remote_command("same", "Same.")]]  # noqa: UP041
+    )
+    handler = handler_with(bot, SyncMode.BULK, SlashCommandBuilder("same", "Same."))
+
+    report = asyncio.run(handler.sync_commands())
+
+    assert bot.rest.set_application_commands.await_count == 3
+    assert (report.updated, report.failed_scopes) == (1, 0)
+
+
+def test_scopes_fail_after_the_last_retry(bot: MagicMock, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(random, "uniform", lambda *_: 0.0)
+    bot.rest.set_application_commands = AsyncMock(side_effect=OSError())
+    handler = handler_with(bot, SyncMode.BULK, SlashCommandBuilder("same", "Same."))
+    handler.sync_retries = 2
+
+    report = asyncio.run(handler.sync_commands())
+
+    assert bot.rest.set_application_commands.await_count == 3
+    assert report.failed_scopes == 1
+    assert not handler.global_commands
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aurum.commands.concurrency import MaxConcurrency
+from aurum.commands.exceptions import MaxConcurrencyReached
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.dispatch_table import DispatchEntry
+
+
+def test_limits_in_flight_per_bucket() -> None:
+    async def scenario() -> None:
+        limiter = MaxConcurrency(1)
+        assert await limiter.acquire("a")
+        assert await limiter.acquire("b")
+        assert not await limiter.acquire("a")
+        assert limiter.in_flight == 2
+        assert limiter.rejected == 1
+
+    asyncio.run(scenario())
+
+
+def test_queued_invocations_run_in_order() -> None:
+    async def scenario() -> None:
+        limiter = MaxConcurrency(1, max_queue=2)
+        order: list[int] = []
+
+        async def invoke(index: int) -> None:
+            assert await limiter.acquire("a")
+            order.append(index)
+            await asyncio.sleep(0)
+            limiter.release("a")
+
+        await asyncio.gather(*(invoke(index) for index in range(3)))
+        assert order == [0, 1, 2]
+        assert limiter.buckets == 0
+
+    asyncio.run(scenario())
+
+
+def test_queue_is_bounded() -> None:
+    async def scenario() -> None:
+        limiter = MaxConcurrency(1, max_queue=1)
+        assert await limiter.acquire("a")
+        waiter = asyncio.ensure_future(limiter.acquire("a"))
+        await asyncio.sleep(0)
+        assert limiter.queue_depth("a") == 1
+        assert not await limiter.acquire("a")
+        limiter.release("a")
+        assert await waiter
+
+    asyncio.run(scenario())
+
+
+def test_queued_invocation_is_rejected_after_max_wait() -> None:
+    async def scenario() -> None:
+        limiter = MaxConcurrency(1, max_queue=1, max_wait=0.01)
+        assert await limiter.acquire("a")
+        assert not await limiter.acquire("a")
+        assert limiter.queue_depth("a") == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_leaves_the_queue() -> None:
+    async def scenario() -> None:
+        limiter = MaxConcurrency(1, max_queue=1)
+        assert await limiter.acquire("a")
+        waiter = asyncio.ensure_future(limiter.acquire("a"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        assert limiter.queue_depth("a") == 0
+        limiter.release("a")
+        assert limiter.in_flight == 0
+        assert limiter.buckets == 0
+
+    asyncio.run(scenario())
+
+
+def test_handler_responds_to_rejected_invocations(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def scenario() -> None:
+        release = asyncio.Event()
+        limiter = MaxConcurrency(1, response="busy")
+
+        async def callback(context: object) -> None:
+            await release.wait()
+
+        entry = make_entry(callback, max_concurrency=limiter)
+        handler = CommandHandler(bot, readiness=None)
+        running = asyncio.ensure_future(handler.execute_command(make_interaction(), entry, ()))
+        await asyncio.sleep(0)
+        await handler.execute_command(make_interaction(), entry, ())
+        release.set()
+        await running
+
+    asyncio.run(scenario())
+    bot.rest.create_interaction_response.assert_awaited_once()
+    assert bot.rest.create_interaction_response.await_args.kwargs["content"] == "busy"
+
+
+def test_handler_raises_without_response(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def scenario() -> None:
+        limiter = MaxConcurrency(1, response=None)
+        assert await limiter.acquire(10)  # the guild bucket of the interaction is busy
+        entry = make_entry(AsyncMock(), max_concurrency=limiter)
+        limiter.bucket = limiter.bucket.GUILD
+        with pytest.raises(MaxConcurrencyReached):
+            await CommandHandler(bot, readiness=None).execute_command(make_interaction(guild_id=10), entry, ())
+
+    asyncio.run(scenario())
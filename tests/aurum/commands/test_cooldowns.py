@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import time
+
+from aurum.commands.cooldowns import Cooldown
+
+
+def test_allows_rate_invocations_per_period() -> None:
+    cooldown = Cooldown(2, 60)
+    assert cooldown.hit("a") == 0.0
+    assert cooldown.hit("a") == 0.0
+    assert cooldown.hit("a") > 0.0
+    assert cooldown.hit("b") == 0.0
+    assert cooldown.rejected == 1
+
+
+def test_retry_after_matches_the_refill() -> None:
+    cooldown = Cooldown(1, 60)
+    assert cooldown.get_retry_after("a") == 0.0
+    cooldown.hit("a")
+    retry_after: float = cooldown.hit("a")
+    assert 59.0 < retry_after <= 60.0
+    assert 59.0 < cooldown.get_retry_after("a") <= 60.0
+
+
+def test_tokens_refill() -> None:
+    cooldown = Cooldown(1, 0.01)
+    cooldown.hit("a")
+    time.sleep(0.02)
+    assert cooldown.hit("a") == 0.0
+
+
+def test_reset() -> None:
+    cooldown = Cooldown(1, 60)
+    cooldown.hit("a")
+    cooldown.hit("b")
+    cooldown.reset("a")
+    assert cooldown.hit("a") == 0.0
+    cooldown.reset()
+    assert len(cooldown) == 0
+
+
+def test_eviction_drops_expired_buckets_first() -> None:
+    cooldown = Cooldown(1, 60, max_keys=10)
+    cooldown.hit("live")
+    cooldown._buckets.update(dict.fromkeys(range(9), 0.0))  # expired long ago
+    cooldown.hit("other")
+    cooldown.hit("new")
+    assert set(cooldown._buckets) == {"live", "other", "new"}
+    assert cooldown.hit("live") > 0.0
+
+
+def test_eviction_drops_least_recently_used_live_buckets() -> None:
+    cooldown = Cooldown(1, 60, max_keys=10)
+    for key in range(11):
+        cooldown.hit(key)
+    assert len(cooldown) == 9
+    assert 0 not in cooldown._buckets
+    assert cooldown.hit(10) > 0.0
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from hikari.commands import OptionType
+from hikari.interactions import CommandInteractionOption
+
+from aurum.commands.cooldowns import Cooldown
+from aurum.commands.decorators import sub_command
+from aurum.commands.exceptions import CommandNotFound, SubCommandNotFound
+from aurum.commands.impl.dispatch_table import DispatchTable
+from aurum.commands.options import Option
+from aurum.commands.slash_command import SlashCommand, SlashCommandGroup
+from aurum.commands.timeouts import Timeout
+
+GROUP_COOLDOWN = Cooldown(1, 60)
+RESET_TIMEOUT = Timeout(5)
+
+
+class Settings(SlashCommandGroup):
+    def __init__(self) -> None:
+        super().__init__("settings", cooldown=GROUP_COOLDOWN)
+
+    @sub_command("notifications", description="Notification settings.")
+    async def notifications(self, context: object) -> None: ...
+
+    @notifications.sub_command(
+        "set", description="Set the level.", options=[Option(type=OptionType.STRING, name="level")]
+    )
+    async def set(self, context: object, level: str) -> None: ...
+
+    @sub_command("reset", description="Reset the settings.", timeout=RESET_TIMEOUT)
+    async def reset(self, context: object) -> None: ...
+
+
+async def ping(context: object) -> None: ...
+
+
+def option(
+    name: str, type: OptionType, *options: CommandInteractionOption, value: object = None
+) -> CommandInteractionOption:
+    return CommandInteractionOption(name=name, type=type, value=value, options=list(options))  # type: ignore
+
+
+def interaction(command_id: int, *options: CommandInteractionOption) -> SimpleNamespace:
+    return SimpleNamespace(command_id=command_id, command_name="command", options=list(options))
+
+
+@pytest.fixture
+def table() -> DispatchTable:
+    table = DispatchTable()
+    table.compile({1: Settings(), 2: SlashCommand("ping", callback=ping, description="Ping.")})
+    return table
+
+
+def test_compiles_one_entry_per_callback(table: DispatchTable) -> None:
+    assert set(table.entries) == {(1, "notifications", "set"), (1, None, "reset"), (2, None, None)}
+
+
+def test_resolves_nested_sub_commands_to_their_leaf_options(table: DispatchTable) -> None:
+    level = option("level", OptionType.STRING, value="all")
+    received = interaction(
+        1, option("notifications", OptionType.SUB_COMMAND_GROUP, option("set", OptionType.SUB_COMMAND, level))
+    )
+    entry, options = table.resolve(received)  # type: ignore
+    assert entry.callback.__func__ is Settings.set.func  # type: ignore
+    assert entry.callback.__self__ is entry.command  # type: ignore
+    assert list(options) == [level]
+
+
+def test_resolves_top_level_commands(table: DispatchTable) -> None:
+    entry, options = table.resolve(interaction(2))  # type: ignore
+    assert entry.callback is ping
+    assert list(options) == []
+
+
+def test_sub_commands_inherit_the_policies_of_their_group(table: DispatchTable) -> None:
+    entry, _ = table.resolve(interaction(1, option("reset", OptionType.SUB_COMMAND)))  # type: ignore
+    assert entry.cooldown is GROUP_COOLDOWN
+    assert entry.timeout is RESET_TIMEOUT
+
+
+def test_unknown_routes_raise(table: DispatchTable) -> None:
+    with pytest.raises(CommandNotFound):
+        table.resolve(interaction(3))  # type: ignore
+    with pytest.raises(SubCommandNotFound):
+        table.resolve(interaction(1, option("missing", OptionType.SUB_COMMAND)))  # type: ignore
+
+
+def test_clear(table: DispatchTable) -> None:
+    table.clear()
+    assert len(table) == 0
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
+
+from hikari.interactions import ResponseType
+
+from aurum.commands.auto_defer import AutoDefer
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.dispatch_table import DispatchEntry
+from aurum.context import InteractionContext
+
+
+def handler_with(
+    bot: MagicMock, make_entry: Callable[..., DispatchEntry], callback: Callable[..., Awaitable[None]]
+) -> CommandHandler:
+    handler = CommandHandler(bot, readiness=None, drain_timeout=1.0)
+    handler._dispatch_table._entries = MappingProxyType({(1, None, None): make_entry(callback)})
+    return handler
+
+
+def test_waits_for_in_flight_interactions_and_drops_new_ones(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def callback(context: InteractionContext) -> None:
+        await asyncio.sleep(0.02)
+        await context.respond("done")
+
+    async def scenario() -> None:
+        handler = handler_with(bot, make_entry, callback)
+        running = asyncio.ensure_future(handler.dispatch_interaction(make_interaction(command_id=1, options=[])))
+        await asyncio.sleep(0)
+        assert handler.in_flight == 1
+        drain = asyncio.ensure_future(handler.drain())
+        await asyncio.sleep(0)
+        assert handler.is_draining
+        await handler.dispatch_interaction(make_interaction(command_id=1, options=[]))
+        report = await drain
+        await running
+        assert (report.in_flight, report.completed, report.abandoned, report.dropped) == (1, 1, 0, 1)
+
+    asyncio.run(scenario())
+    bot.rest.create_interaction_response.assert_awaited_once()
+
+
+def test_defers_unacknowledged_interactions_and_cancels_the_rest_at_the_deadline(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    cancelled = AsyncMock()
+
+    async def callback(context: InteractionContext) -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            await cancelled()
+            raise
+
+    async def scenario() -> None:
+        handler = handler_with(bot, make_entry, callback)
+        running = asyncio.ensure_future(handler.dispatch_interaction(make_interaction(command_id=1, options=[])))
+        await asyncio.sleep(0)
+        handler.auto_defer = AutoDefer(0.01)  # the policy of the drain, the command has none
+        report = await handler.drain(timeout=0.05)
+        assert (report.completed, report.abandoned) == (0, 1)
+        assert report.deferred == 1
+        assert running.cancelled()
+
+    asyncio.run(scenario())
+    cancelled.assert_awaited_once()
+    assert (
+        bot.rest.create_interaction_response.await_args.kwargs["response_type"] is ResponseType.DEFERRED_MESSAGE_CREATE
+    )
+
+
+def test_defers_component_interactions_as_message_updates(
+    bot: MagicMock, make_component_interaction: Callable[..., MagicMock]
+) -> None:
+    async def scenario() -> None:
+        handler = CommandHandler(bot, readiness=None, auto_defer=AutoDefer(0.01), drain_timeout=1.0)
+
+        @handler.components.component("close:{poll:int}")
+        async def close(context: InteractionContext, poll: int) -> None:
+            await asyncio.sleep(0.05)
+            await context.update_message(f"poll {poll} closed", components=[])
+
+        running = asyncio.ensure_future(handler.dispatch_interaction(make_component_interaction("close:1")))
+        await asyncio.sleep(0)
+        report = await handler.drain()
+        await running
+        assert (report.completed, report.deferred) == (1, 1)
+
+    asyncio.run(scenario())
+    bot.rest.create_interaction_response.assert_awaited_once()
+    assert (
+        bot.rest.create_interaction_response.await_args.kwargs["response_type"] is ResponseType.DEFERRED_MESSAGE_UPDATE
+    )
+    bot.rest.edit_interaction_response.assert_awaited_once()
+    assert bot.rest.edit_interaction_response.await_args.kwargs["content"] == "poll 1 closed"
+    bot.rest.execute_webhook.assert_not_awaited()
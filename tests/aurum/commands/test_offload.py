@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
+
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.dispatch_table import DispatchEntry
+from aurum.commands.offload import ExecutionMode, Offload, offload
+
+
+@offload
+def thread_name() -> str:
+    return threading.current_thread().name
+
+
+def test_runs_inline_outside_a_command() -> None:
+    assert asyncio.run(thread_name()) == threading.current_thread().name
+
+
+def test_runs_in_the_pool_of_the_bound_policy() -> None:
+    policy = Offload(ExecutionMode.THREAD, max_workers=1)
+
+    async def scenario() -> str:
+        token = policy.bind("command")
+        try:
+            return await thread_name()
+        finally:
+            Offload.unbind(token)
+
+    try:
+        assert asyncio.run(scenario()).startswith("aurum-offload")
+    finally:
+        policy.shutdown()
+    assert policy.stats["command"].calls == 1
+
+
+def test_inline_mode_records_the_timings() -> None:
+    policy = Offload(ExecutionMode.INLINE)
+    assert asyncio.run(policy.run("command", sum, (1, 2))) == 3
+    assert policy.stats["command"].calls == 1
+    assert policy.stats["command"].mean_wait_time == 0.0
+
+
+def test_stop_shuts_down_the_pools_of_the_commands(bot: MagicMock, make_entry: Callable[..., DispatchEntry]) -> None:
+    shared, other = MagicMock(spec=Offload), MagicMock(spec=Offload)
+    handler = CommandHandler(bot, readiness=None)
+    handler._dispatch_table._entries = MappingProxyType(
+        {
+            1: make_entry(AsyncMock(), offload=shared),
+            2: make_entry(AsyncMock(), offload=shared),
+            3: make_entry(AsyncMock(), offload=other),
+            4: make_entry(AsyncMock()),
+        }
+    )
+    asyncio.run(handler.stop(MagicMock()))
+    shared.shutdown.assert_called_once_with()
+    other.shutdown.assert_called_once_with()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+from hikari.interactions import ResponseType
+
+from aurum.commands.auto_defer import AutoDefer
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.readiness_gate import ReadinessGate
+from aurum.context import InteractionContext
+
+
+def test_buffered_interactions_are_released_in_order() -> None:
+    async def scenario() -> None:
+        gate = ReadinessGate()
+        released: list[int] = []
+
+        async def wait(index: int) -> None:
+            assert await gate.wait()
+            released.append(index)
+
+        waiters = asyncio.gather(*(wait(index) for index in range(3)))
+        await asyncio.sleep(0)
+        assert gate.buffered == 3
+        gate.open()
+        await waiters
+        assert released == [0, 1, 2]
+        assert gate.replayed == 3
+        assert gate.time_to_ready is not None
+        assert await gate.wait()  # open gates do not buffer
+
+    asyncio.run(scenario())
+
+
+def test_interactions_over_the_buffer_are_dropped() -> None:
+    async def scenario() -> None:
+        gate = ReadinessGate(max_size=1)
+        waiter = asyncio.ensure_future(gate.wait())
+        await asyncio.sleep(0)
+        assert not await gate.wait()
+        assert gate.dropped == 1
+        gate.open()
+        assert await waiter
+
+    asyncio.run(scenario())
+
+
+def test_interactions_expire_after_max_wait() -> None:
+    async def scenario() -> None:
+        gate = ReadinessGate(max_wait=0.01)
+        assert not await gate.wait()
+        assert gate.expired == 1
+        assert gate.buffered == 0
+
+    asyncio.run(scenario())
+
+
+def test_close_buffers_again() -> None:
+    gate = ReadinessGate()
+    gate.open()
+    gate.close()
+    assert not gate.is_ready
+    assert gate.time_to_ready is None
+
+
+def test_dropped_interactions_get_the_fallback_response(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock]
+) -> None:
+    handler = CommandHandler(bot, readiness=ReadinessGate(max_wait=0.01, response="starting"))
+    asyncio.run(handler.dispatch_interaction(make_interaction()))
+    bot.rest.create_interaction_response.assert_awaited_once()
+    assert bot.rest.create_interaction_response.await_args.kwargs["content"] == "starting"
+
+
+def test_dropped_interactions_without_response_get_nothing(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock]
+) -> None:
+    handler = CommandHandler(bot, readiness=ReadinessGate(max_wait=0.01, response=None))
+    asyncio.run(handler.dispatch_interaction(make_interaction()))
+    bot.rest.create_interaction_response.assert_not_awaited()
+
+
+def test_buffered_component_interactions_are_deferred_as_message_updates(
+    bot: MagicMock, make_component_interaction: Callable[..., MagicMock]
+) -> None:
+    async def scenario() -> None:
+        readiness = ReadinessGate()
+        handler = CommandHandler(bot, readiness=readiness, auto_defer=AutoDefer(0.01))
+
+        @handler.components.component("close:{poll:int}")
+        async def close(context: InteractionContext, poll: int) -> None:
+            await context.update_message(f"poll {poll} closed", components=[])
+
+        buffered = asyncio.ensure_future(handler.dispatch_interaction(make_component_interaction("close:1")))
+        await asyncio.sleep(0.05)  # past the auto-defer deadline
+        assert readiness.buffered == 1
+        readiness.open()
+        await buffered
+
+    asyncio.run(scenario())
+    bot.rest.create_interaction_response.assert_awaited_once()
+    assert (
+        bot.rest.create_interaction_response.await_args.kwargs["response_type"] is ResponseType.DEFERRED_MESSAGE_UPDATE
+    )
+    bot.rest.edit_interaction_response.assert_awaited_once()
+    assert bot.rest.edit_interaction_response.await_args.kwargs["content"] == "poll 1 closed"
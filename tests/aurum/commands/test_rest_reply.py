@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+from hikari.impl.special_endpoints import InteractionMessageBuilder
+
+from aurum.commands.impl.command_handler import CommandHandler
+
+
+class Handler(CommandHandler):
+    async def dispatch_interaction(self, interaction: object) -> None:
+        context = self.create_context(interaction)  # type: ignore
+        await context.create_response("reply")
+        await context.edit_response("edited")
+
+
+def test_response_waits_until_the_server_takes_the_reply(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock]
+) -> None:
+    async def scenario() -> None:
+        listener = Handler(bot, readiness=None).on_rest_interaction(make_interaction())
+        response = await anext(listener)
+        assert isinstance(response, InteractionMessageBuilder)
+        assert response.content == "reply"
+        await asyncio.sleep(0.01)
+        bot.rest.edit_interaction_response.assert_not_awaited()
+        async for _ in listener:  # resumed by the server after the HTTP reply is built
+            pass
+        bot.rest.edit_interaction_response.assert_awaited_once()
+
+    asyncio.run(scenario())
+    bot.rest.create_interaction_response.assert_not_awaited()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Hashable
+
+from aurum.commands.admission import Priority
+from aurum.commands.scheduler import FairScheduler
+
+
+async def run_all(scheduler: FairScheduler, invocations: list[tuple[Hashable, Priority]]) -> list[Hashable]:
+    """Queue invocations behind a running one and return the order in which they run."""
+    order: list[Hashable] = []
+
+    async def invoke(key: Hashable, priority: Priority) -> None:
+        await scheduler.acquire(key, priority)
+        order.append(key)
+        await asyncio.sleep(0)
+        scheduler.release()
+
+    await scheduler.acquire("blocker")
+    tasks = [asyncio.ensure_future(invoke(key, priority)) for key, priority in invocations]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+def test_buckets_take_turns() -> None:
+    async def scenario() -> None:
+        scheduler = FairScheduler(max_in_flight=1)
+        order = await run_all(scheduler, [("flood", Priority.NORMAL)] * 4 + [("a", Priority.NORMAL)])
+        assert order == ["flood", "a", "flood", "flood", "flood"]
+        assert scheduler.in_flight == 0
+        assert scheduler.queue_depths == {}
+
+    asyncio.run(scenario())
+
+
+def test_quantum_serves_several_invocations_per_turn() -> None:
+    async def scenario() -> None:
+        scheduler = FairScheduler(max_in_flight=1, quantum=2)
+        order = await run_all(scheduler, [("flood", Priority.NORMAL)] * 4 + [("a", Priority.NORMAL)])
+        assert order == ["flood", "flood", "a", "flood", "flood"]
+
+    asyncio.run(scenario())
+
+
+def test_higher_priorities_are_served_first() -> None:
+    async def scenario() -> None:
+        scheduler = FairScheduler(max_in_flight=1)
+        order = await run_all(scheduler, [("low", Priority.LOW), ("normal", Priority.NORMAL), ("high", Priority.HIGH)])
+        assert order == ["high", "normal", "low"]
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiters_leave_the_queue() -> None:
+    async def scenario() -> None:
+        scheduler = FairScheduler(max_in_flight=1)
+        await scheduler.acquire("a")
+        waiter = asyncio.ensure_future(scheduler.acquire("b"))
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth("b") == 1
+        waiter.cancel()
+        await asyncio.sleep(0)
+        assert scheduler.queued == 0
+        scheduler.release()
+        assert scheduler.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_idle_scheduler_does_not_queue() -> None:
+    async def scenario() -> None:
+        scheduler = FairScheduler(max_in_flight=2)
+        await scheduler.acquire("a")
+        await scheduler.acquire("a")
+        assert (scheduler.in_flight, scheduler.queued) == (2, 0)
+
+    asyncio.run(scenario())
+
+
+def test_waiters_cancelled_with_the_holder_do_not_wedge_the_scheduler() -> None:
+    async def scenario() -> None:
+        scheduler = FairScheduler(max_in_flight=1)
+        release = asyncio.Event()
+
+        async def invoke(key: Hashable) -> None:
+            await scheduler.acquire(key)
+            try:
+                await release.wait()
+            finally:
+                scheduler.release()
+
+        running = asyncio.ensure_future(invoke("a"))
+        queued = asyncio.ensure_future(invoke("a"))
+        await asyncio.sleep(0)
+        assert scheduler.queued == 1
+        running.cancel()
+        queued.cancel()
+        await asyncio.gather(running, queued, return_exceptions=True)
+        assert (scheduler.in_flight, scheduler.queued, scheduler.queue_depths) == (0, 0, {})
+        await asyncio.wait_for(scheduler.acquire("a"), 1)
+
+    asyncio.run(scenario())
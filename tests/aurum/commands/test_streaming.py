@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from aurum.commands.streaming import ResponseStream
+from aurum.context import InteractionContext
+
+
+@pytest.fixture
+def context(bot: MagicMock, make_interaction: Callable[..., MagicMock]) -> InteractionContext:
+    return InteractionContext(interaction=make_interaction(), bot=bot)
+
+
+async def count(values: int, delay: float = 0.0) -> AsyncIterator[int]:
+    for value in range(values):
+        await asyncio.sleep(delay)
+        yield value
+
+
+def test_values_are_coalesced_and_the_last_one_is_written(bot: MagicMock, context: InteractionContext) -> None:
+    async def scenario() -> ResponseStream:
+        stream = ResponseStream(context, interval=0.05)
+        await stream.consume(count(100))
+        return stream
+
+    stream = asyncio.run(scenario())
+    assert stream.writes + stream.coalesced == 100
+    assert stream.writes <= 2
+    bot.rest.create_interaction_response.assert_awaited_once()
+    last = bot.rest.edit_interaction_response.await_args or bot.rest.create_interaction_response.await_args
+    assert last.kwargs["content"] == "99"
+
+
+def test_writes_respect_the_interval(bot: MagicMock, context: InteractionContext) -> None:
+    async def scenario() -> ResponseStream:
+        stream = ResponseStream(context, interval=0.02)
+        await stream.consume(count(10, 0.005))
+        return stream
+
+    stream = asyncio.run(scenario())
+    assert 2 <= stream.writes < 10
+
+
+def test_failed_write_is_raised_by_the_next_push(bot: MagicMock, context: InteractionContext) -> None:
+    bot.rest.create_interaction_response.side_effect = ConnectionError()
+
+    async def scenario() -> None:
+        stream = ResponseStream(context, interval=0)
+        stream.push("first")
+        await asyncio.sleep(0.01)
+        with pytest.raises(ConnectionError):
+            stream.push("second")
+
+    asyncio.run(scenario())
+
+
+def test_failed_write_is_raised_by_consume(bot: MagicMock, context: InteractionContext) -> None:
+    bot.rest.create_interaction_response.side_effect = ConnectionError()
+
+    async def scenario() -> None:
+        with pytest.raises(ConnectionError):
+            await ResponseStream(context, interval=0).consume(count(10, 0.001))
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_consumer_cancels_the_writer(context: InteractionContext) -> None:
+    async def scenario() -> None:
+        stream = ResponseStream(context, interval=60)
+        consumer = asyncio.ensure_future(stream.consume(count(10, 60)))
+        await asyncio.sleep(0)
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+        await asyncio.sleep(0)
+        assert stream._writer.cancelled()
+
+    asyncio.run(scenario())
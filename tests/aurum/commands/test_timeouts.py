@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+from aurum.commands.impl.command_handler import CommandHandler
+from aurum.commands.impl.dispatch_table import DispatchEntry
+from aurum.commands.timeouts import Timeout
+from aurum.context import InteractionContext
+
+
+def test_cancels_the_callback_and_sends_the_fallback(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    cleaned_up: list[bool] = []
+
+    async def callback(context: InteractionContext) -> None:
+        try:
+            await asyncio.sleep(60)
+        finally:
+            cleaned_up.append(True)
+
+    timeout = Timeout(0.01, response="too slow")
+    asyncio.run(
+        CommandHandler(bot, readiness=None).execute_command(
+            make_interaction(), make_entry(callback, timeout=timeout), ()
+        )
+    )
+
+    assert cleaned_up == [True]
+    assert timeout.expired == {"command": 1}
+    assert timeout.time_spent["command"] >= 0.01
+    bot.rest.create_interaction_response.assert_awaited_once()
+    assert bot.rest.create_interaction_response.await_args.kwargs["content"] == "too slow"
+
+
+def test_edits_the_deferred_response(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def callback(context: InteractionContext) -> None:
+        await context.defer()
+        await asyncio.sleep(60)
+
+    entry = make_entry(callback, timeout=Timeout(0.01, response="too slow"))
+    asyncio.run(CommandHandler(bot, readiness=None).execute_command(make_interaction(), entry, ()))
+
+    bot.rest.edit_interaction_response.assert_awaited_once()
+
+
+def test_sends_a_followup_after_a_response(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def callback(context: InteractionContext) -> None:
+        await context.respond("partial")
+        await asyncio.sleep(60)
+
+    entry = make_entry(callback, timeout=Timeout(0.01, response="too slow"))
+    asyncio.run(CommandHandler(bot, readiness=None).execute_command(make_interaction(), entry, ()))
+
+    bot.rest.create_interaction_response.assert_awaited_once()
+    bot.rest.execute_webhook.assert_awaited_once()
+    assert bot.rest.execute_webhook.await_args.args[2] == "too slow"
+
+
+def test_handler_timeout_without_fallback_sends_nothing(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock], make_entry: Callable[..., DispatchEntry]
+) -> None:
+    async def callback(context: InteractionContext) -> None:
+        await asyncio.sleep(60)
+
+    handler = CommandHandler(bot, readiness=None, timeout=Timeout(0.01, response=None))
+    asyncio.run(handler.execute_command(make_interaction(), make_entry(callback), ()))
+
+    assert handler.timeout is not None
+    assert handler.timeout.expired == {"command": 1}
+    bot.rest.create_interaction_response.assert_not_awaited()
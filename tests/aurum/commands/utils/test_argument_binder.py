@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from hikari.commands import OptionType
+from hikari.interactions import CommandInteractionOption
+from hikari.snowflakes import Snowflake
+
+from aurum.commands.options import Option
+from aurum.commands.utils.argument_binder import ArgumentBinder
+
+MEMBER = object()
+USER = object()
+ROLE = object()
+
+
+def received(name: str, type: OptionType, value: object) -> CommandInteractionOption:
+    return CommandInteractionOption(name=name, type=type, value=value, options=None)  # type: ignore
+
+
+def interaction() -> SimpleNamespace:
+    resolved = SimpleNamespace(
+        members={Snowflake(1): MEMBER},
+        users={Snowflake(1): USER, Snowflake(2): USER},
+        roles={Snowflake(3): ROLE},
+        channels={},
+        attachments={},
+    )
+    return SimpleNamespace(resolved=resolved)
+
+
+def test_fills_in_defaults_of_missing_optional_options() -> None:
+    binder = ArgumentBinder(
+        [
+            Option(type=OptionType.STRING, name="text"),
+            Option(type=OptionType.INTEGER, name="count", is_required=False, default=1),
+            Option(type=OptionType.BOOLEAN, name="silent", is_required=False),
+        ]
+    )
+    arguments = binder.bind(interaction(), [received("text", OptionType.STRING, "hi")])  # type: ignore
+    assert arguments == {"text": "hi", "count": 1}
+    arguments = binder.bind(interaction(), [received("count", OptionType.INTEGER, 5)])  # type: ignore
+    assert arguments == {"count": 5}
+
+
+def test_resolves_members_before_users() -> None:
+    binder = ArgumentBinder([Option(type=OptionType.USER, name="target")])
+    arguments = binder.bind(interaction(), [received("target", OptionType.USER, Snowflake(1))])  # type: ignore
+    assert arguments["target"] is MEMBER
+    arguments = binder.bind(interaction(), [received("target", OptionType.USER, Snowflake(2))])  # type: ignore
+    assert arguments["target"] is USER
+
+
+def test_resolves_mentionables_to_members_or_roles() -> None:
+    binder = ArgumentBinder([Option(type=OptionType.MENTIONABLE, name="mention")])
+    options = [received("mention", OptionType.MENTIONABLE, Snowflake(3))]
+    assert binder.bind(interaction(), options)["mention"] is ROLE  # type: ignore
+
+
+def test_passes_ids_through_without_resolved_data() -> None:
+    binder = ArgumentBinder([Option(type=OptionType.USER, name="target")])
+    options = [received("target", OptionType.USER, Snowflake(1))]
+    assert binder.bind(SimpleNamespace(resolved=None), options) == {"target": Snowflake(1)}  # type: ignore
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from hikari.commands import OptionType
+from hikari.locales import Locale
+
+from aurum.commands.options import Choice, Option
+from aurum.commands.utils.choice_index import MAX_CHOICES, ChoiceIndex
+
+FRUITS = ("apple", "apricot", "banana", "blackberry", "blueberry", "cherry", "grape", "grapefruit")
+
+
+def choices(names: tuple[str, ...]) -> list[Choice]:
+    return [Choice(name=name, value=index) for index, name in enumerate(names)]
+
+
+def names(found: object) -> list[str]:
+    return [choice.name for choice in found]  # type: ignore
+
+
+def test_matches_prefixes_in_name_order() -> None:
+    index = ChoiceIndex(choices(FRUITS))
+    assert names(index.search("gr")) == ["grape", "grapefruit"]
+    assert names(index.search("  AP ")) == ["apple", "apricot"]
+
+
+def test_empty_query_returns_the_first_choices() -> None:
+    index = ChoiceIndex(choices(FRUITS))
+    assert names(index.search("", limit=2)) == ["apple", "apricot"]
+
+
+def test_falls_back_to_trigrams_for_typos() -> None:
+    index = ChoiceIndex(choices(FRUITS))
+    assert names(index.search("bluebery"))[0] == "blueberry"
+    assert names(index.search("xyz")) == []
+
+
+def test_results_are_limited() -> None:
+    index = ChoiceIndex(choices(tuple(f"item {number:03}" for number in range(100))))
+    assert len(index.search("item")) == MAX_CHOICES
+    assert len(index.search("item", limit=5)) == 5
+
+
+def test_searches_localized_names() -> None:
+    index = ChoiceIndex(
+        [Choice(name="apple", value=1, name_localizations={Locale.DE: "Apfel"}), Choice(name="banana", value=2)]
+    )
+    found = index.search("apf", Locale.DE)
+    assert names(found) == ["Apfel"]
+    assert found[0].value == 1
+    assert names(index.search("ban", Locale.DE)) == ["banana"]
+    assert names(index.search("app", Locale.FR)) == ["apple"]  # default names without localizations
+
+
+def test_options_with_too_many_choices_are_indexed() -> None:
+    small = Option(type=OptionType.STRING, name="small", choices=choices(FRUITS))
+    large = Option(type=OptionType.INTEGER, name="large", choices=choices(tuple(map(str, range(MAX_CHOICES + 1)))))
+    assert small.choice_index is None
+    assert large.choice_index is not None
+    assert len(large.choice_index) == MAX_CHOICES + 1
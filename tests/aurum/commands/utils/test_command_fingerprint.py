@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from hikari.commands import CommandOption, OptionType, SlashCommand
+from hikari.impl.special_endpoints import SlashCommandBuilder
+
+from aurum.commands.utils.command_fingerprint import fingerprint_command
+
+TEXT = CommandOption(type=OptionType.STRING, name="text", description="Text.", is_required=True)
+
+
+def test_builders_match_their_remote_commands(make_remote_command: Callable[..., SlashCommand]) -> None:
+    builder = SlashCommandBuilder("echo", "Echo.", options=[TEXT])
+    assert fingerprint_command(builder) == fingerprint_command(make_remote_command("echo", "Echo.", [TEXT]))
+
+
+def test_any_difference_changes_the_fingerprint(make_remote_command: Callable[..., SlashCommand]) -> None:
+    builder = SlashCommandBuilder("echo", "Echo.", options=[TEXT])
+    optional = CommandOption(type=OptionType.STRING, name="text", description="Text.", is_required=False)
+    assert fingerprint_command(builder) != fingerprint_command(make_remote_command("echo", "Echo.", [optional]))
+    assert fingerprint_command(builder) != fingerprint_command(make_remote_command("echo", "Repeat.", [TEXT]))
+    assert fingerprint_command(builder) != fingerprint_command(SlashCommandBuilder("echo", "Echo."))
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+from hikari.snowflakes import Snowflake
+
+from aurum.components.component_router import ComponentRouter
+from aurum.components.custom_id import CustomIdPattern, CustomIdTrie
+from aurum.components.exceptions import ComponentNotFound
+from aurum.exceptions import AurumException
+
+
+async def callback(context: object, **parameters: object) -> None: ...
+
+
+def test_parses_typed_parameters() -> None:
+    pattern = CustomIdPattern("vote:{poll_id:int}:{choice}")
+    assert pattern.segments == ("vote", ("poll_id", "int"), ("choice", "str"))
+    assert pattern.names == ("poll_id", "choice")
+    assert pattern.format(poll_id=7, choice="yes") == "vote:7:yes"
+
+
+def test_rejects_invalid_patterns() -> None:
+    with pytest.raises(AurumException):
+        CustomIdPattern("vote:{poll_id:date}")
+    with pytest.raises(AurumException):
+        CustomIdPattern("vote:{id}:{id}")
+
+
+def test_static_segments_take_precedence() -> None:
+    trie: CustomIdTrie[str] = CustomIdTrie()
+    trie.insert(CustomIdPattern("page:{number:int}"), "number")
+    trie.insert(CustomIdPattern("page:last"), "last")
+    trie.insert(CustomIdPattern("page:{name}"), "name")
+    assert trie.match("page:last") == ("last", [])
+    assert trie.match("page:3") == ("number", [3])
+    assert trie.match("page:first") == ("name", ["first"])
+    assert trie.match("page") is None
+    assert trie.match("page:3:extra") is None
+    assert len(trie) == 3
+
+
+def test_backtracks_to_other_parameter_types() -> None:
+    trie: CustomIdTrie[str] = CustomIdTrie()
+    trie.insert(CustomIdPattern("{value:int}:int"), "int")
+    trie.insert(CustomIdPattern("{value:float}:float"), "float")
+    assert trie.match("1:float") == ("float", [1.0])
+    assert trie.match("1:int") == ("int", [1])
+
+
+def test_rejects_equivalent_patterns() -> None:
+    trie: CustomIdTrie[str] = CustomIdTrie()
+    trie.insert(CustomIdPattern("vote:{poll:int}"), "vote")
+    with pytest.raises(AurumException):
+        trie.insert(CustomIdPattern("vote:{other:int}"), "other")
+
+
+def test_router_resolves_named_parameters() -> None:
+    router = ComponentRouter()
+    router.component("ban:{user:snowflake}:{reason}")(callback)
+    route, parameters = router.resolve("ban:123:spam")
+    assert route.callback is callback
+    assert parameters == {"user": Snowflake(123), "reason": "spam"}
+    with pytest.raises(ComponentNotFound):
+        router.resolve("kick:123")
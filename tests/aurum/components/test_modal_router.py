@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from aurum.components.exceptions import ModalNotFound
+from aurum.components.modal_router import ModalRouter
+
+
+def submit(custom_id: str, **values: str) -> SimpleNamespace:
+    rows = [
+        SimpleNamespace(components=[SimpleNamespace(custom_id=name, value=value)]) for name, value in values.items()
+    ]
+    return SimpleNamespace(custom_id=custom_id, components=rows)
+
+
+def test_maps_text_inputs_to_parameters_of_the_same_names() -> None:
+    router = ModalRouter()
+
+    @router.modal("report:{user:int}")
+    async def report(context: object, user: int, reason: str, details: str = "") -> None: ...
+
+    route, arguments = router.resolve(submit("report:5", reason="spam", details="links", unrelated="x"))  # type: ignore
+    assert route.callback is report
+    assert arguments == {"user": 5, "reason": "spam", "details": "links"}
+
+
+def test_maps_text_inputs_by_the_field_map() -> None:
+    router = ModalRouter()
+
+    async def feedback(context: object, **arguments: str) -> None: ...
+
+    router.add_modal("feedback", feedback, fields={"feedback-text": "text"})
+    _, arguments = router.resolve(submit("feedback", **{"feedback-text": "great"}))  # type: ignore
+    assert arguments == {"text": "great"}
+
+
+def test_unknown_modals_raise() -> None:
+    with pytest.raises(ModalNotFound):
+        ModalRouter().resolve(submit("missing"))  # type: ignore
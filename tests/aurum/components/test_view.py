@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from unittest.mock import MagicMock
+
+import pytest
+
+from aurum.components.exceptions import ComponentNotFound
+from aurum.components.view import View, ViewStore, action
+from aurum.context import InteractionContext
+
+
+class Counter(View):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)  # type: ignore
+        self.clicks: int = 0
+        self.timed_out: bool = False
+
+    def build(self) -> Sequence[object]:  # noqa: PLR6301
+        return ()
+
+    @action("click")
+    async def click(self, context: object) -> None:
+        self.clicks += 1
+
+    async def on_timeout(self) -> None:
+        self.timed_out = True
+
+
+def make_context(custom_id: str = "") -> MagicMock:
+    context = MagicMock()
+    context.interaction.custom_id = custom_id
+    return context
+
+
+def test_dispatches_to_the_action() -> None:
+    async def scenario() -> None:
+        store = ViewStore()
+        view = Counter()
+        store.add(view, make_context())
+        await store.dispatch(make_context(view.custom_id("click")))
+        assert view.clicks == 1
+        assert view.is_running
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("custom_id", ["aurum-view", "aurum-view:id", "unrelated"])
+def test_malformed_custom_id_is_not_found(custom_id: str) -> None:
+    with pytest.raises(ComponentNotFound):
+        asyncio.run(ViewStore().dispatch(make_context(custom_id)))
+
+
+def test_unknown_view_and_action_are_not_found() -> None:
+    async def scenario() -> None:
+        store = ViewStore()
+        view = Counter()
+        store.add(view, make_context())
+        with pytest.raises(ComponentNotFound):
+            await store.dispatch(make_context("aurum-view:missing:click"))
+        with pytest.raises(ComponentNotFound):
+            await store.dispatch(make_context(view.custom_id("missing")))
+
+    asyncio.run(scenario())
+
+
+def test_view_expires_after_inactivity() -> None:
+    async def scenario() -> None:
+        store = ViewStore()
+        view = Counter(timeout=0.1)
+        store.add(view, make_context())
+        await asyncio.sleep(0.06)
+        await store.dispatch(make_context(view.custom_id("click")))  # restarts the timeout
+        await asyncio.sleep(0.06)
+        assert view.is_running
+        await asyncio.sleep(0.1)
+        assert not view.is_running
+        assert view.timed_out
+        assert store.expired == 1
+
+    asyncio.run(scenario())
+
+
+def test_least_recently_used_views_are_evicted() -> None:
+    async def scenario() -> None:
+        store = ViewStore(max_views=10)
+        views = [Counter() for _ in range(11)]
+        for view in views[:10]:
+            store.add(view, make_context())
+        await store.dispatch(make_context(views[0].custom_id("click")))
+        store.add(views[10], make_context())
+        await asyncio.sleep(0)
+        assert views[0].is_running
+        assert not views[1].is_running
+        assert views[1].timed_out
+        assert store.evicted == 2
+
+    asyncio.run(scenario())
+
+
+def test_stopped_view_does_not_time_out() -> None:
+    async def scenario() -> None:
+        store = ViewStore()
+        view = Counter(timeout=0.01)
+        store.add(view, make_context())
+        view.stop()
+        await asyncio.sleep(0.02)
+        assert not view.timed_out
+        assert len(store) == 0
+
+    asyncio.run(scenario())
+
+
+def test_disable_edits_the_initial_response(bot: MagicMock) -> None:
+    async def scenario() -> None:
+        context = make_context()
+        context.bot = bot
+        view = Counter()
+        ViewStore().add(view, context)
+        await view.disable()
+
+    asyncio.run(scenario())
+    bot.rest.edit_interaction_response.assert_awaited_once()
+    bot.rest.edit_webhook_message.assert_not_awaited()
+
+
+def test_disable_edits_the_followup_the_view_was_sent_in(
+    bot: MagicMock, make_interaction: Callable[..., MagicMock]
+) -> None:
+    async def scenario() -> None:
+        context = InteractionContext(interaction=make_interaction(), bot=bot, views=ViewStore())
+        await context.create_response("first")
+        view = Counter()
+        await context.create_followup("second", view=view)
+        await view.disable()
+
+    bot.rest.execute_webhook.return_value.id = 42
+    asyncio.run(scenario())
+    bot.rest.edit_interaction_response.assert_not_awaited()
+    assert bot.rest.edit_webhook_message.await_args.args[2] == 42
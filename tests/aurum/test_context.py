@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+import pytest
+from hikari.interactions import ResponseType
+
+from aurum.context import InteractionContext, ResponseState
+from aurum.exceptions import InteractionStateError
+
+
+@pytest.fixture
+def context(bot: MagicMock, make_interaction: Callable[..., MagicMock]) -> InteractionContext:
+    return InteractionContext(interaction=make_interaction(), bot=bot)
+
+
+def test_response_moves_through_the_states(context: InteractionContext) -> None:
+    async def scenario() -> None:
+        await context.defer()
+        assert context.state is ResponseState.DEFERRED
+        await context.edit_response("done")
+        assert context.state is ResponseState.RESPONDED
+        await context.delete_response()
+        assert context.state is ResponseState.DELETED
+
+    asyncio.run(scenario())
+
+
+def test_impossible_responses_are_rejected_locally(bot: MagicMock, context: InteractionContext) -> None:
+    async def scenario() -> None:
+        with pytest.raises(InteractionStateError):
+            await context.edit_response("nothing to edit")
+        await context.create_response("first")
+        with pytest.raises(InteractionStateError):
+            await context.defer()
+        with pytest.raises(InteractionStateError):
+            await context.create_modal_response("title", "modal")
+
+    asyncio.run(scenario())
+    bot.rest.create_interaction_response.assert_awaited_once()
+    bot.rest.edit_interaction_response.assert_not_awaited()
+
+
+def test_respond_picks_the_request(bot: MagicMock, context: InteractionContext) -> None:
+    async def scenario() -> None:
+        await context.defer()
+        await context.respond("edits the deferred response")
+        await context.respond("sends a followup")
+
+    asyncio.run(scenario())
+    bot.rest.edit_interaction_response.assert_awaited_once()
+    bot.rest.execute_webhook.assert_awaited_once()
+
+
+def test_failed_request_rolls_the_state_back(bot: MagicMock, context: InteractionContext) -> None:
+    bot.rest.create_interaction_response.side_effect = [ConnectionError(), None]
+
+    async def scenario() -> None:
+        with pytest.raises(ConnectionError):
+            await context.create_response("lost")
+        assert context.state is ResponseState.PENDING
+        await context.create_response("retried")
+        assert context.state is ResponseState.RESPONDED
+
+    asyncio.run(scenario())
+
+
+def test_failed_background_deferral_rolls_the_state_back(bot: MagicMock, context: InteractionContext) -> None:
+    bot.rest.create_interaction_response.side_effect = ConnectionError()
+
+    async def scenario() -> None:
+        deferral = context.defer_in_background()
+        assert context.state is ResponseState.DEFERRED
+        with pytest.raises(ConnectionError):
+            await deferral
+        assert context.state is ResponseState.PENDING
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_acknowledgement_keeps_the_state(bot: MagicMock, context: InteractionContext) -> None:
+    async def respond(**kwargs: object) -> None:
+        await asyncio.sleep(0.01)
+
+    bot.rest.create_interaction_response.side_effect = respond
+
+    async def scenario() -> None:
+        task = asyncio.ensure_future(context.create_response("shielded"))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert context.state is ResponseState.RESPONDED
+        await asyncio.sleep(0.02)
+
+    asyncio.run(scenario())
+
+
+def test_background_deferral_of_components_updates_their_message(
+    bot: MagicMock, make_component_interaction: Callable[..., MagicMock]
+) -> None:
+    context = InteractionContext(interaction=make_component_interaction("button"), bot=bot)
+
+    async def scenario() -> None:
+        await context.defer_in_background()
+        assert context.state is ResponseState.UPDATE_DEFERRED
+        await context.respond("sends a followup")
+        assert context.state is ResponseState.UPDATE_DEFERRED
+        await context.update_message("edits the message")
+        assert context.state is ResponseState.RESPONDED
+
+    asyncio.run(scenario())
+    assert (
+        bot.rest.create_interaction_response.await_args.kwargs["response_type"] is ResponseType.DEFERRED_MESSAGE_UPDATE
+    )
+    bot.rest.execute_webhook.assert_awaited_once()
+    assert bot.rest.edit_interaction_response.await_args.kwargs["content"] == "edits the message"
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aurum.followups import MAX_CONTENT_LENGTH, FollowupQueue
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.sent: list[object] = []
+        self.running: int = 0
+        self.peak: int = 0
+
+    async def send(self, content: object) -> object:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        if content == "fail":
+            raise RuntimeError(content)
+        self.sent.append(content)
+        return content
+
+
+def test_sends_requests_one_by_one_in_order() -> None:
+    async def scenario() -> None:
+        queue = FollowupQueue()
+        recorder = Recorder()
+        futures = [queue.submit(recorder.send, index) for index in range(5)]
+        assert await asyncio.gather(*futures) == [0, 1, 2, 3, 4]
+        assert recorder.sent == [0, 1, 2, 3, 4]
+        assert recorder.peak == 1
+        assert queue.sent == 5
+
+    asyncio.run(scenario())
+
+
+def test_merges_waiting_text_messages_of_the_same_key() -> None:
+    async def scenario() -> None:
+        queue = FollowupQueue()
+        recorder = Recorder()
+        first = queue.submit(recorder.send, "first")  # no merge key, never merged
+        futures = [queue.submit(recorder.send, text, merge_key="log") for text in ("a", "b", "c")]
+        other = queue.submit(recorder.send, "d", merge_key="other")
+        await asyncio.gather(first, *futures, other)
+        assert recorder.sent == ["first", "a\nb\nc", "d"]
+        assert {future.result() for future in futures} == {"a\nb\nc"}
+        assert queue.merged == 2
+
+    asyncio.run(scenario())
+
+
+def test_does_not_merge_past_the_content_limit() -> None:
+    async def scenario() -> None:
+        queue = FollowupQueue()
+        recorder = Recorder()
+        long = "x" * (MAX_CONTENT_LENGTH - 1)
+        await asyncio.gather(*(queue.submit(recorder.send, text, merge_key="log") for text in (long, "y")))
+        assert recorder.sent == [long, "y"]
+
+    asyncio.run(scenario())
+
+
+def test_failures_reach_their_futures_only() -> None:
+    async def scenario() -> None:
+        queue = FollowupQueue()
+        recorder = Recorder()
+        failed = queue.submit(recorder.send, "fail")
+        sent = queue.submit(recorder.send, "ok")
+        with pytest.raises(RuntimeError):
+            await failed
+        assert await sent == "ok"
+        assert len(queue) == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from aurum.utils.hash_ring import HashRing
+
+KEYS = range(10_000)
+
+
+def test_maps_keys_stably() -> None:
+    ring: HashRing[int] = HashRing(range(4))
+    other: HashRing[int] = HashRing([3, 1, 0, 2])
+    assert [ring.get(key) for key in KEYS] == [other.get(key) for key in KEYS]
+
+
+def test_spreads_keys_across_nodes() -> None:
+    ring: HashRing[int] = HashRing(range(4))
+    counts = Counter(ring.get(key) for key in KEYS)
+    assert set(counts) == {0, 1, 2, 3}
+    assert min(counts.values()) > len(KEYS) / 4 * 0.7
+
+
+def test_adding_a_node_only_moves_keys_to_it() -> None:
+    ring: HashRing[int] = HashRing(range(4))
+    before = {key: ring.get(key) for key in KEYS}
+    ring.add(4)
+    moved = [key for key in KEYS if ring.get(key) != before[key]]
+    assert {ring.get(key) for key in moved} == {4}
+    assert len(moved) < len(KEYS) / 5 * 1.3
+    assert len(ring) == 5
+
+
+def test_removing_a_node_only_moves_its_keys() -> None:
+    ring: HashRing[int] = HashRing(range(4))
+    before = {key: ring.get(key) for key in KEYS}
+    ring.remove(2)
+    assert all(ring.get(key) == node for key, node in before.items() if node != 2)
+    assert 2 not in {ring.get(key) for key in KEYS}
+
+
+def test_empty_ring_raises() -> None:
+    with pytest.raises(LookupError):
+        HashRing().get("key")
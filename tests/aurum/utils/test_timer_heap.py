@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Hashable
+
+from aurum.utils.timer_heap import TimerHeap
+
+
+def test_timers_fire_in_deadline_order() -> None:
+    async def scenario() -> None:
+        fired: list[Hashable] = []
+        timers = TimerHeap(fired.append)
+        timers.schedule("late", 0.02)
+        timers.schedule("early", 0.01)
+        await asyncio.sleep(0.04)
+        assert fired == ["early", "late"]
+        assert len(timers) == 0
+
+    asyncio.run(scenario())
+
+
+def test_rescheduling_moves_the_deadline() -> None:
+    async def scenario() -> None:
+        fired: list[Hashable] = []
+        timers = TimerHeap(fired.append)
+        timers.schedule("key", 0.01)
+        timers.schedule("key", 0.05)
+        await asyncio.sleep(0.02)
+        assert fired == []
+        assert "key" in timers
+        await asyncio.sleep(0.05)
+        assert fired == ["key"]
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_timers_do_not_fire() -> None:
+    async def scenario() -> None:
+        fired: list[Hashable] = []
+        timers = TimerHeap(fired.append)
+        timers.schedule("a", 0.01)
+        timers.schedule("b", 0.01)
+        timers.cancel("a")
+        await asyncio.sleep(0.02)
+        assert fired == ["b"]
+        timers.schedule("c", 0.01)
+        timers.clear()
+        await asyncio.sleep(0.02)
+        assert fired == ["b"]
+
+    asyncio.run(scenario())
+
+
+def test_heap_is_compacted() -> None:
+    async def scenario() -> None:
+        timers = TimerHeap(lambda key: None)
+        for _ in range(1000):
+            timers.schedule("key", 60)
+        assert len(timers._heap) < 100
+        timers.clear()
+
+    asyncio.run(scenario())
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Awaitable, Callable, Iterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from hikari.commands import CommandOption, CommandType, SlashCommand
+from hikari.interactions import CommandInteraction, ComponentInteraction
+from hikari.snowflakes import Snowflake
+
+from aurum.commands.impl.dispatch_table import DispatchEntry
+
+_ids: Iterator[int] = itertools.count(1)
+
+
+@pytest.fixture
+def bot() -> MagicMock:
+    """A gateway bot whose REST methods are async mocks."""
+    bot = MagicMock()
+    for name in (
+        "create_interaction_response",
+        "edit_interaction_response",
+        "delete_interaction_response",
+        "create_modal_response",
+        "execute_webhook",
+        "edit_webhook_message",
+        "delete_webhook_message",
+        "create_autocomplete_response",
+    ):
+        setattr(bot.rest, name, AsyncMock())
+    return bot
+
+
+@pytest.fixture
+def make_interaction() -> Callable[..., MagicMock]:
+    """Build command interactions with unique IDs."""
+
+    def make(*, user_id: int = 1, guild_id: int | None = 10, **attributes: object) -> MagicMock:
+        interaction = MagicMock(spec=CommandInteraction)
+        interaction.id = next(_ids)
+        interaction.token = f"token-{interaction.id}"
+        interaction.application_id = 1
+        interaction.user.id = user_id
+        interaction.guild_id = guild_id
+        interaction.channel_id = 20
+        interaction.registered_guild_id = None
+        interaction.command_name = "command"
+        for name, value in attributes.items():
+            setattr(interaction, name, value)
+        return interaction
+
+    return make
+
+
+@pytest.fixture
+def make_component_interaction() -> Callable[..., MagicMock]:
+    """Build component interactions with unique IDs."""
+
+    def make(custom_id: str, *, user_id: int = 1, guild_id: int | None = 10) -> MagicMock:
+        interaction = MagicMock(spec=ComponentInteraction)
+        interaction.id = next(_ids)
+        interaction.token = f"token-{interaction.id}"
+        interaction.application_id = 1
+        interaction.custom_id = custom_id
+        interaction.user.id = user_id
+        interaction.guild_id = guild_id
+        interaction.channel_id = 20
+        return interaction
+
+    return make
+
+
+@pytest.fixture
+def make_entry() -> Callable[..., DispatchEntry]:
+    """Build dispatch entries of a command named `command`."""
+
+    def make(callback: Callable[..., Awaitable[None]], **policies: object) -> DispatchEntry:
+        command = MagicMock()
+        command.name = "command"
+        return DispatchEntry(command=command, callback=callback, **policies)
+
+    return make
+
+
+@pytest.fixture
+def make_remote_command() -> Callable[..., SlashCommand]:
+    """Build slash commands as fetched from Discord, with unique IDs."""
+
+    def make(name: str, description: str, options: list[CommandOption] | None = None) -> SlashCommand:
+        return SlashCommand(
+            app=MagicMock(),
+            id=Snowflake(next(_ids)),
+            type=CommandType.SLASH,
+            application_id=Snowflake(1),
+            name=name,
+            default_member_permissions=0,  # type: ignore
+            is_nsfw=False,
+            guild_id=None,
+            version=Snowflake(1),
+            name_localizations={},
+            integration_types=[],
+            context_types=[],
+            description=description,
+            description_localizations={},
+            options=options,
+        )
+
+    return make